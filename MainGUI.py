@@ -11,8 +11,8 @@ from bs4 import BeautifulSoup
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import Qt, QUrl, pyqtSignal
 from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtWidgets import (QApplication, QCheckBox, QHBoxLayout, QLabel,
-                             QLineEdit, QMainWindow, QPushButton, QSizePolicy,
+from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QHBoxLayout, QLabel,
+                             QLineEdit, QMainWindow, QProgressBar, QPushButton, QSizePolicy,
                              QSpinBox, QSplitter, QTabWidget, QTextEdit, QVBoxLayout, QWidget)
 import matplotlib.dates as mdates
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT
@@ -36,8 +36,10 @@ from app_config import (
 )
 from MainLogic import MainLogic
 from LoggerFunction import Logger
+from compact_frame import expand_frame
 from data_fetcher import DataFetcher
 from data_visualizer import DataVisualizer
+from batch_fetcher import load_tickers
 # Get the current directory
 current_directory = os.path.dirname(os.path.abspath(__file__))
 
@@ -45,6 +47,9 @@ current_directory = os.path.dirname(os.path.abspath(__file__))
 class MainGUI(QMainWindow):
 
     start_data_fetching_signal = pyqtSignal(str, int)
+    cancel_data_fetching_signal = pyqtSignal()
+    # A sector of TICKERS.csv or None for every ticker, and the row count
+    start_batch_fetching_signal = pyqtSignal(object, int)
     save_data_signal = pyqtSignal()
     indicator_checkbox_changed_signal = pyqtSignal(list)
     indicator_values_updated_signal = pyqtSignal(dict)
@@ -67,6 +72,9 @@ class MainGUI(QMainWindow):
 
             # Connect signals
             self.start_button.clicked.connect(self.emit_fetch_data_signal)
+            self.cancel_button.clicked.connect(
+                self.cancel_data_fetching_signal.emit)
+            self.batch_button.clicked.connect(self.emit_fetch_batch_signal)
             self.save_button.clicked.connect(self.emit_save_data_signal)
             self.generate_report_button.clicked.connect(
                 self.emit_generate_report_signal)
@@ -172,6 +180,16 @@ class MainGUI(QMainWindow):
             self.macd_12_26_9_label = QLabel("MACD_12_26_9: -")
             self.OBV_label = QLabel("OBV: -")
             self.start_button = QPushButton("Start")
+            self.cancel_button = QPushButton("Cancel")
+            self.cancel_button.setEnabled(False)
+            self.batch_selection = QComboBox()
+            self.batch_selection.addItem("All tickers", None)
+            for sector in sorted(load_tickers()['Sector'].dropna().unique()):
+                self.batch_selection.addItem(sector, sector)
+            self.batch_button = QPushButton("Fetch Batch")
+            self.progress_bar = QProgressBar()
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(0)
             self.save_button = QPushButton("Save")
             self.generate_report_button = QPushButton("Generate Report")
 
@@ -209,6 +227,11 @@ class MainGUI(QMainWindow):
             left_layout.addWidget(self.macd_12_26_9_checkbox)
             left_layout.addWidget(self.obv_checkbox)
             left_layout.addWidget(self.start_button)
+            left_layout.addWidget(self.cancel_button)
+            left_layout.addWidget(QLabel("Batch:"))
+            left_layout.addWidget(self.batch_selection)
+            left_layout.addWidget(self.batch_button)
+            left_layout.addWidget(self.progress_bar)
             left_layout.addWidget(self.save_button)
             left_layout.addWidget(self.generate_report_button)
             self.splitter.addWidget(self.left_widget)
@@ -262,7 +285,7 @@ class MainGUI(QMainWindow):
                     "DataFrame is either None or empty. Cannot update RSI tabs.")
 
             # Get the last row of the dataframe which contains the latest data
-            latest_data = self.df.iloc[-1]
+            latest_data = expand_frame(self.df.iloc[[-1]]).iloc[0]
 
             # Helper function to get RSI recommendation based on its value
             def get_rsi_recommendation(rsi_value):
@@ -378,6 +401,41 @@ class MainGUI(QMainWindow):
             self.on_data_fetch_error(
                 "An unexpected error occurred. Check the log for details.")
 
+    def emit_fetch_batch_signal(self):
+        self.start_batch_fetching_signal.emit(
+            self.batch_selection.currentData(), self.row_spin_box.value())
+
+    @pyqtSlot(int, int)
+    def update_batch_progress(self, done, total):
+        self.statusBar().showMessage(
+            "Batch fetch done." if done == total else f"Batch: {done} of {total} tickers...")
+
+    @pyqtSlot(str, dict)
+    def on_batch_ticker_ready(self, ticker, values):
+        self.logger.log_or_print(
+            f"Batch: {ticker} has {values.get('Total_Buy_Count')} buy and "
+            f"{values.get('Total_Sell_Count')} sell signals.", level="INFO", module="MainGUI")
+
+    def on_data_fetch_error(self, message, exc_info=False):
+        self.logger.log_or_print(
+            f"Data fetch error: {message}", level="ERROR", module="MainGUI", exc_info=exc_info)
+        self.statusBar().showMessage(f"Error: {message}")
+
+    def on_data_fetch_cancelled(self):
+        self.statusBar().showMessage("Cancelled.")
+
+    @pyqtSlot(str, int)
+    def update_pipeline_progress(self, stage, percent):
+        self.progress_bar.setValue(percent)
+        self.statusBar().showMessage(
+            "Ready." if stage == 'Done' else f"{stage}...")
+
+    def set_pipeline_running(self, running):
+        # Start stays enabled so a new ticker can supersede the running one
+        self.cancel_button.setEnabled(running)
+        if running:
+            self.progress_bar.setValue(0)
+
     def trigger_plot(self):
         try:
 
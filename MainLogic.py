@@ -2,13 +2,18 @@ from PyQt5.QtCore import QObject, pyqtSignal
 from data_fetcher import DataFetcher
 from data_visualizer import DataVisualizer  # Assuming you renamed the class
 from LoggerFunction import Logger
-from app_config import (EDGE_DRIVER_PATH, EXCEL_ENGINE, DEBUG)
+from app_config import (EDGE_DRIVER_PATH, EXCEL_ENGINE, DEBUG, COMPACT_FRAMES)
 import pandas as pd
 from datetime import datetime
 import os
-from data_calculator import DataCalculator
+from qt_data_calculator import QtDataCalculator
 from file_manager import FileManager
-from PyQt5.QtCore import pyqtSlot
+from PyQt5.QtCore import pyqtSlot, QThreadPool
+from pipeline_worker import BatchWorker, ChartWorker, PipelineWorker
+from data_calculator import DataCalculator
+from batch_fetcher import select_tickers
+from indicator_graph import chart_nodes
+from compact_frame import compact_frame, expand_frame
 # Get the current directory
 current_directory = os.path.dirname(os.path.abspath(__file__))
 
@@ -18,32 +23,19 @@ class MainLogic(QObject):
     data_frame_ready_signal = pyqtSignal(pd.DataFrame)
     processed_data_signal = pyqtSignal(pd.DataFrame)
     indicator_values_updated_signal = pyqtSignal(dict)
+    # Latest indicator values of every ticker of a batch fetch, as it is done
+    batch_ticker_ready_signal = pyqtSignal(str, dict)
 
     def __init__(self, main_gui=None):
         super().__init__()
         self.df = None  # Centralized DataFrame storage
         self.current_ticker = None  # Centralized ticker storage
+        self.price_columns = []  # Columns of the fetched, uncalculated frame
         self.gui = main_gui
         self.logger = Logger(DEBUG)
-        self.data_calculator = DataCalculator()
-        # Connect the sma_calculated_signal to a slot
-        self.data_calculator.sma_calculated_signal.connect(
-            self.on_sma_calculated)
-        # Connect the rsi_calculated_signal to a slot
-        self.data_calculator.rsi_calculated_signal.connect(
-            self.on_rsi_calculated)
-        # Connect the stochastic_calculated_signal to a slot
-        self.data_calculator.stochastic_calculated_signal.connect(
-            self.on_stochastic_calculated)
-        # Connect the cmf_calculated_signal to a slot
-        self.data_calculator.cmf_calculated_signal.connect(
-            self.on_cmf_calculated)
-        # Connect the macd_calculated_signal to a slot
-        self.data_calculator.macd_calculated_signal.connect(
-            self.on_macd_calculated)
-        # Connect the obv_calculated_signal to a slot
-        self.data_calculator.obv_calculated_signal.connect(
-            self.on_obv_calculated)
+        self.data_calculator = QtDataCalculator()
+        self.data_calculator.calculations_complete_signal.connect(
+            self.on_calculations_complete)
         main_gui.indicator_checkbox_changed_signal.connect(
             self.update_chart_with_indicators)
         self.gui.indicator_values_updated_signal.connect(
@@ -54,9 +46,18 @@ class MainLogic(QObject):
         self.gui.save_data_signal.connect(self.save_data_slot)
         self.gui.generate_report_signal.connect(self.generate_report_slot)
         # Initialize and setup DataFetcher
+        # Fetch, calculate and plot run on a worker thread, one at a time
         self.data_fetcher = DataFetcher(EDGE_DRIVER_PATH)
-        self.data_fetcher.data_frame_ready_signal.connect(
-            self.process_fetched_data)
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(1)
+        self.pipeline_worker = None
+        # Chart updates for the checked indicators share that thread
+        self.chart_worker = None
+        # Batch fetches run on their own thread, so a single-ticker fetch
+        # started meanwhile does not wait for a whole-universe refresh
+        self.batch_thread_pool = QThreadPool()
+        self.batch_thread_pool.setMaxThreadCount(1)
+        self.batch_worker = None
 
         # Initialize and setup DataVisualizer
         self.data_visualizer = DataVisualizer()
@@ -65,6 +66,10 @@ class MainLogic(QObject):
         # If a MainGUI instance is provided, connect its signals
         if main_gui:
             main_gui.start_data_fetching_signal.connect(self.fetch_data_slot)
+            main_gui.cancel_data_fetching_signal.connect(
+                self.cancel_fetch_slot)
+            main_gui.start_batch_fetching_signal.connect(self.fetch_batch_slot)
+            self.batch_ticker_ready_signal.connect(main_gui.on_batch_ticker_ready)
             self.logger.log_or_print(
                 "MainLogic: MainGUI signals connected.", level="DEBUG", module="MainLogic")
 
@@ -74,101 +79,125 @@ class MainLogic(QObject):
     def fetch_data_slot(self, ticker, desired_rows):
 
         try:
-            df = self.data_fetcher.fetch_data(ticker, desired_rows)
-
-            if df is not None:
-                self.df = df  # Update the centralized DataFrame storage
-
-                self.current_ticker = ticker  # Update the centralized ticker storage
-
-                # Step 2: Handle the calculations directly after fetching
-                self.handle_data_calculations()
-
-                # Step 3: Process the data for visualization
-                self.process_fetched_data(self.df)
-
-                self.data_frame_ready_signal.emit(self.df)
-            else:
-                self.logger.log_or_print(
-                    f"MainLogic: Fetched data for {ticker} is None. Skipping emission of data_frame_ready_signal signal.", level="WARNING", module="MainLogic")
+            # A fetch already running is superseded by the new request; the
+            # single-thread pool starts the new worker once the old one stops
+            if self.pipeline_worker is not None:
+                self.pipeline_worker.cancel()
+            # A chart update still waiting would calculate the old frame
+            if self.chart_worker is not None:
+                self.chart_worker.cancel()
+
+            worker = PipelineWorker(ticker, desired_rows, self.data_fetcher,
+                                    self.data_calculator.calculator, self.data_visualizer)
+            worker.signals.progress.connect(self.gui.update_pipeline_progress)
+            worker.signals.fetched.connect(self.on_data_fetched)
+            worker.signals.calculated.connect(self.on_data_calculated)
+            worker.signals.plotted.connect(self.gui.update_chart)
+            worker.signals.failed.connect(self.gui.on_data_fetch_error)
+            worker.signals.cancelled.connect(self.gui.on_data_fetch_cancelled)
+            worker.signals.finished.connect(
+                lambda: self.on_pipeline_finished(worker))
+
+            self.pipeline_worker = worker
+            self.gui.set_pipeline_running(True)
+            self.thread_pool.start(worker)
+            self.logger.log_or_print(
+                f"MainLogic: Started fetching {ticker} in the background.", level="INFO", module="MainLogic")
         except Exception as e:
             self.logger.log_or_print(
                 f"MainLogic: Error while fetching data: {str(e)}", level="ERROR", module="MainLogic")
 
-    def process_fetched_data(self, df):
+    def fetch_batch_slot(self, selection, desired_rows):
+        # ``selection``: a watchlist of tickers, a sector of TICKERS.csv, or
+        # None for the whole universe. The batch has its own calculator, as
+        # it runs alongside the single-ticker pipeline; the fetches
+        # themselves run on the batch fetcher's threads
         try:
-            fig = self.data_visualizer.plot_candlestick_chart(
-                df)  # Use the correct method from DataVisualizer
-            # Assuming update_chart expects a figure object
-            self.gui.update_chart(fig)
+            if self.batch_worker is not None:
+                self.batch_worker.cancel()
+            tickers = select_tickers(selection)
+            worker = BatchWorker(tickers, desired_rows, self.data_fetcher, DataCalculator())
+            worker.signals.progress.connect(self.on_batch_progress)
+            worker.signals.calculated.connect(self.on_batch_calculated)
+            worker.signals.failed.connect(self.on_batch_failed)
+            worker.signals.cancelled.connect(self.gui.on_data_fetch_cancelled)
+            worker.signals.finished.connect(
+                lambda: self.on_batch_finished(worker))
+
+            self.batch_worker = worker
+            self.gui.set_pipeline_running(True)
+            self.batch_thread_pool.start(worker)
+            self.logger.log_or_print(
+                f"MainLogic: Started fetching {len(tickers)} tickers in the background.", level="INFO", module="MainLogic")
         except Exception as e:
             self.logger.log_or_print(
-                f"MainLogic: Error while process_fetched_data: {str(e)}", level="ERROR", module="MainLogic")
-
-    def handle_data_calculations(self):
-        try:
-            if self.df is None:
-
-                return
+                f"MainLogic: Error while fetching the batch: {str(e)}", level="ERROR", module="MainLogic")
 
+    def cancel_fetch_slot(self):
+        if self.pipeline_worker is not None:
+            self.pipeline_worker.cancel()
+            self.logger.log_or_print(
+                "MainLogic: Cancelling the running fetch.", level="INFO", module="MainLogic")
+        if self.batch_worker is not None:
+            self.batch_worker.cancel()
             self.logger.log_or_print(
-                "MainLogic: Starting data calculations using the central DataFrame...", level="INFO", module="MainLogic")
+                "MainLogic: Cancelling the running batch fetch.", level="INFO", module="MainLogic")
 
-            # Since calculations are done asynchronously and the central DataFrame is updated via signals,
-            # we don't need to return and assign data in this method. Just initiate the calculations.
+    def on_batch_progress(self, done, total):
+        self.gui.update_batch_progress(done, total)
 
-            # Start SMA calculation
-            # This will emit the sma_calculated_signal
-            self.data_calculator.calculate_sma(self.df)
-            self.logger.log_or_print(
-                "MainLogic: SMA calculation initiated.", level="INFO", module="MainLogic")
+    def on_batch_calculated(self, ticker, latest_values):
+        # Only the latest values travel on; the frames are in the caches
+        self.batch_ticker_ready_signal.emit(ticker, latest_values)
 
-            # Start RSI calculation
-            # This will emit the rsi_calculated_signal
-            self.data_calculator.calculate_rsi(self.df)
-            self.logger.log_or_print(
-                "MainLogic: RSI calculation initiated.", level="INFO", module="MainLogic")
+    def on_batch_failed(self, ticker, message):
+        self.logger.log_or_print(
+            f"MainLogic: {ticker} skipped in the batch: {message}", level="WARNING", module="MainLogic")
 
-            # Start Stochastic Oscillator calculation
-            self.data_calculator.calculate_stochastic_oscillator(
-                self.df)  # This will emit the stochastic_calculated_signal
-            self.logger.log_or_print(
-                "MainLogic: Stochastic Oscillator calculation initiated.", level="INFO", module="MainLogic")
-            # Start CMF calculation
-            self.data_calculator.calculate_cmf(self.df)
-            self.logger.log_or_print(
-                "MainLogic: CMF calculation initiated.", level="INFO", module="MainLogic")
+    def on_batch_finished(self, worker):
+        if worker is self.batch_worker:
+            self.batch_worker = None
+            if self.pipeline_worker is None:
+                self.gui.set_pipeline_running(False)
 
-            # Start MACD calculation
-            self.data_calculator.calculate_macd(self.df)
-            self.logger.log_or_print(
-                "MainLogic: MACD calculation initiated.", level="INFO", module="MainLogic")
-            # Start OBV calculation
-            self.data_calculator.calculate_obv(self.df)
-            self.logger.log_or_print(
-                "MainLogic: OBV calculation initiated.", level="INFO", module="MainLogic")
-            latest_values = {
-                'RSI_9': self.df['RSI_9'].iloc[-1] if 'RSI_9' in self.df.columns else None,
-                'RSI_14': self.df['RSI_14'].iloc[-1] if 'RSI_14' in self.df.columns else None,
-                'RSI_25': self.df['RSI_25'].iloc[-1] if 'RSI_25' in self.df.columns else None,
-                'StochK': self.df['STOCHk_9_6_3'].iloc[-1] if 'STOCHk_9_6_3' in self.df.columns else None,
-                'StochD': self.df['STOCHd_9_6_3'].iloc[-1] if 'STOCHd_9_6_3' in self.df.columns else None,
-                'CMF_20': self.df['CMF_20'].iloc[-1] if 'CMF_20' in self.df.columns else None,
-                'MACD_12_26_9': self.df['MACD_12_26_9'].iloc[-1] if 'MACD_12_26_9' in self.df.columns else None,
-                'MACDs_12_26_9': self.df['MACDs_12_26_9'].iloc[-1] if 'MACDs_12_26_9' in self.df.columns else None,
-                'OBV': self.df['OBV'].iloc[-1] if 'OBV' in self.df.columns else None,
-            }
+    def on_data_fetched(self, ticker, df):
+        self.df = df  # Update the centralized DataFrame storage
+        self.current_ticker = ticker  # Update the centralized ticker storage
+        self.price_columns = list(df.columns)
 
-            self.logger.log_or_print(
-                "Emitting indicator values update signal.", level="DEBUG", module="MainLogic")
-            self.indicator_values_updated_signal.emit(latest_values)
+    def on_data_calculated(self, blocks, latest_values):
+        self.on_calculations_complete(blocks)
+        self.logger.log_or_print(
+            "Emitting indicator values update signal.", level="DEBUG", module="MainLogic")
+        self.indicator_values_updated_signal.emit(latest_values)
 
-            # At this point, once all calculations have been initiated, the central DataFrame `self.df` will be updated via signals
-            # So, you don't need to explicitly assign `self.df = temp_df`. It's done in the signal handlers (slots).
+    def on_calculations_complete(self, blocks):
+        # Every calculation's new columns are joined onto the central
+        # DataFrame in one step, then listeners are notified once
+        if self.df is None:
+            self.logger.log_or_print(
+                "MainLogic: Received calculations without a DataFrame.", level="ERROR", module="MainLogic")
+            return
+        df = self.data_calculator.merge_blocks(expand_frame(self.df), blocks)
+        # The fetched columns stay as they are for later calculations
+        self.df = compact_frame(df, keep=self.price_columns) if COMPACT_FRAMES else df
+        self.data_frame_ready_signal.emit(self.df)
+
+    def on_pipeline_finished(self, worker):
+        if worker is self.pipeline_worker:
+            self.pipeline_worker = None
+            if self.batch_worker is None:
+                self.gui.set_pipeline_running(False)
 
+    def process_fetched_data(self, df):
+        try:
+            fig = self.data_visualizer.plot_candlestick_chart(
+                df)  # Use the correct method from DataVisualizer
+            # Assuming update_chart expects a figure object
+            self.gui.update_chart(fig)
         except Exception as e:
             self.logger.log_or_print(
-                f"MainLogic: Error occurred during data calculations: {str(e)}", level="ERROR", module="MainLogic", exc_info=True)
+                f"MainLogic: Error while process_fetched_data: {str(e)}", level="ERROR", module="MainLogic")
 
     def save_data_slot(self):
 
@@ -204,73 +233,30 @@ class MainLogic(QObject):
             self.logger.log_or_print(
                 f"MainLogic: Error in get_latest_dataframe: {str(e)}", level="ERROR", module="MainLogic")
 
-    def on_sma_calculated(self, df):
-        """
-        Slot to handle the emitted DataFrame from the calculate_sma function.
-        """
-
-        if df is not None:
-            self.df = df  # Update the centralized DataFrame storage
-
-        else:
-            self.logger.log_or_print(
-                "MainLogic: Received None DataFrame from SMA calculation.", level="ERROR", module="MainLogic")
-
-    def on_rsi_calculated(self, df):
-
-        if df is not None:
-            self.df = df
-
-        else:
-            self.logger.log_or_print(
-                "MainLogic: Received None DataFrame from RSI calculation.", level="ERROR", module="MainLogic")
-
-    def on_stochastic_calculated(self, df):
-
-        if df is not None:
-            self.df = df
-
-        else:
-            self.logger.log_or_print(
-                "MainLogic: Received None DataFrame from Stochastic Oscillator calculation.", level="ERROR", module="MainLogic")
-
     def update_chart_with_indicators(self, active_indicators):
         if self.df is not None:
-            fig = self.data_visualizer.plot_candlestick_chart(
-                self.df, indicators=active_indicators)
-
-            self.gui.update_chart(fig)
+            # Calculate just the indicators the checked boxes need that are
+            # not on the frame yet (e.g. after a cancelled run), off the GUI
+            # thread; the blocks are merged in through
+            # calculations_complete_signal
+            if self.chart_worker is not None:
+                self.chart_worker.cancel()
+            nodes = chart_nodes(active_indicators, self.df)
+            worker = ChartWorker(self.df, self.df[self.price_columns], nodes, active_indicators,
+                                 self.data_calculator, self.data_visualizer)
+            worker.signals.plotted.connect(self.gui.update_chart)
+            worker.signals.failed.connect(self.gui.on_data_fetch_error)
+            worker.signals.finished.connect(
+                lambda: self.on_chart_finished(worker))
+            self.chart_worker = worker
+            self.thread_pool.start(worker)
         else:
             self.logger.log_or_print(
                 "MainLogic: DataFrame is None, cannot update chart.", level="WARNING", module="MainLogic")
 
-    def on_cmf_calculated(self, df):
-        self.logger.log_or_print(
-            "MainLogic: Receiving CMF calculated DataFrame...", level="DEBUG", module="MainLogic")
-        if df is not None:
-            self.df = df
-
-        else:
-            self.logger.log_or_print(
-                "MainLogic: Received None DataFrame from CMF calculation.", level="ERROR", module="MainLogic")
-
-    def on_macd_calculated(self, df):
-
-        if df is not None:
-            self.df = df
-
-        else:
-            self.logger.log_or_print(
-                "MainLogic: Received None DataFrame from MACD calculation.", level="ERROR", module="MainLogic")
-
-    def on_obv_calculated(self, df):
-
-        if df is not None:
-            self.df = df
-
-        else:
-            self.logger.log_or_print(
-                "MainLogic: Received None DataFrame from OBV calculation.", level="ERROR", module="MainLogic")
+    def on_chart_finished(self, worker):
+        if worker is self.chart_worker:
+            self.chart_worker = None
 
     def update_gui_labels_with_indicator_values(self, latest_values):
         self.gui.update_indicator_labels(latest_values)
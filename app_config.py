@@ -1,5 +1,6 @@
 # config.py
 import os
+import sys
 import logging  # Importing the logging module
 
 # Logging Configuration
@@ -28,13 +29,92 @@ DEFAULT_DATE = "06/10/2010"
 # Table Configuration
 TABLE_SELECTOR = "#dispTable"
 
+# Fetch Configuration
+# 'webdriver' drives Edge through the portal; 'http' requests the same pages
+# directly (see http_fetcher) and needs no browser, so it is the default on
+# Linux, where the Edge driver is not available
+FETCH_BACKEND = 'http' if sys.platform.startswith('linux') else 'webdriver'
+# The filter form's from date, early enough for the whole history
+HISTORY_FROM_DATE = "1/1/2010"
+HTTP_TIMEOUT = 30
+HTTP_POOL_SIZE = 8
+HTTP_RETRIES = 3
+
+# Batch Fetch Configuration
+# Sector and name of every listed ticker
+TICKERS_FILE = os.path.join(current_directory, 'TICKERS.csv')
+# Tickers fetched at the same time by a batch fetch (see batch_fetcher); the
+# WebDriver backend also waits for a free driver of its pool
+FETCH_WORKERS = 4
+# Politeness towards the portal: at most FETCH_HOST_CONCURRENCY requests to
+# one host at a time, started at least FETCH_HOST_MIN_INTERVAL seconds apart
+FETCH_HOST_CONCURRENCY = 4
+FETCH_HOST_MIN_INTERVAL = 0.1
+
+# Async Fetch Configuration
+# Batch fetches of the HTTP backend run on one asyncio event loop (see
+# async_fetcher): with aiohttp when it is installed, else with the requests
+# session on a thread per request to the host in flight. They are bounded by
+# the requests in flight overall, the tickers fetched at once and the pages
+# of one ticker requested at once; per host they keep to
+# FETCH_HOST_CONCURRENCY and FETCH_HOST_MIN_INTERVAL like the other fetches
+FETCH_ASYNC = True
+ASYNC_MAX_REQUESTS = 100
+ASYNC_MAX_TICKERS = 8
+ASYNC_TICKER_PAGES = 4
+# Threads parsing the fetched pages while the loop waits for the next ones
+ASYNC_PARSE_WORKERS = 2
+
 # WebDriver Wait Configuration
 WEBDRIVER_WAIT_TIME = 10
+# Running Edge drivers shared by the WebDriver fetches, each replaced after
+# WEBDRIVER_MAX_USES fetches
+WEBDRIVER_POOL_SIZE = 2
+WEBDRIVER_MAX_USES = 25
 
 # Data Fetching Configuration
 DEFAULT_SMA_PERIOD = 10
 DEFAULT_ROW_COUNT = 300
 
+# Indicator Configuration
+# 'numpy' for the in-project kernels, 'numba' for their compiled versions
+# (falls back to 'numpy' without numba), 'pandas_ta' to calculate with pandas_ta
+INDICATOR_BACKEND = 'numba'
+# Calculated frames kept on disk per ticker, see indicator_cache
+INDICATOR_CACHE_DIR = 'indicator_cache'
+INDICATOR_CACHE_MAX_BYTES = 200 * 1024 * 1024
+INDICATOR_CACHE_MAX_AGE_DAYS = 30
+# Keep calculated frames in the compact layout of compact_frame (float32
+# values, int8 counts, packed flags); output code expands them transparently
+COMPACT_FRAMES = False
+
+# Divergence Configuration
+# Bars on each side of a swing high/low, and the most bars between the two
+# swings a divergence compares
+SWING_WINDOW = 5
+DIVERGENCE_LOOKBACK = 60
+
+# Backtest Configuration
+# A ticker is bought when Total_Buy_Count - Total_Sell_Count reaches the
+# entry threshold and sold when it falls to the exit threshold or after the
+# holding period (in bars, None for no limit). Trades execute at the close
+# BACKTEST_EXECUTION_LAG bars after the signal and pay BACKTEST_COST, a
+# fraction of the traded value, per side (broker commission and fees)
+BACKTEST_ENTRY_THRESHOLD = 5
+BACKTEST_EXIT_THRESHOLD = 0
+BACKTEST_HOLDING_PERIOD = 20
+BACKTEST_EXECUTION_LAG = 1
+BACKTEST_COST = 0.0025
+
+# Parameter Sweep Configuration
+# The sweep scores each indicator's own net signal (its buy minus sell count),
+# which spans a few points only, so it uses its own thresholds; the other
+# rules are the backtest ones. Forward returns are measured over
+# SWEEP_FORWARD_HORIZON bars after every entry signal
+SWEEP_ENTRY_THRESHOLD = 1
+SWEEP_EXIT_THRESHOLD = -1
+SWEEP_FORWARD_HORIZON = 10
+
 # Excel Configuration
 EXCEL_ENGINE = 'openpyxl'
 
@@ -0,0 +1,368 @@
+# asyncio fetch pipeline for the HTTP backend.
+#
+# Every ticker's trading history is read with the requests of HttpTableSource
+# (profile page, filter form, table pages), but all tickers run as tasks of
+# one event loop. After the first table page, the pages a ticker still needs
+# are requested together: their addresses follow from the numbered page
+# links, which all carry the page number in one query parameter. Tables
+# without such links are followed page by page through their "Next" link.
+# Pages are parsed on a small thread pool, so the loop keeps requesting while
+# the pages already received are parsed. Semaphores bound the requests in
+# flight overall, the tickers fetched at once and the pages of one ticker
+# requested at once. Requests to one host keep to the politeness limits of
+# the other fetches (FETCH_HOST_CONCURRENCY, FETCH_HOST_MIN_INTERVAL) through
+# AsyncHostLimiter, the event loop's counterpart of HostLimiter.
+#
+# aiohttp keeps hundreds of requests in flight on the loop's thread. It is
+# optional; without it the requests are made with the pooled requests session
+# on a thread pool, one thread per request to the host in flight.
+import asyncio
+import contextlib
+import math
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from app_config import (ASYNC_MAX_REQUESTS, ASYNC_MAX_TICKERS, ASYNC_PARSE_WORKERS,
+                        ASYNC_TICKER_PAGES, DEFAULT_ROW_COUNT, FETCH_HOST_CONCURRENCY,
+                        FETCH_HOST_MIN_INTERVAL, HISTORY_FROM_DATE, HTTP_RETRIES, HTTP_TIMEOUT,
+                        TABLE_SELECTOR)
+from data_fetcher import history_table_rows
+from http_fetcher import PAGE_LINKS_SELECTOR, USER_AGENT, create_session, filter_request, next_page_url
+from LoggerFunction import Logger
+
+RETRY_STATUSES = (500, 502, 503, 504)
+# Seconds between checks of should_cancel
+CANCEL_POLL_INTERVAL = 0.2
+
+
+def page_template(page, url):
+    """
+    ``(parameter, address, last page)`` for the numbered page links of the
+    table ``page``, loaded from ``url``: the query parameter holding their
+    page number, the address of one of them and the highest page linked.
+    None when the links do not number their pages that way.
+    """
+    links = page.select_one(PAGE_LINKS_SELECTOR)
+    if links is None:
+        return None
+    addresses = []
+    numbered = []
+    for anchor in links.find_all('a'):
+        href = anchor.get('href', '')
+        if not href or href.startswith('javascript:'):
+            continue
+        address = urljoin(url, href)
+        query = dict(parse_qsl(urlsplit(address).query, keep_blank_values=True))
+        addresses.append(query)
+        text = anchor.get_text(strip=True)
+        if text.isdigit():
+            numbered.append((text, address, query))
+    if not numbered:
+        return None
+    parameters = [key for key in numbered[0][2]
+                  if all(query.get(key) == text for text, _, query in numbered)]
+    if len(parameters) != 1:
+        return None
+    parameter = parameters[0]
+    # The "Last" link may point past the numbered ones
+    last = max(int(query[parameter]) for query in addresses
+               if query.get(parameter, '').isdigit())
+    return parameter, numbered[0][1], last
+
+
+def page_address(template, number):
+    parameter, address, _ = template
+    parts = urlsplit(address)
+    query = [(key, str(number) if key == parameter else value)
+             for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+def _parse_profile(html, url, from_date):
+    return filter_request(BeautifulSoup(html, 'html.parser'), url, from_date)
+
+
+def _parse_table_page(html, url):
+    # The rows, next page address and page template of a table page
+    page = BeautifulSoup(html, 'html.parser')
+    table = page.select_one(TABLE_SELECTOR)
+    if table is None:
+        raise ValueError(f"No {TABLE_SELECTOR} table at {url}")
+    return history_table_rows(table), next_page_url(page, url), page_template(page, url)
+
+
+class AsyncHostLimiter:
+    """
+    HostLimiter for the tasks of one event loop: at most ``max_concurrent``
+    requests to one host at a time, started at least ``min_interval``
+    seconds apart. Make it on the loop it is used from.
+    """
+
+    def __init__(self, max_concurrent=FETCH_HOST_CONCURRENCY, min_interval=FETCH_HOST_MIN_INTERVAL):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        # Per host: the semaphore of its requests and the earliest time the
+        # next one may start
+        self.hosts = {}
+
+    @contextlib.asynccontextmanager
+    async def request(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.hosts:
+            self.hosts[host] = [asyncio.Semaphore(self.max_concurrent), 0.0]
+        state = self.hosts[host]
+        async with state[0]:
+            # The tasks share one thread, so no lock is needed between
+            # reading the start time and reserving the next one
+            now = time.monotonic()
+            start = max(now, state[1])
+            state[1] = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+class AsyncPortalClient:
+    """
+    GET and POST requests made from one event loop, at most ``max_requests``
+    in flight. Requests to one host keep to the limits of HostLimiter:
+    ``host_concurrency`` at a time, started ``min_interval`` seconds apart.
+    Use with ``async with``.
+    """
+
+    def __init__(self, max_requests=ASYNC_MAX_REQUESTS, host_concurrency=FETCH_HOST_CONCURRENCY,
+                 min_interval=FETCH_HOST_MIN_INTERVAL, timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES):
+        self.max_requests = max_requests
+        self.host_concurrency = host_concurrency
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.retries = retries
+        self.session = None
+        self.executor = None
+        self.requests = None
+        self.limiter = None
+
+    async def __aenter__(self):
+        # Semaphores belong to the running loop, so they are made here
+        self.requests = asyncio.Semaphore(self.max_requests)
+        self.limiter = AsyncHostLimiter(self.host_concurrency, self.min_interval)
+        if aiohttp is not None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_requests,
+                                               limit_per_host=self.host_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': USER_AGENT})
+        else:
+            self.session = create_session(self.host_concurrency, self.retries)
+            self.executor = ThreadPoolExecutor(max_workers=self.host_concurrency,
+                                               thread_name_prefix='AsyncPortalClient')
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if aiohttp is not None:
+            await self.session.close()
+        else:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.session.close()
+
+    def _blocking_request(self, url, method, fields):
+        if method == 'POST':
+            response = self.session.post(url, data=fields, timeout=self.timeout)
+        else:
+            response = self.session.get(url, params=fields, timeout=self.timeout)
+        response.raise_for_status()
+        return response.url, response.text
+
+    async def _aiohttp_request(self, url, method, fields):
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.session.request(method, url, data=fields if method == 'POST' else None,
+                                                params=fields if method != 'POST' else None) as response:
+                    if response.status not in RETRY_STATUSES or attempt == self.retries:
+                        response.raise_for_status()
+                        return str(response.url), await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+    async def request(self, url, method='GET', fields=None):
+        """
+        ``(final url, page text)`` of the request.
+        """
+        async with self.requests, self.limiter.request(url):
+            if aiohttp is not None:
+                return await self._aiohttp_request(url, method, fields)
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._blocking_request, url, method, fields)
+
+
+class AsyncFetcher:
+    """
+    Fetch tickers over HTTP on one event loop. ``data_fetcher``, a
+    DataFetcher, supplies the portal address and the cached histories, and
+    finishes and saves every fetched frame as its own fetches do.
+    """
+
+    def __init__(self, data_fetcher, max_tickers=ASYNC_MAX_TICKERS, ticker_pages=ASYNC_TICKER_PAGES,
+                 parse_workers=ASYNC_PARSE_WORKERS, client_factory=AsyncPortalClient):
+        self.logger = Logger()
+        self.data_fetcher = data_fetcher
+        self.max_tickers = max_tickers
+        self.ticker_pages = ticker_pages
+        self.parse_workers = parse_workers
+        self.client_factory = client_factory
+        self.parse_executor = None
+
+    async def _in_executor(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.parse_executor, function, *args)
+
+    async def _table_page(self, client, pages, url):
+        async with pages:
+            url, html = await client.request(url)
+        return await self._in_executor(_parse_table_page, html, url)
+
+    def _frames(self, page_rows, existing):
+        # The rows of the fetched pages, and them merged into the saved history
+        df = pd.DataFrame([row for rows in page_rows for row in rows],
+                          columns=self.data_fetcher.initialize_dataframe().columns)
+        df['Date'] = pd.to_datetime(df['Date'])
+        df = df.drop_duplicates(subset='Date', keep='first')
+        return df, self.data_fetcher.merge_with_cache(df, existing)
+
+    async def fetch_ticker(self, client, ticker, desired_rows=DEFAULT_ROW_COUNT):
+        """
+        The latest ``desired_rows`` trading days of ``ticker``, like
+        DataFetcher.fetch_data returns them, reading the same pages.
+        """
+        existing = await self._in_executor(self.data_fetcher.load_cache, ticker)
+        complete = await self._in_executor(self.data_fetcher.history_complete, ticker, existing)
+        url, html = await client.request(
+            f'{self.data_fetcher.base_url}?currLanguage=en&companyCode={ticker}&activeTab=0')
+        request = await self._in_executor(_parse_profile, html, url, HISTORY_FROM_DATE)
+        if request is not None:
+            url, html = await client.request(*request)
+        rows, next_url, template = await self._in_executor(_parse_table_page, html, url)
+        page_rows = [rows]
+        df, history = self._frames(page_rows, existing)
+
+        pages = asyncio.Semaphore(self.ticker_pages)
+        next_number = 2
+        while rows and not self.data_fetcher.fetch_complete(df, existing, history, desired_rows, complete):
+            if template is not None:
+                # Request every page still needed for desired_rows at once;
+                # one at a time while looking for the saved history's end
+                wanted = max(1, math.ceil((desired_rows - len(history)) / len(page_rows[0])))
+                numbers = range(next_number, min(template[2], next_number + wanted - 1) + 1)
+                if not numbers:
+                    break
+                results = await asyncio.gather(*(self._table_page(client, pages, page_address(template, number))
+                                                 for number in numbers))
+                next_number = numbers[-1] + 1
+                page_rows += [result[0] for result in results]
+                # The last page's links may reach further than the first's
+                if results[-1][2] is not None:
+                    template = results[-1][2]
+            else:
+                if next_url is None:
+                    break
+                rows, next_url, _ = await self._table_page(client, pages, next_url)
+                page_rows.append(rows)
+            df, history = self._frames(page_rows, existing)
+        # Whether the pages read reach the last page of the table
+        reached_end = next_number > template[2] if template is not None else next_url is None
+        first_session = df['Date'].min() if reached_end and len(df) > 0 else None
+        return await self._in_executor(self.data_fetcher.finish_frame, ticker, history, desired_rows,
+                                       first_session)
+
+    async def fetch_stream(self, tickers, desired_rows=DEFAULT_ROW_COUNT):
+        """
+        Asynchronously yield ``(ticker, df)`` for every ticker as its fetch
+        finishes; df is None when the fetch failed.
+        """
+        tickers_running = asyncio.Semaphore(self.max_tickers)
+
+        async def fetch_one(client, ticker):
+            async with tickers_running:
+                try:
+                    return ticker, await self.fetch_ticker(client, ticker, desired_rows)
+                except Exception as e:
+                    self.logger.log_or_print(
+                        f"AsyncFetcher: fetching {ticker} failed: {str(e)}", level="ERROR",
+                        module="AsyncFetcher", exc_info=True)
+                    return ticker, None
+
+        self.parse_executor = ThreadPoolExecutor(max_workers=self.parse_workers,
+                                                 thread_name_prefix='AsyncFetcherParse')
+        try:
+            async with self.client_factory() as client:
+                tasks = [asyncio.create_task(fetch_one(client, ticker)) for ticker in tickers]
+                try:
+                    for finished in asyncio.as_completed(tasks):
+                        yield await finished
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.parse_executor.shutdown(wait=True, cancel_futures=True)
+
+    def fetch(self, tickers, desired_rows=DEFAULT_ROW_COUNT, should_cancel=None):
+        """
+        Yield ``(ticker, df)`` like fetch_stream, from a generator usable
+        outside the event loop, which runs on its own thread. Once
+        ``should_cancel`` returns True the fetches still running are dropped.
+        """
+        results = queue.Queue()
+        stop = threading.Event()
+
+        def cancelled():
+            if not stop.is_set() and should_cancel is not None and should_cancel():
+                stop.set()
+            return stop.is_set()
+
+        async def consume():
+            async for result in self.fetch_stream(tickers, desired_rows):
+                results.put(result)
+
+        async def run():
+            task = asyncio.create_task(consume())
+            while not task.done():
+                if cancelled():
+                    task.cancel()
+                    break
+                await asyncio.wait({task}, timeout=CANCEL_POLL_INTERVAL)
+            await asyncio.gather(task, return_exceptions=True)
+
+        def run_loop():
+            try:
+                asyncio.run(run())
+            except Exception as e:
+                self.logger.log_or_print(
+                    f"AsyncFetcher: the fetch loop failed: {str(e)}", level="ERROR",
+                    module="AsyncFetcher", exc_info=True)
+            finally:
+                results.put(None)
+
+        thread = threading.Thread(target=run_loop, name='AsyncFetcher', daemon=True)
+        thread.start()
+        try:
+            while True:
+                result = results.get()
+                if result is None or cancelled():
+                    return
+                yield result
+        finally:
+            stop.set()
+            thread.join()
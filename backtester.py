@@ -0,0 +1,190 @@
+# Vectorized backtest of the Buy/Sell signal totals over many tickers.
+#
+# The net score of a bar is Total_Buy_Count - Total_Sell_Count. A ticker is
+# held from a bar whose score reaches the entry threshold until its score
+# falls to the exit threshold or the holding period runs out; a new entry
+# signal while held restarts the holding period. Trades execute at the close
+# ``execution_lag`` bars after the signal bar and pay the trading cost on
+# each side. Only long positions are taken.
+#
+# The rules are evaluated on wide (bars x tickers) arrays built with
+# make_panel, so every step is one array operation over all dates and
+# tickers. As in the screener, the tickers are split into chunks calculated
+# in a process pool.
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from app_config import (BACKTEST_COST, BACKTEST_ENTRY_THRESHOLD, BACKTEST_EXECUTION_LAG,
+                        BACKTEST_EXIT_THRESHOLD, BACKTEST_HOLDING_PERIOD)
+from LoggerFunction import Logger
+from panel_calculator import PanelCalculator, make_panel
+from screener import RAW_FILE_PREFIX, cached_tickers, load_raw_frame
+
+BACKTEST_FIELDS = ['Close', 'Total_Buy_Count', 'Total_Sell_Count']
+
+
+def holding_mask(score, entry_threshold=BACKTEST_ENTRY_THRESHOLD, exit_threshold=BACKTEST_EXIT_THRESHOLD,
+                 holding_period=BACKTEST_HOLDING_PERIOD):
+    """
+    Boolean (bars x tickers) array of the bars at whose close the rules want
+    to be holding each ticker. ``holding_period`` of None holds until the
+    exit threshold.
+    """
+    score = np.asarray(score, dtype=float)
+    bars = np.arange(len(score))[:, None]
+    # Position of the latest entry and exit signal up to each bar
+    last_entry = np.maximum.accumulate(np.where(score >= entry_threshold, bars, -1), axis=0)
+    last_exit = np.maximum.accumulate(np.where(score <= exit_threshold, bars, -1), axis=0)
+    held = (last_entry >= 0) & (last_entry > last_exit)
+    if holding_period is not None:
+        held &= bars - last_entry < holding_period
+    return held
+
+
+def simulate(close, score, dates=None, entry_threshold=BACKTEST_ENTRY_THRESHOLD,
+             exit_threshold=BACKTEST_EXIT_THRESHOLD, holding_period=BACKTEST_HOLDING_PERIOD,
+             execution_lag=BACKTEST_EXECUTION_LAG, cost=BACKTEST_COST):
+    """
+    Backtest the wide ``close`` and ``score`` frames (bars x tickers, NaN
+    where a ticker has no bar). ``dates`` is an optional wide frame of the
+    bar dates for the trade list. Returns ``(summary, trades)``: one row per
+    ticker, and one row per trade.
+    """
+    tickers = list(close.columns)
+    prices = close.to_numpy(dtype=float)
+    has_bar = ~np.isnan(prices)
+    returns = np.nan_to_num(prices[1:] / prices[:-1] - 1)
+    returns = np.vstack([np.zeros((1, len(tickers))), returns])
+
+    # The rules decide at a bar's close; the position earns from the close
+    # of the execution bar on
+    held = holding_mask(score, entry_threshold, exit_threshold, holding_period)
+    exposure = np.zeros_like(held)
+    shift = execution_lag + 1
+    if shift < len(held):
+        exposure[shift:] = held[:-shift]
+    exposure &= has_bar
+    previous = np.vstack([np.zeros((1, len(tickers)), dtype=bool), exposure[:-1]])
+    following = np.vstack([exposure[1:], np.zeros((1, len(tickers)), dtype=bool)])
+    entries = exposure & ~previous
+    exits = exposure & ~following
+    # The last bar's position is still open, so it pays no exit cost
+    exits[-1] = False
+
+    strategy = np.where(exposure, returns, 0.0) - cost * (entries.astype(float) + exits)
+    equity = np.cumprod(1 + strategy, axis=0)
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1
+
+    # One group per trade: the ticker and the running count of its entries
+    rows, columns = np.nonzero(exposure)
+    trade_number = np.cumsum(entries, axis=0)[rows, columns]
+    grouped = pd.DataFrame({'ticker': columns, 'trade': trade_number, 'row': rows,
+                            'log_return': np.log1p(strategy[rows, columns])}).groupby(['ticker', 'trade'])
+    trades = grouped.agg(entry=('row', 'first'), exit=('row', 'last'), bars=('row', 'size'),
+                         log_return=('log_return', 'sum')).reset_index()
+    trades['Return'] = np.expm1(trades['log_return'])
+    trades['Closed'] = exits[trades['exit'], trades['ticker']]
+    if dates is not None:
+        date_values = dates.to_numpy()
+        trades['Entry_Date'] = date_values[trades['entry'], trades['ticker']]
+        trades['Exit_Date'] = date_values[trades['exit'], trades['ticker']]
+    trades['Ticker'] = np.asarray(tickers, dtype=object)[trades['ticker']]
+    trades = trades.rename(columns={'bars': 'Bars'})
+    trades = trades[['Ticker'] + [column for column in ['Entry_Date', 'Exit_Date'] if column in trades]
+                    + ['Bars', 'Return', 'Closed']]
+
+    # Per-ticker statistics over the ticker's own bars
+    first = np.argmax(has_bar, axis=0)
+    last = len(prices) - 1 - np.argmax(has_bar[::-1], axis=0)
+    columns = np.arange(len(tickers))
+    closed = trades[trades['Closed']]
+    summary = pd.DataFrame({
+        'Ticker': tickers,
+        'Bars': has_bar.sum(axis=0),
+        'Total_Return': equity[-1] - 1,
+        'Buy_Hold_Return': prices[last, columns] / prices[first, columns] - 1,
+        'Max_Drawdown': drawdown.min(axis=0),
+        'Exposure': exposure.sum(axis=0) / np.maximum(has_bar.sum(axis=0), 1),
+        'Trades': trades.groupby('Ticker').size().reindex(tickers, fill_value=0).to_numpy(),
+        'Hit_Rate': (closed['Return'] > 0).groupby(closed['Ticker']).mean().reindex(tickers).to_numpy(),
+        'Average_Trade_Return': closed.groupby('Ticker')['Return'].mean().reindex(tickers).to_numpy()})
+    return summary, trades
+
+
+def backtest_frames(frames, **rules):
+    """
+    Backtest ``{ticker: calculated DataFrame}`` (frames with the
+    Total_Buy_Count and Total_Sell_Count columns). ``rules`` are the keyword
+    arguments of simulate. Returns ``(summary, trades)``.
+    """
+    frames = {ticker: df for ticker, df in frames.items() if df is not None and len(df) > 0}
+    if not frames:
+        return pd.DataFrame(), pd.DataFrame()
+    panel = make_panel(frames, BACKTEST_FIELDS)
+    score = panel['Total_Buy_Count'] - panel['Total_Sell_Count']
+    # Dates aligned like make_panel aligns the values
+    length = len(panel['Close'])
+    dates = np.full((length, len(frames)), np.datetime64('NaT'), dtype='datetime64[ns]')
+    for i, df in enumerate(frames.values()):
+        dates[length - len(df):, i] = df['Date'].to_numpy(dtype='datetime64[ns]')
+    return simulate(panel['Close'], score, pd.DataFrame(dates, columns=list(frames)), **rules)
+
+
+def _backtest_chunk(tickers, directory, rules):
+    # Runs in a worker process; calculates and backtests one chunk of tickers
+    logger = Logger()
+    frames = {}
+    for ticker in tickers:
+        try:
+            frames[ticker] = load_raw_frame(ticker, directory)
+        except Exception as e:
+            logger.log_or_print(
+                f"Backtester: could not load {ticker}: {str(e)}", level="WARNING", module="Backtester")
+    return backtest_frames(PanelCalculator().calculate(frames), **rules)
+
+
+def backtest_universe(tickers=None, directory=None, workers=None, **rules):
+    """
+    Calculate and backtest every cached ticker (or ``tickers``) across
+    ``workers`` processes. ``rules`` are the keyword arguments of simulate.
+    Returns ``(summary, trades)``.
+    """
+    logger = Logger()
+    directory = directory or os.getcwd()
+    tickers = list(tickers) if tickers is not None else cached_tickers(directory)
+    if not tickers:
+        logger.log_or_print(
+            f"Backtester: no {RAW_FILE_PREFIX}*.csv files in {directory}.", level="WARNING", module="Backtester")
+        return pd.DataFrame(), pd.DataFrame()
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_backtest_chunk(tickers, directory, rules)]
+    else:
+        chunk_size = max(1, math.ceil(len(tickers) / (workers * 4)))
+        chunks = [tickers[i:i + chunk_size]
+                  for i in range(0, len(tickers), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_backtest_chunk, chunks, [directory] * len(chunks),
+                                        [rules] * len(chunks)))
+
+    summary = pd.concat([result[0] for result in results], ignore_index=True)
+    trades = pd.concat([result[1] for result in results], ignore_index=True)
+    if not trades.empty:
+        closed = trades[trades['Closed']]
+        logger.log_or_print(
+            f"Backtester: {len(trades)} trades over {len(summary)} tickers, "
+            f"hit rate {(closed['Return'] > 0).mean():.1%}, "
+            f"average trade return {closed['Return'].mean():.2%}.", level="INFO", module="Backtester")
+    return summary, trades
+
+
+if __name__ == "__main__":
+    summary, trades = backtest_universe(directory=sys.argv[1] if len(sys.argv) > 1 else None)
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(summary.to_string(index=False))
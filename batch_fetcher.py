@@ -0,0 +1,130 @@
+# Concurrent fetches of many tickers.
+#
+# A batch is a watchlist, a sector of TICKERS.csv or the whole universe. Its
+# tickers are fetched by a pool of worker threads sharing one DataFetcher, so
+# they share its HTTP session or WebDriver pool and its host limiter, which
+# bounds the requests to the portal however many workers run. Fetched frames
+# are handed on in the order the fetches finish, so the calculation of one
+# ticker overlaps the fetches of the next ones. With the HTTP backend the
+# fetches run on one event loop instead (see async_fetcher).
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from app_config import DEFAULT_ROW_COUNT, EDGE_DRIVER_PATH, FETCH_ASYNC, FETCH_WORKERS, TICKERS_FILE
+from async_fetcher import AsyncFetcher
+from LoggerFunction import Logger
+
+
+def load_tickers(path=TICKERS_FILE):
+    """
+    The listed tickers with their Sector and Name.
+    """
+    tickers = pd.read_csv(path, dtype=str)
+    # The file ends with empty rows
+    tickers = tickers.dropna(subset=['Ticker'])
+    tickers['Ticker'] = tickers['Ticker'].str.strip()
+    return tickers.reset_index(drop=True)
+
+
+def select_tickers(selection=None, path=TICKERS_FILE):
+    """
+    The tickers of ``selection``: None or 'all' for every listed ticker, the
+    name of a sector (any case), or a watchlist of tickers, kept as given.
+    """
+    if selection is not None and not isinstance(selection, str):
+        return list(dict.fromkeys(ticker.strip().upper() for ticker in selection))
+    tickers = load_tickers(path)
+    if selection is None or selection.lower() == 'all':
+        return tickers['Ticker'].tolist()
+    in_sector = tickers['Sector'].str.lower() == selection.strip().lower()
+    if not in_sector.any():
+        raise ValueError(f"Unknown sector: {selection}")
+    return tickers.loc[in_sector, 'Ticker'].tolist()
+
+
+class BatchFetcher:
+    """
+    Fetch lists of tickers with ``data_fetcher`` on ``workers`` threads, or
+    on AsyncFetcher's event loop when ``asynchronous`` and the fetcher uses
+    the HTTP backend.
+    """
+
+    def __init__(self, data_fetcher, workers=FETCH_WORKERS, asynchronous=FETCH_ASYNC):
+        self.logger = Logger()
+        self.data_fetcher = data_fetcher
+        self.workers = workers
+        self.asynchronous = asynchronous and data_fetcher.backend == 'http'
+
+    def fetch(self, tickers, desired_rows=DEFAULT_ROW_COUNT, should_cancel=None):
+        """
+        Yield ``(ticker, df)`` for every ticker as its fetch finishes; df is
+        None when the fetch failed. ``should_cancel`` is polled like by
+        DataFetcher.fetch_data; once it returns True the running fetches stop
+        at their next page and the waiting ones are not started.
+        """
+        if self.asynchronous:
+            yield from AsyncFetcher(self.data_fetcher).fetch(tickers, desired_rows, should_cancel)
+            return
+
+        stop = threading.Event()
+
+        def cancelled():
+            if not stop.is_set() and should_cancel is not None and should_cancel():
+                stop.set()
+            return stop.is_set()
+
+        def fetch_one(ticker):
+            if cancelled():
+                return None
+            return self.data_fetcher.fetch_data(ticker, desired_rows, should_cancel=cancelled)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, self.workers),
+                                      thread_name_prefix='BatchFetcher')
+        pending = {}
+        try:
+            pending = {executor.submit(fetch_one, ticker): ticker for ticker in tickers}
+            while pending:
+                done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                if cancelled():
+                    return
+                for future in done:
+                    ticker = pending.pop(future)
+                    try:
+                        df = future.result()
+                    except Exception as e:
+                        self.logger.log_or_print(
+                            f"BatchFetcher: fetching {ticker} failed: {str(e)}", level="ERROR",
+                            module="BatchFetcher", exc_info=True)
+                        df = None
+                    yield ticker, df
+        finally:
+            # Also reached when the consumer stops early
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+if __name__ == "__main__":
+    # Refresh the raw_{ticker}.csv files of a sector, some tickers or, by
+    # default, the whole universe for the screener and the backtester
+    from data_fetcher import DataFetcher
+
+    arguments = sys.argv[1:]
+    selection = None if not arguments else arguments[0] if len(arguments) == 1 else arguments
+    try:
+        tickers = select_tickers(selection)
+    except ValueError:
+        tickers = select_tickers(arguments)
+    data_fetcher = DataFetcher(EDGE_DRIVER_PATH)
+    failed = []
+    try:
+        for count, (ticker, df) in enumerate(BatchFetcher(data_fetcher).fetch(tickers), 1):
+            print(f"{count}/{len(tickers)} {ticker}: {'failed' if df is None else f'{len(df)} rows'}")
+            if df is None:
+                failed.append(ticker)
+    finally:
+        data_fetcher.close()
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
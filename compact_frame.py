@@ -0,0 +1,87 @@
+# Compact in-memory layout for calculated frames.
+#
+# A calculated frame is mostly flags, counts and two-decimal indicator values.
+# compact_frame stores those values as float32, the counts as int8 and packs
+# the boolean columns eight to a byte into uint8 ``Flags_*`` columns; text is
+# kept as categoricals. A column only changes type when the conversion can be
+# undone exactly, so expand_frame gives back the original frame, with the same
+# columns, order, dtypes and values, for the report, Excel and chart code.
+import numpy as np
+import pandas as pd
+
+# Key of the layout expand_frame needs in DataFrame.attrs
+COMPACT_LAYOUT = 'compact_layout'
+PACKED_FLAGS_PREFIX = 'Flags_'
+
+
+def is_compact(df):
+    return df is not None and COMPACT_LAYOUT in df.attrs
+
+
+def _compact_column(series):
+    # The compact version of ``series``, or None to keep it as it is
+    values = series.to_numpy()
+    if series.dtype == np.float64:
+        # Two-decimal values up to 2**17 come back from float32 by rounding
+        compact = values.astype(np.float32)
+        if np.array_equal(compact.astype(np.float64).round(2), values, equal_nan=True):
+            return compact
+    elif series.dtype == np.int64:
+        if len(values) == 0 or (values.min() >= np.iinfo(np.int8).min and values.max() <= np.iinfo(np.int8).max):
+            return values.astype(np.int8)
+    elif series.dtype == object:
+        return series.astype('category')
+    return None
+
+
+def compact_frame(df, keep=()):
+    """
+    Compact copy of the calculated frame ``df``; columns in ``keep``, such as
+    the fetched price columns, are left untouched.
+    """
+    if df is None or is_compact(df):
+        return df
+    layout = {'columns': list(df.columns), 'dtypes': {}, 'flags': [], 'packed': []}
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if column not in keep and series.dtype == bool:
+            layout['flags'].append(column)
+            continue
+        compact = None if column in keep else _compact_column(series)
+        if compact is None:
+            columns[column] = series
+        else:
+            layout['dtypes'][column] = series.dtype
+            columns[column] = compact
+
+    flags = np.packbits(df[layout['flags']].to_numpy(dtype=bool), axis=1, bitorder='little')
+    for i in range(flags.shape[1]):
+        layout['packed'].append(f'{PACKED_FLAGS_PREFIX}{i}')
+        columns[layout['packed'][-1]] = flags[:, i]
+
+    compact_df = pd.DataFrame(columns, index=df.index)
+    compact_df.attrs[COMPACT_LAYOUT] = layout
+    return compact_df
+
+
+def expand_frame(df):
+    """
+    The full frame behind a compact frame, or ``df`` itself when it is not
+    compact. Row slices of a compact frame expand too.
+    """
+    if not is_compact(df):
+        return df
+    layout = df.attrs[COMPACT_LAYOUT]
+    columns = {column: df[column] for column in df.columns if column not in layout['packed']}
+    for column, dtype in layout['dtypes'].items():
+        if column in columns:
+            series = columns[column].astype(dtype)
+            columns[column] = series.round(2) if dtype == np.float64 else series
+    if all(column in df.columns for column in layout['packed']):
+        flags = np.unpackbits(df[layout['packed']].to_numpy(dtype=np.uint8), axis=1,
+                              count=len(layout['flags']), bitorder='little').astype(bool)
+        for i, column in enumerate(layout['flags']):
+            columns[column] = flags[:, i]
+    return pd.DataFrame({column: columns[column] for column in layout['columns'] if column in columns},
+                        index=df.index)
@@ -1,5 +1,6 @@
 import logging
 import os
+import tempfile
 from datetime import datetime
 from dateutil import tz
 import time
@@ -7,7 +8,6 @@ import datetime
 import pytz
 from datetime import datetime
 import pandas as pd
-import pandas_ta as ta
 from bs4 import BeautifulSoup
 from PyQt5.QtCore import QObject, pyqtSignal
 from selenium.common.exceptions import UnexpectedAlertPresentException
@@ -22,222 +22,353 @@ from PyQt5.QtCore import Qt, QUrl, pyqtSignal
 from app_config import (
     LOGGING_CONFIG, EDGE_DRIVER_PATH, BASE_URL, DEFAULT_DATE,
     TABLE_SELECTOR, WEBDRIVER_WAIT_TIME, DEFAULT_SMA_PERIOD,
-    DEFAULT_ROW_COUNT, EXCEL_ENGINE
+    DEFAULT_ROW_COUNT, EXCEL_ENGINE, FETCH_BACKEND, HISTORY_FROM_DATE
 )
+from http_fetcher import HostLimiter, HttpTableSource, create_session, limited
+from webdriver_pool import WebDriverPool
 from LoggerFunction import Logger  # Import your Logger class
 from pandas import DataFrame
 
 
-class DataFetcher(QObject):
-    data_frame_ready_signal = pyqtSignal(DataFrame)
-
-    def __init__(self, driver_path):
-        super().__init__()
-        self.driver_path = driver_path
+def parse_history_table(table_html):
+    """
+    The rows of a trading history table, in the column order of
+    DataFetcher.initialize_dataframe.
+    """
+    soup = BeautifulSoup(table_html, 'html.parser')
+    return history_table_rows(soup.find('table'))
+
+
+def history_table_rows(table):
+    # parse_history_table for a table BeautifulSoup has parsed already
+    rows = []
+    for row in table.find_all('tr')[1:]:
+        cols = row.find_all('td')
+        date = datetime.strptime(
+            cols[9].text.strip(), '%d/%m/%Y').date()
+        open_price = float(cols[8].text.strip().replace(',', ''))
+        high = float(cols[7].text.strip().replace(',', ''))
+        low = float(cols[6].text.strip().replace(',', ''))
+        close = float(cols[5].text.strip().replace(',', ''))
+        change = float(cols[4].text.strip().replace(',', ''))
+        change_percent = float(
+            cols[3].text.strip().replace('%', '').replace(',', ''))
+        t_shares = int(cols[2].text.strip().replace(',', ''))
+        volume = int(cols[1].text.strip().replace(',', ''))
+        no_trades = int(cols[0].text.strip().replace(',', ''))
+
+        rows.append([date, open_price, high, low, close,
+                     change, change_percent, t_shares, volume, no_trades])
+    return rows
+
+
+def replace_file(filename, write):
+    """
+    Replace ``filename`` with what ``write`` writes to the open text file it
+    is given. The text goes to a temporary file of this call alone first, so
+    readers never see half a file and two fetches of the same ticker never
+    write into each other's file.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    temporary = tempfile.NamedTemporaryFile('w', dir=directory, prefix=os.path.basename(filename) + '.',
+                                            suffix='.tmp', delete=False, newline='')
+    try:
+        with temporary:
+            write(temporary)
+        os.replace(temporary.name, filename)
+    except BaseException:
+        if os.path.exists(temporary.name):
+            os.remove(temporary.name)
+        raise
+
+
+class WebDriverTableSource:
+    """
+    The trading history table of one ticker, page by page, in an Edge
+    WebDriver borrowed from ``pool``, or started for this fetch alone
+    without one. Page loads go through ``limiter``, a HostLimiter, when one
+    is given. HttpTableSource offers the same methods without a browser.
+    """
+
+    def __init__(self, driver_path=EDGE_DRIVER_PATH, base_url=BASE_URL, pool=None, limiter=None):
         self.logger = Logger()
-
-    def fetch_data(self, ticker, desired_rows):
-        # Define the GMT+3 timezone
-        gmt3 = tz.tzoffset('GMT+3', 3*3600)
-
-        # Get the current date and time in GMT+3
-        current_datetime = datetime.now(gmt3)
-        current_date = current_datetime.date()
-
-        driver = None  # Initialize driver to None
-        filename = f"raw_{ticker}.csv"
-        df = self.initialize_dataframe()
-        df_existing = self.initialize_dataframe()
-        df_temp = self.initialize_dataframe()
-        try:
-            if os.path.exists(filename):
-
-                df_existing = pd.read_csv(filename)
-                number_of_rows = df_existing.shape[0]
-
-                # Ensure the 'Date' column is of datetime type
-                df_existing['Date'] = pd.to_datetime(df_existing['Date'])
-                # Get the maximum date
-                # Convert to datetime.date
-                max_date = df_existing['Date'].max().date()
-                # Calculate the difference in days
-                difference_in_days = (current_date - max_date).days
-
-                # if the CSV is older than 10day the CSV or the number of rows are less than the desired rows be deleted and the to proceed normally to fetch the desired trading days
-                if difference_in_days > 20 or number_of_rows < desired_rows-20:
-
-                    os.remove(filename)
-                    # Initialization and existing code
-
-                    URL = f'{BASE_URL}?currLanguage=en&companyCode={ticker}&activeTab=0'
-
-                    # Initialize Edge driver
-                    driver_service = Service(EDGE_DRIVER_PATH)
-                    driver = EdgeDriver(service=driver_service)
-
-                    driver.get(URL)
-                    self.dismiss_alert_if_present(driver)
-
-                    # Adjust the value of the input field
-                    driver.execute_script(
-                        'document.querySelector("#fromDate").value = "1/1/2010";')
-                    WebDriverWait(driver, WEBDRIVER_WAIT_TIME).until(lambda driver: driver.execute_script(
-                        'return document.querySelector("#fromDate").value;') == "1/1/2010")
-
-                    # Find the button and click it
-                    update_button = driver.execute_script(
-                        'return document.querySelector("#command > div.filterbox > div.button-all")')
-                    update_button.click()
-
-                    # Wait for a couple of seconds after pressing the button
-                    time.sleep(2)
-
-                    # Wait for table to load
-                    self.wait_for_table_to_load(driver)
-
-                    page_num = 1
-
-                    while len(df) < desired_rows:
-
-                        df = self.extract_data_from_page(df, driver)
-                        df['Date'] = pd.to_datetime(df['Date'])
-                        df = df.drop_duplicates(subset='Date', keep='first')
-                        if len(df) >= desired_rows:
-                            break
-
-                        self.navigate_to_next_page(driver)
-                        page_num += 1
-                    df['Date'] = pd.to_datetime(df['Date'])
-                    df = df.sort_values(by='Date', ascending=True)
-
-                else:  # if the CSV is freash fetch only the first page, to be modified to check for the number of rows
-
-                    os.remove(filename)
-                    # Initialization and existing code
-
-                    URL = f'{BASE_URL}?currLanguage=en&companyCode={ticker}&activeTab=0'
-
-                    # Initialize Edge driver
-                    driver_service = Service(EDGE_DRIVER_PATH)
-                    driver = EdgeDriver(service=driver_service)
-
-                    driver.get(URL)
-                    self.dismiss_alert_if_present(driver)
-
-                    # Adjust the value of the input field
-                    driver.execute_script(
-                        'document.querySelector("#fromDate").value = "1/1/2010";')
-                    WebDriverWait(driver, WEBDRIVER_WAIT_TIME).until(lambda driver: driver.execute_script(
-                        'return document.querySelector("#fromDate").value;') == "1/1/2010")
-
-                    # Find the button and click it
-                    update_button = driver.execute_script(
-                        'return document.querySelector("#command > div.filterbox > div.button-all")')
-                    update_button.click()
-
-                    # Wait for a couple of seconds after pressing the button
-                    time.sleep(2)
-
-                    # Wait for table to load
-                    self.wait_for_table_to_load(driver)
-
-                    df = self.extract_data_from_page(df, driver)
-                    df_temp = pd.concat([df, df_existing],
-                                        axis=0, ignore_index=True)
-
-                    df = df_temp
-                    df['Date'] = pd.to_datetime(df['Date'])
-                    duplicate_dates = df[df.duplicated(
-                        subset='Date', keep='first')]['Date']
-
-                    df = df.drop_duplicates(subset='Date', keep='first')
-
-                    df = df.sort_values(by='Date', ascending=False)
-                    df = df.head(desired_rows)
-                    df = df.sort_values(by='Date', ascending=True)
-
+        self.driver_path = driver_path
+        self.base_url = base_url
+        self.pool = pool
+        self.limiter = limiter
+        self.driver = None
+
+    @property
+    def current_url(self):
+        return self.driver.current_url if self.driver else None
+
+    def open(self, ticker, from_date=HISTORY_FROM_DATE):
+        URL = f'{self.base_url}?currLanguage=en&companyCode={ticker}&activeTab=0'
+
+        # Borrow an Edge driver, or start one
+        if self.pool is not None:
+            driver = self.driver = self.pool.acquire()
+        else:
+            driver_service = Service(self.driver_path)
+            driver = self.driver = EdgeDriver(service=driver_service)
+
+        with limited(self.limiter, URL):
+            driver.get(URL)
+        self.dismiss_alert_if_present()
+
+        # Adjust the value of the input field
+        driver.execute_script(
+            f'document.querySelector("#fromDate").value = "{from_date}";')
+        WebDriverWait(driver, WEBDRIVER_WAIT_TIME).until(lambda driver: driver.execute_script(
+            'return document.querySelector("#fromDate").value;') == from_date)
+
+        # Find the button and click it
+        update_button = driver.execute_script(
+            'return document.querySelector("#command > div.filterbox > div.button-all")')
+        with limited(self.limiter, URL):
+            update_button.click()
+
+        # Wait for a couple of seconds after pressing the button
+        time.sleep(2)
+
+        # Wait for table to load
+        self.wait_for_table_to_load()
+
+    def table_html(self):
+        return self.driver.execute_script(
+            'return document.querySelector("#dispTable").outerHTML;')
+
+    def next_page(self):
+        """
+        Click through to the next page of the table. Returns False when there
+        is no next page button.
+        """
+        next_page_btn_selector = "#ajxDspId > div > span.pagelinks > a:nth-child(11)"
+        # find_elements returns an empty list rather than raising on the
+        # last page, which has no next page button
+        next_page_btns = self.driver.find_elements(
+            By.CSS_SELECTOR, next_page_btn_selector)
+
+        if next_page_btns:
+            with limited(self.limiter, self.driver.current_url):
+                next_page_btns[0].click()
+            self.wait_for_table_to_load()
+            return True
+
+        self.logger.log_or_print(
+            "Next page button not found.", level="DEBUG")
+        return False
+
+    def close(self, discard=False):
+        # ``discard``: the fetch failed, so a pooled driver is not reused
+        if self.driver:
+            if self.pool is not None:
+                self.pool.release(self.driver, discard=discard)
             else:
+                self.driver.quit()
+            self.driver = None
 
-                # Initialization and existing code
-
-                URL = f'{BASE_URL}?currLanguage=en&companyCode={ticker}&activeTab=0'
-
-                # Initialize Edge driver
-                driver_service = Service(EDGE_DRIVER_PATH)
-                driver = EdgeDriver(service=driver_service)
-
-                driver.get(URL)
-                self.dismiss_alert_if_present(driver)
-
-                # Adjust the value of the input field
-                driver.execute_script(
-                    'document.querySelector("#fromDate").value = "1/1/2010";')
-                WebDriverWait(driver, WEBDRIVER_WAIT_TIME).until(lambda driver: driver.execute_script(
-                    'return document.querySelector("#fromDate").value;') == "1/1/2010")
-
-                # Find the button and click it
-                update_button = driver.execute_script(
-                    'return document.querySelector("#command > div.filterbox > div.button-all")')
-                update_button.click()
-
-                # Wait for a couple of seconds after pressing the button
-                time.sleep(2)
-
-                # Wait for table to load
-                self.wait_for_table_to_load(driver)
-
-                page_num = 1
+    def wait_for_table_to_load(self):
+        try:
+            WebDriverWait(self.driver, WEBDRIVER_WAIT_TIME).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#dispTable")))
+        except TimeoutException:
+            self.logger.log_or_print(
+                "Table did not load in time.", level="ERROR")
+            raise
 
-            while len(df) < desired_rows:
+    def dismiss_alert_if_present(self):
+        try:
+            alert = self.driver.switch_to.alert
+            alert.dismiss()
 
-                # Extract data into a temporary DataFrame
-                df_temp = self.extract_data_from_page(df, driver)
+        except NoAlertPresentException:
+            self.logger.log_or_print("No alert was present.", level="INFO")
 
-                # Append the temporary DataFrame to the main DataFrame
-                df = pd.concat([df, df_temp], ignore_index=True)
 
-                # Remove duplicates based on the 'Date' column
-                df = df.drop_duplicates(subset='Date', keep='first')
+class DataFetcher(QObject):
+    data_frame_ready_signal = pyqtSignal(DataFrame)
 
-                if len(df) >= desired_rows:
+    def __init__(self, driver_path, backend=FETCH_BACKEND, base_url=BASE_URL):
+        super().__init__()
+        self.driver_path = driver_path
+        self.backend = backend
+        self.base_url = base_url
+        self.logger = Logger()
+        # One pooled session serves every fetch of the HTTP backend, and a
+        # pool of running Edge drivers those of the WebDriver backend. The
+        # host limiter keeps fetches running in parallel polite to the portal
+        self.host_limiter = HostLimiter()
+        self.http_session = create_session() if backend == 'http' else None
+        self.webdriver_pool = WebDriverPool(driver_path) if backend == 'webdriver' else None
+
+    def table_source(self):
+        """
+        A new, unopened table source for the configured backend.
+        """
+        if self.backend == 'http':
+            return HttpTableSource(self.http_session, self.base_url, limiter=self.host_limiter)
+        if self.backend == 'webdriver':
+            return WebDriverTableSource(self.driver_path, self.base_url, self.webdriver_pool,
+                                        self.host_limiter)
+        raise ValueError(f"Unknown fetch backend: {self.backend}")
+
+    def close(self):
+        """
+        Quit the pooled drivers and close the HTTP session.
+        """
+        if self.webdriver_pool is not None:
+            self.webdriver_pool.close()
+        if self.http_session is not None:
+            self.http_session.close()
+
+    def fetch_data(self, ticker, desired_rows, should_cancel=None):
+        # should_cancel: optional callable polled before each page is read;
+        # when it returns True the fetch stops and None is returned
+        source = None  # Initialize the table source to None
+        df = self.initialize_dataframe()
+        failed = False
+        try:
+            # The history saved by earlier fetches is only added to: the table
+            # is read newest first until it reaches a date already on disk
+            df_existing = self.load_cache(ticker)
+            complete = self.history_complete(ticker, df_existing)
+            reached_end = False
+
+            # Open the ticker's trading history on its first page
+            source = self.table_source()
+            source.open(ticker)
+
+            while True:
+                if self.fetch_cancelled(ticker, should_cancel):
+                    return None
+
+                df = self.extract_data_from_page(df, source)
+                df['Date'] = pd.to_datetime(df['Date'])
+                # The next page's rows are added at index len(df)
+                df = df.drop_duplicates(subset='Date', keep='first').reset_index(drop=True)
+                history = self.merge_with_cache(df, df_existing)
+                if self.fetch_complete(df, df_existing, history, desired_rows, complete):
                     break
 
-                self.navigate_to_next_page(driver)
-                page_num += 1
-
-            df = df.sort_values(by='Date', ascending=True)
-            # This will keep only the latest 'desired_rows'
-            df = df.tail(desired_rows)
-
-            # Compute the actual change and change% based on the Close prices
-            df['Change'] = df['Close'].diff()
-            df['Change%'] = df['Change'] / df['Close'].shift(1) * 100
-            # Round the values to two decimal places
-            df['Change'] = df['Change'].round(2)
-            df['Change%'] = df['Change%'].round(2)
+                moved = self.navigate_to_next_page(source)
+                if not moved:
+                    # False: the last page; None: paging failed
+                    reached_end = moved is False
+                    break
 
-            self.data_frame_ready_signal.emit(df)
-            filename = f"raw_{ticker}.csv"
-            df.to_csv(filename, index=False)
-            return df
+            first_session = df['Date'].min() if reached_end and len(df) > 0 else None
+            return self.finish_frame(ticker, history, desired_rows, first_session)
 
         except Exception as e:
+            failed = True
             # Log the exact exception details
             self.logger.log_or_print(
                 f"An error occurred while processing ticker {ticker}: {str(e)}", level="ERROR", exc_info=True)
 
-            # Log the current state of the WebDriver
-            current_url = driver.current_url
+            # Log the current state of the table source
+            current_url = source.current_url if source else None
             self.logger.log_or_print(
-                f"WebDriver state at error: Current URL = {current_url}", level="DEBUG")
+                f"{self.backend} state at error: Current URL = {current_url}", level="DEBUG")
             # Optional: Save a screenshot to see where the browser is when the error occurs
             # driver.save_screenshot('error_screenshot.png')
 
             return None
 
         finally:
-            if driver:
-                self.release_webdriver_resource(driver)
+            if source:
+                source.close(discard=failed)
+
+    def load_cache(self, ticker):
+        """
+        The history saved in raw_{ticker}.csv, or None without one.
+        """
+        filename = f"raw_{ticker}.csv"
+        if not os.path.exists(filename):
+            return None
+        try:
+            df_existing = pd.read_csv(filename)
+            # Ensure the 'Date' column is of datetime type
+            df_existing['Date'] = pd.to_datetime(df_existing['Date'])
+            return df_existing if not df_existing.empty else None
+        except Exception as e:
+            self.logger.log_or_print(
+                f"Could not read {filename}, fetching the history again: {str(e)}", level="WARNING", exc_info=True)
+            return None
+
+    def history_complete(self, ticker, df_existing):
+        """
+        Whether the saved history ``df_existing`` reaches back to the first
+        session of the ticker's table, as recorded in raw_{ticker}.start by
+        a fetch that read the table to its last page.
+        """
+        filename = f"raw_{ticker}.start"
+        if df_existing is None or not os.path.exists(filename):
+            return False
+        try:
+            with open(filename) as start_file:
+                first_session = pd.Timestamp(start_file.read().strip())
+            return df_existing['Date'].min() <= first_session
+        except Exception as e:
+            self.logger.log_or_print(
+                f"Could not read {filename}: {str(e)}", level="WARNING", exc_info=True)
+            return False
+
+    def merge_with_cache(self, df, df_existing):
+        # The fetched rows replace the saved ones of the same date, so a
+        # session saved before the portal finished it is corrected
+        if df_existing is None:
+            return df
+        history = pd.concat([df, df_existing], axis=0, ignore_index=True)
+        return history.drop_duplicates(subset='Date', keep='first')
+
+    def fetch_complete(self, df, df_existing, history, desired_rows, history_complete=False):
+        """
+        Whether the pages read into ``df`` are enough: they reach a date of
+        the saved history (a daily refresh stops on the first page), and
+        with it ``history`` covers ``desired_rows`` trading days. A saved
+        history shorter than that is extended with older pages, unless
+        ``history_complete`` says it already starts at the table's first
+        session, as for tickers listed fewer than ``desired_rows`` days.
+        """
+        reached_cache = df_existing is None or (
+            len(df) > 0 and df['Date'].min() <= df_existing['Date'].max())
+        return reached_cache and (len(history) >= desired_rows or
+                                  (df_existing is not None and history_complete))
+
+    def finish_frame(self, ticker, history, desired_rows, first_session=None):
+        """
+        Recompute Change and Change% of the whole ``history``, save it as
+        raw_{ticker}.csv, and emit and return its latest ``desired_rows``
+        trading days. ``first_session``, the date of the first row of the
+        table when the fetch read it to the last page, is recorded for
+        history_complete.
+        """
+        history = history.sort_values(by='Date', ascending=True).reset_index(drop=True)
+
+        # Compute the actual change and change% based on the Close prices
+        history['Change'] = history['Close'].diff()
+        history['Change%'] = history['Change'] / history['Close'].shift(1) * 100
+        # Round the values to two decimal places
+        history['Change'] = history['Change'].round(2)
+        history['Change%'] = history['Change%'].round(2)
+
+        replace_file(f"raw_{ticker}.csv", lambda csv_file: history.to_csv(csv_file, index=False))
+        if first_session is not None:
+            replace_file(f"raw_{ticker}.start",
+                         lambda start_file: start_file.write(pd.Timestamp(first_session).strftime('%Y-%m-%d')))
+
+        # This will keep only the latest 'desired_rows'
+        df = history.tail(desired_rows)
+        self.data_frame_ready_signal.emit(df)
+        return df
+
+    def fetch_cancelled(self, ticker, should_cancel):
+        if should_cancel is not None and should_cancel():
+            self.logger.log_or_print(
+                f"Fetching {ticker} cancelled.", level="INFO")
+            return True
+        return False
 
     def initialize_dataframe(self):
         # Initialize DataFrame
@@ -246,42 +377,12 @@ class DataFetcher(QObject):
         ])
         return df
 
-    def wait_for_table_to_load(self, driver):
-        try:
-            WebDriverWait(driver, WEBDRIVER_WAIT_TIME).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#dispTable")))
-        except TimeoutException:
-            self.logger.log_or_print(
-                "Table did not load in time.", level="ERROR")
-            raise
-
-    def extract_data_from_page(self, df, driver):
+    def extract_data_from_page(self, df, source):
         """Extract data from the current web page and append to DataFrame."""
         try:
 
-            table_html = driver.execute_script(
-                'return document.querySelector("#dispTable").outerHTML;')
-            soup = BeautifulSoup(table_html, 'html.parser')
-            table = soup.find('table')
-
             # Extracting data and appending to DataFrame
-            for row in table.find_all('tr')[1:]:
-                cols = row.find_all('td')
-                date = datetime.strptime(
-                    cols[9].text.strip(), '%d/%m/%Y').date()
-                open_price = float(cols[8].text.strip().replace(',', ''))
-                high = float(cols[7].text.strip().replace(',', ''))
-                low = float(cols[6].text.strip().replace(',', ''))
-                close = float(cols[5].text.strip().replace(',', ''))
-                change = float(cols[4].text.strip().replace(',', ''))
-                change_percent = float(
-                    cols[3].text.strip().replace('%', '').replace(',', ''))
-                t_shares = int(cols[2].text.strip().replace(',', ''))
-                volume = int(cols[1].text.strip().replace(',', ''))
-                no_trades = int(cols[0].text.strip().replace(',', ''))
-
-                row_data = [date, open_price, high, low, close,
-                            change, change_percent, t_shares, volume, no_trades]
+            for row_data in parse_history_table(source.table_html()):
                 df.loc[len(df)] = row_data
 
             return df
@@ -291,35 +392,15 @@ class DataFetcher(QObject):
                 f"An error occurred while extracting data from the page: {str(e)}", level="ERROR", exc_info=True)
             return df  # Return the DataFrame as is
 
-    def navigate_to_next_page(self, driver):
-        """Navigate to the next page of data."""
+    def navigate_to_next_page(self, source):
+        """
+        Navigate to the next page of data; returns False when there is none,
+        and None when moving to it failed.
+        """
         try:
-
-            next_page_btn_selector = "#ajxDspId > div > span.pagelinks > a:nth-child(11)"
-            next_page_btn = driver.find_element(
-                By.CSS_SELECTOR, next_page_btn_selector)
-
-            if next_page_btn:
-                next_page_btn.click()
-                WebDriverWait(driver, WEBDRIVER_WAIT_TIME).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "#dispTable")))
-
-            else:
-                self.logger.log_or_print(
-                    "Next page button not found.", level="WARNING")
+            return source.next_page()
 
         except Exception as e:
             self.logger.log_or_print(
                 f"An error occurred while navigating to the next page: {str(e)}", level="ERROR", exc_info=True)
-
-    def release_webdriver_resource(self, driver):
-
-        driver.quit()
-
-    def dismiss_alert_if_present(self, driver):
-        try:
-            alert = driver.switch_to.alert
-            alert.dismiss()
-
-        except NoAlertPresentException:
-            self.logger.log_or_print("No alert was present.", level="INFO")
+            return None
@@ -1,6 +1,7 @@
 import plotly.express as px
 import plotly.graph_objects as go
 from LoggerFunction import Logger  # Import your Logger class
+from compact_frame import expand_frame
 from PyQt5.QtCore import pyqtSignal, QObject
 
 
@@ -20,6 +21,8 @@ class DataVisualizer(QObject):
 
             if df is None:
                 raise ValueError("No DataFrame provided for plotting.")
+            # The annotations read the flag columns
+            df = expand_frame(df)
 
             # Colors
             primary_color = "#2E86C1"  # Blueish for primary traces like candlesticks
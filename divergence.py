@@ -0,0 +1,62 @@
+# Swing-point divergences between price and an oscillator.
+#
+# A swing low is a bar whose low is the lowest of the ``window`` bars on
+# either side of it; swing highs likewise. Each swing is compared with the
+# previous swing of the same kind: a lower price low with a higher oscillator
+# low is a bullish divergence, a higher price high with a lower oscillator
+# high a bearish one. The two swings must be at most ``lookback`` bars apart
+# and have no missing price between them, which keeps the tickers of a
+# stacked panel frame apart. A swing is only known ``window`` bars after it
+# happens, so divergences are flagged on that bar and never look ahead.
+#
+# Everything is vectorized: one rolling min/max per price column, then one
+# comparison per swing.
+import numpy as np
+import pandas as pd
+
+from app_config import DIVERGENCE_LOOKBACK, SWING_WINDOW
+
+
+def swing_points(price, window=SWING_WINDOW, low=True):
+    """
+    Boolean array marking the swing lows (or highs) of ``price``.
+    """
+    price = pd.Series(np.asarray(price, dtype=float))
+    rolling = price.rolling(2 * window + 1)
+    extreme = (rolling.min() if low else rolling.max()).shift(-window)
+    return (price == extreme).to_numpy()
+
+
+def _divergence(price, oscillator, swings, window, lookback, low):
+    price = np.asarray(price, dtype=float)
+    oscillator = np.asarray(oscillator, dtype=float)
+    flags = np.zeros(len(price), dtype=bool)
+    pivots = np.flatnonzero(swings)
+    if len(pivots) < 2:
+        return flags
+    current, previous = pivots[1:], pivots[:-1]
+    if low:
+        diverging = (price[current] < price[previous]) & (oscillator[current] > oscillator[previous])
+    else:
+        diverging = (price[current] > price[previous]) & (oscillator[current] < oscillator[previous])
+    # Missing prices split the frame into segments a pair may not span
+    segment = np.cumsum(np.isnan(price))
+    diverging &= (current - previous <= lookback) & (segment[current] == segment[previous])
+    flags[current[diverging] + window] = True
+    return flags
+
+
+def divergence_flags(low, high, oscillator, window=SWING_WINDOW, lookback=DIVERGENCE_LOOKBACK,
+                     swing_lows=None, swing_highs=None):
+    """
+    Bullish and bearish divergence flags of ``oscillator`` against the swing
+    lows of ``low`` and the swing highs of ``high`` (pass the same series
+    twice to use closing prices). Precomputed swing_points may be passed in.
+    Returns two boolean arrays.
+    """
+    if swing_lows is None:
+        swing_lows = swing_points(low, window, low=True)
+    if swing_highs is None:
+        swing_highs = swing_points(high, window, low=False)
+    return (_divergence(low, oscillator, swing_lows, window, lookback, low=True),
+            _divergence(high, oscillator, swing_highs, window, lookback, low=False))
@@ -0,0 +1,86 @@
+# Memoized diff/shift features shared by the DataCalculator interpretations.
+#
+# The flag rules compare most columns with their previous bar, so the same
+# ``df[column].shift(1)`` and ``df[column].diff()`` are needed many times per
+# calculation, and every oscillator's divergences use the same price swing
+# points. FeatureCache computes each of them once per frame.
+import threading
+import weakref
+
+from divergence import swing_points
+
+
+class FeatureCache:
+    """
+    Per-frame memo of ``df[column].diff(periods)``,
+    ``df[column].shift(periods)`` and the swing points of a column, keyed by
+    column, operation and periods.
+
+    An entry is reused only while the column still holds the array it was
+    computed from, so assigning new values to a column invalidates what was
+    derived from it. Writing into the column's array in place
+    (``df.loc[:, column] = ...``, ``df[column].values[:] = ...``) keeps the
+    array and is not detected; call clear after such writes. A frame's
+    entries are dropped when the frame is garbage collected. The returned
+    Series are shared and must not be modified.
+
+    The IndicatorScheduler threads share one cache, so entries are looked up
+    and stored under a lock; the features themselves are computed outside it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frames = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # Sent to worker processes empty; the lock is not picklable
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.__dict__.update(state)
+
+    def _entries(self, df):
+        # Called with the lock held. The finalizer does not take the lock: it
+        # may run on any thread, including this one while it holds the lock
+        key = id(df)
+        entries = self._frames.get(key)
+        if entries is None:
+            entries = self._frames[key] = {}
+            weakref.finalize(df, self._frames.pop, key, None)
+        return entries
+
+    def _feature(self, df, column, operation, periods, compute=None):
+        series = df[column]
+        values = series.to_numpy()
+        # The data pointer identifies the column's current array; keeping
+        # ``values`` alive in the entry stops that address being reused
+        source = (values.__array_interface__['data'][0], values.strides, len(values))
+        key = (column, operation, periods)
+        with self._lock:
+            entry = self._entries(df).get(key)
+            if entry is not None and entry[1] == source:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        feature = compute(series) if compute else getattr(series, operation)(periods)
+        with self._lock:
+            self._entries(df)[key] = (values, source, feature)
+        return feature
+
+    def diff(self, df, column, periods=1):
+        return self._feature(df, column, 'diff', periods)
+
+    def shift(self, df, column, periods=1):
+        return self._feature(df, column, 'shift', periods)
+
+    def swings(self, df, column, window, low=True):
+        # Boolean array of the swing lows (or highs), see divergence.swing_points
+        return self._feature(df, column, 'swing_lows' if low else 'swing_highs', window,
+                             lambda series: swing_points(series, window, low))
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
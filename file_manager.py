@@ -2,6 +2,8 @@ import pandas as pd
 from datetime import datetime
 from app_config import EXCEL_ENGINE
 from LoggerFunction import Logger
+from compact_frame import expand_frame
+from signal_descriptions import DescriptionView
 import base64
 import os
 
@@ -43,6 +45,14 @@ class FileManager:
                 # Get the current datetime
                 now = datetime.now()
 
+                df = expand_frame(df)
+                # The description columns hold category codes; the view
+                # gives the text of every row for the sheet
+                descriptions = DescriptionView(df)
+                if descriptions.columns:
+                    df = df.copy()
+                    df[descriptions.columns] = descriptions.history()
+
                 # Format the datetime and combine with the ticker name to form the filename
                 filename = f"{now.strftime('%Y-%m-%d %H-%M-%S')}_{ticker}.xlsx"
 
@@ -176,6 +186,7 @@ class FileManager:
         try:
 
             if df is not None:
+                df = expand_frame(df)
 
                 # Extract the first 10 columns for standard candle chart
                 subset_df = df.iloc[:, :10]
@@ -288,6 +299,8 @@ class FileManager:
 
                 # Fetch the last row of the DataFrame
                 last_row = df.iloc[-1]
+                # Description text is looked up for the last row only
+                descriptions = DescriptionView(df).latest()
                 # get company name from ticker
                 company_name = self.get_company_name(ticker)
                 # Replace placeholders in the main template
@@ -338,27 +351,27 @@ class FileManager:
                     "sma10_up_flag": self._bool_to_symbol(last_row["SMA10_Up"]),
                     "sma50_up_flag": self._bool_to_symbol(last_row["SMA50_Up"]),
                     "sma200_up_flag": self._bool_to_symbol(last_row["SMA200_Up"]),
-                    "golden_death_cross_desc": last_row["Golden_Death_Cross_Desc"],
-                    "price_sma10_crossover_desc": last_row[
+                    "golden_death_cross_desc": descriptions["Golden_Death_Cross_Desc"],
+                    "price_sma10_crossover_desc": descriptions[
                         "Price_SMA10_Crossover_Desc"
                     ],
-                    "price_crossover_desc": last_row["Price_Crossover_Desc"],
-                    "price_sma200_crossover_desc": last_row[
+                    "price_crossover_desc": descriptions["Price_Crossover_Desc"],
+                    "price_sma200_crossover_desc": descriptions[
                         "Price_SMA200_Crossover_Desc"
                     ],
-                    "sma10_sma200_crossover_desc": last_row[
+                    "sma10_sma200_crossover_desc": descriptions[
                         "SMA10_SMA200_Crossover_Desc"
                     ],
-                    "sma_slopes_desc": last_row["SMA_Slopes_Desc"],
-                    "price_distance_sma10_desc": last_row["Price_Distance_SMA10_Desc"],
-                    "price_distance_sma50_desc": last_row["Price_Distance_SMA50_Desc"],
-                    "price_distance_sma200_desc": last_row[
+                    "sma_slopes_desc": descriptions["SMA_Slopes_Desc"],
+                    "price_distance_sma10_desc": descriptions["Price_Distance_SMA10_Desc"],
+                    "price_distance_sma50_desc": descriptions["Price_Distance_SMA50_Desc"],
+                    "price_distance_sma200_desc": descriptions[
                         "Price_Distance_SMA200_Desc"
                     ],
-                    "sma_relationship_10_50_desc": last_row[
+                    "sma_relationship_10_50_desc": descriptions[
                         "SMA_Relationship_10_50_Desc"
                     ],
-                    "sma_relationship_50_200_desc": last_row[
+                    "sma_relationship_50_200_desc": descriptions[
                         "SMA_Relationship_50_200_Desc"
                     ],
                     "sma10_above_sma50_flag": self._bool_to_symbol(
@@ -402,11 +415,11 @@ class FileManager:
                     "RSI_9_Swing_Failure_Sell_Flag": self._bool_to_symbol(
                         last_row["RSI_9_Swing_Failure_Sell_Flag"]
                     ),
-                    "RSI_9_Overbought_Oversold_Desc": last_row[
+                    "RSI_9_Overbought_Oversold_Desc": descriptions[
                         "RSI_9_Overbought_Oversold_Desc"
                     ],
-                    "RSI_9_Divergence_Desc": last_row["RSI_9_Divergence_Desc"],
-                    "RSI_9_Swings_Desc": last_row["RSI_9_Swings_Desc"],
+                    "RSI_9_Divergence_Desc": descriptions["RSI_9_Divergence_Desc"],
+                    "RSI_9_Swings_Desc": descriptions["RSI_9_Swings_Desc"],
                     "RSI_9_buy_count": last_row["RSI_9_Buy_Count"],
                     "RSI_9_sell_count": last_row["RSI_9_Sell_Count"],
                     "RSI_9_neutral_count": last_row["RSI_9_Neutral_Count"],
@@ -433,11 +446,11 @@ class FileManager:
                     "RSI_14_Swing_Failure_Sell_Flag": self._bool_to_symbol(
                         last_row["RSI_14_Swing_Failure_Sell_Flag"]
                     ),
-                    "RSI_14_Overbought_Oversold_Desc": last_row[
+                    "RSI_14_Overbought_Oversold_Desc": descriptions[
                         "RSI_14_Overbought_Oversold_Desc"
                     ],
-                    "RSI_14_Divergence_Desc": last_row["RSI_14_Divergence_Desc"],
-                    "RSI_14_Swings_Desc": last_row["RSI_14_Swings_Desc"],
+                    "RSI_14_Divergence_Desc": descriptions["RSI_14_Divergence_Desc"],
+                    "RSI_14_Swings_Desc": descriptions["RSI_14_Swings_Desc"],
                     "RSI_14_buy_count": last_row["RSI_14_Buy_Count"],
                     "RSI_14_sell_count": last_row["RSI_14_Sell_Count"],
                     "RSI_14_neutral_count": last_row["RSI_14_Neutral_Count"],
@@ -464,11 +477,11 @@ class FileManager:
                     "RSI_25_Swing_Failure_Sell_Flag": self._bool_to_symbol(
                         last_row["RSI_25_Swing_Failure_Sell_Flag"]
                     ),
-                    "RSI_25_Overbought_Oversold_Desc": last_row[
+                    "RSI_25_Overbought_Oversold_Desc": descriptions[
                         "RSI_25_Overbought_Oversold_Desc"
                     ],
-                    "RSI_25_Divergence_Desc": last_row["RSI_25_Divergence_Desc"],
-                    "RSI_25_Swings_Desc": last_row["RSI_25_Swings_Desc"],
+                    "RSI_25_Divergence_Desc": descriptions["RSI_25_Divergence_Desc"],
+                    "RSI_25_Swings_Desc": descriptions["RSI_25_Swings_Desc"],
                     "RSI_25_buy_count": last_row["RSI_25_Buy_Count"],
                     "RSI_25_sell_count": last_row["RSI_25_Sell_Count"],
                     "RSI_25_neutral_count": last_row["RSI_25_Neutral_Count"],
@@ -499,13 +512,13 @@ class FileManager:
                     "STOCH_9_6_3_Midpoint_Cross_Down_Flag": self._bool_to_symbol(
                         last_row["STOCH_9_6_3_Midpoint_Cross_Down_Flag"]
                     ),
-                    "STOCH_9_6_3_Overbought/Oversold_Desc": last_row[
+                    "STOCH_9_6_3_Overbought/Oversold_Desc": descriptions[
                         "STOCH_9_6_3_Overbought/Oversold_Desc"
                     ],
-                    "STOCH_9_6_3_Divergence_Desc": last_row[
+                    "STOCH_9_6_3_Divergence_Desc": descriptions[
                         "STOCH_9_6_3_Divergence_Desc"
                     ],
-                    "STOCH_9_6_3_Swings_Desc": last_row["STOCH_9_6_3_Swings_Desc"],
+                    "STOCH_9_6_3_Swings_Desc": descriptions["STOCH_9_6_3_Swings_Desc"],
                     "STOCH_9_6_3_buy_count": last_row["STOCH_9_6_3_Buy_Count"],
                     "STOCH_9_6_3_sell_count": last_row["STOCH_9_6_3_Sell_Count"],
                     "STOCH_9_6_3_neutral_count": last_row["STOCH_9_6_3_Neutral_Count"],
@@ -544,13 +557,13 @@ class FileManager:
                     "CMF_Bearish_Divergence_Flag": self._bool_to_symbol(
                         last_row["CMF_Bearish_Divergence_Flag"]
                     ),
-                    "CMF_Value_Range_Desc": last_row["CMF_Value_Range_Desc"],
-                    "CMF_Zero_Crossover_Desc": last_row["CMF_Zero_Crossover_Desc"],
-                    "CMF_SMA_Comparison_Desc": last_row["CMF_SMA_Comparison_Desc"],
-                    "CMF_Overbought_Oversold_Desc": last_row[
+                    "CMF_Value_Range_Desc": descriptions["CMF_Value_Range_Desc"],
+                    "CMF_Zero_Crossover_Desc": descriptions["CMF_Zero_Crossover_Desc"],
+                    "CMF_SMA_Comparison_Desc": descriptions["CMF_SMA_Comparison_Desc"],
+                    "CMF_Overbought_Oversold_Desc": descriptions[
                         "CMF_Overbought_Oversold_Desc"
                     ],
-                    "CMF_Divergence_Desc": last_row["CMF_Divergence_Desc"],
+                    "CMF_Divergence_Desc": descriptions["CMF_Divergence_Desc"],
                     "CMF_buy_count": last_row["CMF_Buy_Count"],
                     "CMF_sell_count": last_row["CMF_Sell_Count"],
                     "CMF_neutral_count": last_row["CMF_Neutral_Count"],
@@ -594,14 +607,14 @@ class FileManager:
                     "MACD_Trending_Down_Flag": self._bool_to_symbol(
                         last_row["MACD_Trending_Down_Flag"]
                     ),
-                    "MACD_Crossover_Desc": last_row["MACD_Crossover_Desc"],
-                    "MACD_Zero_Line_Desc": last_row["MACD_Zero_Line_Desc"],
-                    "MACD_Divergence_Desc": last_row["MACD_Divergence_Desc"],
-                    "MACD_Histogram_Desc": last_row["MACD_Histogram_Desc"],
-                    "MACD_Histogram_Reversal_Desc": last_row[
+                    "MACD_Crossover_Desc": descriptions["MACD_Crossover_Desc"],
+                    "MACD_Zero_Line_Desc": descriptions["MACD_Zero_Line_Desc"],
+                    "MACD_Divergence_Desc": descriptions["MACD_Divergence_Desc"],
+                    "MACD_Histogram_Desc": descriptions["MACD_Histogram_Desc"],
+                    "MACD_Histogram_Reversal_Desc": descriptions[
                         "MACD_Histogram_Reversal_Desc"
                     ],
-                    "MACD_Trend_Desc": last_row["MACD_Trend_Desc"],
+                    "MACD_Trend_Desc": descriptions["MACD_Trend_Desc"],
                     "MACD_buy_count": last_row["MACD_Buy_Count"],
                     "MACD_sell_count": last_row["MACD_Sell_Count"],
                     "MACD_neutral_count": last_row["MACD_Neutral_Count"],
@@ -643,40 +656,19 @@ class FileManager:
                     "OBV_Stoch_Bearish_Flag": self._bool_to_symbol(
                         last_row["OBV_Stoch_Bearish_Flag"]
                     ),
-                    "OBV_Value_Desc": last_row["OBV_Value_Desc"],
-                    "OBV_Trend_Desc": last_row["OBV_Trend_Desc"],
-                    "OBV_RoC_Desc": last_row["OBV_RoC_Desc"],
-                    "OBV_Divergence_Desc": last_row["OBV_Divergence_Desc"],
-                    "OBV_RSI_14_Desc": last_row["OBV_RSI_14_Desc"],
-                    "OBV_Stoch_Desc": last_row["OBV_Stoch_Desc"],
+                    "OBV_Value_Desc": descriptions["OBV_Value_Desc"],
+                    "OBV_Trend_Desc": descriptions["OBV_Trend_Desc"],
+                    "OBV_RoC_Desc": descriptions["OBV_RoC_Desc"],
+                    "OBV_Divergence_Desc": descriptions["OBV_Divergence_Desc"],
+                    "OBV_RSI_14_Desc": descriptions["OBV_RSI_14_Desc"],
+                    "OBV_Stoch_Desc": descriptions["OBV_Stoch_Desc"],
                     "OBV_buy_count": last_row["OBV_Buy_Count"],
                     "OBV_sell_count": last_row["OBV_Sell_Count"],
                     "OBV_neutral_count": last_row["OBV_Neutral_Count"],
                     # Total Count for Buys and Sells
-                    "total_buy_count": last_row["SMA_Buy_Count"]
-                    + last_row["RSI_9_Buy_Count"]
-                    + last_row["RSI_14_Buy_Count"]
-                    + last_row["RSI_25_Buy_Count"]
-                    + last_row["STOCH_9_6_3_Buy_Count"]
-                    + last_row["CMF_Buy_Count"]
-                    + last_row["MACD_Buy_Count"]
-                    + last_row["OBV_Buy_Count"],
-                    "total_sell_count": last_row["SMA_Sell_Count"]
-                    + last_row["RSI_9_Sell_Count"]
-                    + last_row["RSI_14_Sell_Count"]
-                    + last_row["RSI_25_Sell_Count"]
-                    + last_row["STOCH_9_6_3_Sell_Count"]
-                    + last_row["CMF_Sell_Count"]
-                    + last_row["MACD_Sell_Count"]
-                    + last_row["OBV_Sell_Count"],
-                    "total_neutral_count": last_row["SMA_Neutral_Count"]
-                    + last_row["RSI_9_Neutral_Count"]
-                    + last_row["RSI_14_Neutral_Count"]
-                    + last_row["RSI_25_Neutral_Count"]
-                    + last_row["STOCH_9_6_3_Neutral_Count"]
-                    + last_row["CMF_Neutral_Count"]
-                    + last_row["MACD_Neutral_Count"]
-                    + last_row["OBV_Neutral_Count"],
+                    "total_buy_count": last_row["Total_Buy_Count"],
+                    "total_sell_count": last_row["Total_Sell_Count"],
+                    "total_neutral_count": last_row["Total_Neutral_Count"],
                 }
                 for key, value in replacements.items():
                     template = template.replace(f"{{{key}}}", str(value))
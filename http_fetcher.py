@@ -0,0 +1,197 @@
+# Browser-free access to the portal's trading history table.
+#
+# The WebDriver backend loads the company profile page in Edge, sets the
+# filter form's from date, clicks its button and clicks through the table's
+# page links. HttpTableSource makes the same requests directly: it reads the
+# filter form from the profile page, submits it with the from date and follows
+# the table's next page link, parsing every page with BeautifulSoup. All
+# fetches share one pooled requests session, so the portal connection is
+# reused across pages and tickers, and one HostLimiter, which keeps
+# concurrent fetches polite to the portal.
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app_config import (BASE_URL, FETCH_HOST_CONCURRENCY, FETCH_HOST_MIN_INTERVAL, HISTORY_FROM_DATE,
+                        HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_TIMEOUT, TABLE_SELECTOR)
+from LoggerFunction import Logger
+
+FILTER_FORM_SELECTOR = "#command"
+FROM_DATE_SELECTOR = "#fromDate"
+PAGE_LINKS_SELECTOR = "span.pagelinks"
+# The WebDriver backend clicks the 11th page link when there is no "Next" text
+NEXT_LINK_POSITION = 10
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) ISXstockAnalizer"
+
+
+def create_session(pool_size=HTTP_POOL_SIZE, retries=HTTP_RETRIES):
+    """
+    A requests session keeping up to ``pool_size`` connections per host and
+    retrying failed connections and server errors with backoff.
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                  allowed_methods=None)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+def _form_fields(form):
+    # The values a browser would submit for ``form`` as it is
+    fields = {}
+    for field in form.find_all(['input', 'select', 'textarea']):
+        name = field.get('name')
+        if not name or field.get('type') in ('submit', 'button', 'image', 'file'):
+            continue
+        if field.get('type') in ('checkbox', 'radio') and not field.has_attr('checked'):
+            continue
+        if field.name == 'select':
+            option = field.find('option', selected=True) or field.find('option')
+            fields[name] = option.get('value', option.get_text()) if option else ''
+        elif field.name == 'textarea':
+            fields[name] = field.get_text()
+        else:
+            fields[name] = field.get('value', '')
+    return fields
+
+
+def filter_request(page, url, from_date=HISTORY_FROM_DATE):
+    """
+    ``(url, method, fields)`` submitting the filter form of the profile
+    ``page``, loaded from ``url``, with ``from_date``; None without a form.
+    """
+    form = page.select_one(FILTER_FORM_SELECTOR)
+    if form is None:
+        return None
+    fields = _form_fields(form)
+    date_field = form.select_one(FROM_DATE_SELECTOR)
+    fields[date_field.get('name', 'fromDate') if date_field else 'fromDate'] = from_date
+    return (urljoin(url, form.get('action') or url), form.get('method', 'GET').upper(), fields)
+
+
+def next_page_url(page, url):
+    """
+    The address of the table page after ``page``, loaded from ``url``, or
+    None on the last page.
+    """
+    links = page.select_one(PAGE_LINKS_SELECTOR)
+    if links is None:
+        return None
+    link = next((anchor for anchor in links.find_all('a')
+                 if anchor.get_text(strip=True).lower() == 'next'), None)
+    if link is None:
+        children = links.find_all(recursive=False)
+        if len(children) <= NEXT_LINK_POSITION or children[NEXT_LINK_POSITION].name != 'a':
+            return None
+        link = children[NEXT_LINK_POSITION]
+    href = link.get('href', '')
+    if not href or href.startswith('javascript:'):
+        return None
+    return urljoin(url, href)
+
+
+class HostLimiter:
+    """
+    Per-host politeness for fetches running in parallel: at most
+    ``max_concurrent`` requests to one host at a time, started at least
+    ``min_interval`` seconds apart.
+    """
+
+    def __init__(self, max_concurrent=FETCH_HOST_CONCURRENCY, min_interval=FETCH_HOST_MIN_INTERVAL):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self.lock = threading.Lock()
+        # Per host: the semaphore of its requests and the earliest time the
+        # next one may start
+        self.hosts = {}
+
+    @contextmanager
+    def request(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = [threading.BoundedSemaphore(self.max_concurrent), 0.0]
+            state = self.hosts[host]
+        state[0].acquire()
+        try:
+            with self.lock:
+                now = time.monotonic()
+                start = max(now, state[1])
+                state[1] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+        finally:
+            state[0].release()
+
+
+def limited(limiter, url):
+    # The request context of ``limiter`` for ``url``; no limit without one
+    return limiter.request(url) if limiter is not None else nullcontext()
+
+
+class HttpTableSource:
+    """
+    The trading history table of one ticker, page by page, over HTTP.
+    ``base_url`` may point at a local server serving recorded portal pages.
+    Every request goes through ``limiter``, a HostLimiter, when one is given.
+    """
+
+    def __init__(self, session=None, base_url=BASE_URL, timeout=HTTP_TIMEOUT, limiter=None):
+        self.logger = Logger()
+        self.session = session or create_session()
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limiter = limiter
+        self.current_url = None
+        self.page = None
+        self.visited = set()
+
+    def _load(self, url, method='GET', data=None):
+        with limited(self.limiter, url):
+            if method == 'POST':
+                response = self.session.post(url, data=data, timeout=self.timeout)
+            else:
+                response = self.session.get(url, params=data, timeout=self.timeout)
+        response.raise_for_status()
+        self.current_url = response.url
+        self.visited.add(self.current_url)
+        self.page = BeautifulSoup(response.text, 'html.parser')
+
+    def open(self, ticker, from_date=HISTORY_FROM_DATE):
+        self._load(f'{self.base_url}?currLanguage=en&companyCode={ticker}&activeTab=0')
+        request = filter_request(self.page, self.current_url, from_date)
+        if request is not None:
+            self._load(*request)
+        if self.page.select_one(TABLE_SELECTOR) is None:
+            raise ValueError(f"No {TABLE_SELECTOR} table at {self.current_url}")
+
+    def table_html(self):
+        return str(self.page.select_one(TABLE_SELECTOR))
+
+    def next_page(self):
+        """
+        Load the next page of the table. Returns False on the last page.
+        """
+        url = next_page_url(self.page, self.current_url)
+        if url is None or url in self.visited:
+            return False
+        self._load(url)
+        if self.page.select_one(TABLE_SELECTOR) is None:
+            self.logger.log_or_print(
+                f"HttpTableSource: no {TABLE_SELECTOR} table at {self.current_url}", level="WARNING")
+            return False
+        return True
+
+    def close(self, discard=False):
+        # The session is shared and stays open for the next fetch
+        self.page = None
@@ -0,0 +1,116 @@
+# On-disk cache of calculated indicator frames.
+#
+# Every ticker keeps at most one Parquet file, named after a key that hashes
+# the fetched input frame together with the calculation parameters. A fetch
+# that returns the same data calculated with the same parameters loads the
+# finished frame instead of recalculating it; any change to either gives a new
+# key, and the ticker's file under the old key is dropped as stale. Files past
+# the maximum age, and the least recently used files beyond the size budget,
+# are evicted whenever a frame is stored.
+import glob
+import hashlib
+import os
+import time
+
+import pandas as pd
+
+from app_config import INDICATOR_CACHE_DIR, INDICATOR_CACHE_MAX_AGE_DAYS, INDICATOR_CACHE_MAX_BYTES
+from LoggerFunction import Logger
+
+# Bump when a change to the calculations makes existing cache files wrong
+CACHE_VERSION = 2
+
+
+class IndicatorCache:
+    """
+    Calculated frames per ticker in ``directory``. Parquet needs pyarrow; the
+    cache is disabled when it is not installed.
+    """
+
+    def __init__(self, directory=INDICATOR_CACHE_DIR, max_bytes=INDICATOR_CACHE_MAX_BYTES,
+                 max_age_days=INDICATOR_CACHE_MAX_AGE_DAYS):
+        self.logger = Logger()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 60 * 60
+        try:
+            import pyarrow  # noqa: F401
+            self.enabled = True
+        except ImportError:
+            self.enabled = False
+            self.logger.log_or_print(
+                "pyarrow is not installed; calculated indicators will not be cached on disk.", level="WARNING", module="IndicatorCache")
+
+    def key(self, df, parameters):
+        """
+        Key for the input frame ``df`` calculated with ``parameters``.
+        """
+        digest = hashlib.sha1()
+        digest.update(repr((CACHE_VERSION, list(df.columns), [str(dtype) for dtype in df.dtypes],
+                            sorted(parameters.items()))).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()[:20]
+
+    def _path(self, ticker, key):
+        return os.path.join(self.directory, f"{ticker}_{key}.parquet")
+
+    def load(self, ticker, key):
+        """
+        The frame stored for ``ticker`` under ``key``, or None.
+        """
+        if not self.enabled:
+            return None
+        path = self._path(ticker, key)
+        try:
+            if not os.path.exists(path):
+                return None
+            df = pd.read_parquet(path)
+            # The access time orders files for eviction
+            os.utime(path)
+            return df
+        except Exception as e:
+            self.logger.log_or_print(
+                f"IndicatorCache: Could not load {path}: {str(e)}", level="WARNING", module="IndicatorCache")
+            return None
+
+    def store(self, ticker, key, df):
+        if not self.enabled:
+            return
+        path = self._path(ticker, key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write under a temporary name so readers never see half a file
+            temporary_path = path + '.tmp'
+            df.to_parquet(temporary_path, index=False)
+            os.replace(temporary_path, path)
+            for stale_path in glob.glob(self._path(ticker, '*')):
+                if stale_path != path:
+                    os.remove(stale_path)
+            self.evict()
+        except Exception as e:
+            self.logger.log_or_print(
+                f"IndicatorCache: Could not store {path}: {str(e)}", level="WARNING", module="IndicatorCache")
+
+    def evict(self):
+        """
+        Remove files older than the maximum age, then the least recently used
+        files until the cache fits its size budget.
+        """
+        files = []
+        now = time.time()
+        for path in glob.glob(os.path.join(self.directory, '*.parquet')):
+            status = os.stat(path)
+            if now - status.st_mtime > self.max_age:
+                os.remove(path)
+            else:
+                files.append((status.st_mtime, status.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for path in glob.glob(os.path.join(self.directory, '*.parquet')):
+            os.remove(path)
@@ -0,0 +1,135 @@
+# Declared dependencies between the DataCalculator indicators.
+#
+# Every node names the DataCalculator method that calculates it and the nodes
+# whose columns that method reads. IndicatorScheduler calculates only the
+# nodes a request needs, runs nodes whose dependencies are done side by side,
+# and keeps each node's column block for as long as the price data is the same.
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from LoggerFunction import Logger
+
+# node: (dependencies, DataCalculator method, keyword arguments), in an order
+# where every node comes after its dependencies
+INDICATOR_GRAPH = {
+    'SMA': ((), 'calculate_sma', {}),
+    'RSI_9': ((), 'calculate_rsi', {'periods': [9]}),
+    'RSI_14': ((), 'calculate_rsi', {'periods': [14]}),
+    'RSI_25': ((), 'calculate_rsi', {'periods': [25]}),
+    'Stochastic': ((), 'calculate_stochastic_oscillator', {}),
+    'CMF': (('SMA',), 'calculate_cmf', {}),  # CMF_Above/Below_SMA50 flags
+    'MACD': ((), 'calculate_macd', {}),
+    'OBV': (('RSI_14', 'Stochastic'), 'calculate_obv', {}),  # OBV_RSI/Stoch flags
+    'Totals': (('SMA', 'RSI_9', 'RSI_14', 'RSI_25', 'Stochastic', 'CMF', 'MACD', 'OBV'),
+               'calculate_signal_totals', {}),
+}
+
+# Node behind each indicator name MainGUI.on_indicator_checkbox_changed emits
+CHART_INDICATOR_NODES = {
+    'SMA': 'SMA',
+    'RSI_9': 'RSI_9',
+    'RSI_14': 'RSI_14',
+    'RSI_25': 'RSI_25',
+    'STOCH': 'Stochastic',
+    'CMF_20': 'CMF',
+    'MACD_12_26_9': 'MACD',
+    'MACDs_12_26_9': 'MACD',
+    'MACDh_12_26_9': 'MACD',
+    'OBV': 'OBV',
+}
+
+# Columns the block cache is keyed on; any change to them invalidates it
+PRICE_COLUMNS = ['Date', 'Close', 'Open', 'High', 'Low', 'T.Shares']
+
+
+def required_nodes(nodes):
+    """
+    ``nodes`` and everything they depend on, in graph order.
+    """
+    required = set()
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if node not in required:
+            required.add(node)
+            pending.extend(INDICATOR_GRAPH[node][0])
+    return [node for node in INDICATOR_GRAPH if node in required]
+
+
+def chart_nodes(indicators, df=None):
+    """
+    Nodes behind the chart ``indicators``; with ``df``, only those whose
+    columns are not on it yet.
+    """
+    nodes = []
+    for indicator in indicators:
+        column = 'STOCHk_9_6_3' if indicator == 'STOCH' else indicator
+        if indicator in CHART_INDICATOR_NODES and (df is None or column not in df.columns):
+            nodes.append(CHART_INDICATOR_NODES[indicator])
+    return nodes
+
+
+def price_fingerprint(df):
+    columns = [column for column in PRICE_COLUMNS if column in df.columns]
+    return (len(df), int(pd.util.hash_pandas_object(df[columns]).sum()))
+
+
+class IndicatorScheduler:
+    """
+    Calculates INDICATOR_GRAPH nodes with a DataCalculator. ``calculate``
+    takes a fetched price frame and returns ``{node: column block}`` for the
+    requested nodes and their dependencies; blocks already calculated for
+    the same price data are reused.
+    """
+
+    def __init__(self, data_calculator, max_workers=4):
+        self.logger = Logger()
+        self.data_calculator = data_calculator
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._blocks = {}
+
+    def clear(self):
+        with self._lock:
+            self._fingerprint = None
+            self._blocks = {}
+
+    def _calculate_node(self, node, df, blocks):
+        dependencies, method, kwargs = INDICATOR_GRAPH[node]
+        work = pd.concat([df, *(blocks[dependency] for dependency in dependencies)], axis=1)
+        known = set(work.columns)
+        work = getattr(self.data_calculator, method)(work, **kwargs)
+        return work[[column for column in work.columns if column not in known]]
+
+    def calculate(self, df, nodes=None):
+        nodes = required_nodes(nodes if nodes is not None else INDICATOR_GRAPH)
+        fingerprint = price_fingerprint(df)
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._fingerprint, self._blocks = fingerprint, {}
+            blocks = {node: self._blocks[node] for node in nodes if node in self._blocks}
+
+        pending = [node for node in nodes if node not in blocks]
+        if pending:
+            self.logger.log_or_print(
+                f"IndicatorScheduler: calculating {', '.join(pending)}.", level="DEBUG", module="IndicatorScheduler")
+            # Submit every node whose dependencies are done, then wait for
+            # any of them to finish before looking for newly ready nodes
+            running = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while pending or running:
+                    for node in [node for node in pending
+                                 if all(dependency in blocks for dependency in INDICATOR_GRAPH[node][0])]:
+                        pending.remove(node)
+                        running[executor.submit(self._calculate_node, node, df, blocks)] = node
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        blocks[running.pop(future)] = future.result()
+
+            with self._lock:
+                if fingerprint == self._fingerprint:
+                    self._blocks.update(blocks)
+        return {node: blocks[node] for node in nodes}
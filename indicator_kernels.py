@@ -0,0 +1,152 @@
+# Indicator kernels for DataCalculator and the panel calculations.
+#
+# These reimplement the few pandas_ta functions the project uses directly on
+# NumPy arrays and pandas' compiled rolling/ewm routines, without pandas_ta's
+# per-call wrapping and its slow import. They accept a Series, or a wide
+# DataFrame with one column per ticker, and follow pandas_ta 0.3.14b step for
+# step so the values match it exactly, including after rounding to two
+# decimals. Sums and averages stay on pandas' rolling/ewm routines because a
+# cumsum-based window sum rounds differently and flips values sitting on a
+# .xx5 boundary.
+#
+# load_kernels(INDICATOR_BACKEND) picks these, their Numba-compiled versions in
+# numba_kernels, or the pandas_ta originals.
+import sys
+
+import numpy as np
+import pandas as pd
+
+from LoggerFunction import Logger
+
+
+def _first_valid(data):
+    # Row position of the first non-NaN value of every column
+    valid = data.notna().to_numpy().reshape(len(data), -1)
+    return np.where(valid.any(axis=0), valid.argmax(axis=0), len(data))
+
+
+def sma(close, length):
+    return close.rolling(length, min_periods=length).mean()
+
+
+def rma(close, length):
+    # Wilder smoothing
+    return close.ewm(alpha=1.0 / length, min_periods=length).mean()
+
+
+def ema(close, length):
+    # Seeded with the mean of the first ``length`` values of every column,
+    # then ewm(span=length, adjust=False)
+    values = close.to_numpy(dtype=float, copy=True).reshape(len(close), -1)
+    first = _first_valid(close)
+    columns = np.flatnonzero(first + length <= len(values))
+    rows = first[columns][:, None] + np.arange(length)
+    seed = values[rows, columns[:, None]].sum(axis=1) / length
+    values[np.arange(len(values))[:, None] < (first + length - 1)] = np.nan
+    values[first[columns] + length - 1, columns] = seed
+    if isinstance(close, pd.Series):
+        seeded = pd.Series(values[:, 0], index=close.index, name=close.name)
+    else:
+        seeded = pd.DataFrame(values, index=close.index, columns=close.columns)
+    return seeded.ewm(span=length, adjust=False).mean()
+
+
+def rsi(close, length=14):
+    change = close.diff()
+    average_gain = rma(change.clip(lower=0), length)
+    average_loss = rma(change.clip(upper=0), length).abs()
+    return 100 * average_gain / (average_gain + average_loss)
+
+
+def stoch(high, low, close, k=14, d=3, smooth_k=3):
+    # Returns (%K, %D); a column with any zero high-low range gets epsilon
+    # added to all of its ranges
+    lowest_low = low.rolling(k).min()
+    value_range = high.rolling(k).max() - lowest_low
+    value_range = value_range + sys.float_info.epsilon * value_range.eq(0).any()
+    stoch_k = sma(100 * (close - lowest_low) / value_range, smooth_k)
+    return stoch_k, sma(stoch_k, d)
+
+
+def macd(close, fast=12, slow=26, signal=9):
+    # Returns (MACD, signal, histogram)
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def obv(close, volume):
+    # The first bar of every column counts as a rise
+    sign = np.sign(close.diff().to_numpy()).reshape(len(close), -1)
+    first = _first_valid(close)
+    has_data = np.flatnonzero(first < len(close))
+    sign[first[has_data], has_data] = 1
+    if isinstance(close, pd.Series):
+        sign = sign[:, 0]
+    return (volume * sign).cumsum()
+
+
+class PandasTAKernels:
+    """
+    The same kernels through pandas_ta, for Series input. pandas_ta is
+    imported only when this backend is chosen.
+    """
+
+    def __init__(self):
+        import pandas_ta
+        self.ta = pandas_ta
+
+    def sma(self, close, length):
+        return self.ta.sma(close, length=length)
+
+    def ema(self, close, length):
+        return self.ta.ema(close, length=length)
+
+    def rsi(self, close, length=14):
+        return self.ta.rsi(close, length=length)
+
+    def stoch(self, high, low, close, k=14, d=3, smooth_k=3):
+        stoch_df = self.ta.stoch(high, low, close, k=k, d=d, smooth_k=smooth_k)
+        return (stoch_df[f'STOCHk_{k}_{d}_{smooth_k}'],
+                stoch_df[f'STOCHd_{k}_{d}_{smooth_k}'])
+
+    def macd(self, close, fast=12, slow=26, signal=9):
+        macd_df = self.ta.macd(close, fast=fast, slow=slow, signal=signal)
+        return (macd_df[f'MACD_{fast}_{slow}_{signal}'],
+                macd_df[f'MACDs_{fast}_{slow}_{signal}'],
+                macd_df[f'MACDh_{fast}_{slow}_{signal}'])
+
+    def obv(self, close, volume):
+        return self.ta.obv(close, volume)
+
+
+class NumpyKernels:
+    sma = staticmethod(sma)
+    ema = staticmethod(ema)
+    rsi = staticmethod(rsi)
+    stoch = staticmethod(stoch)
+    macd = staticmethod(macd)
+    obv = staticmethod(obv)
+
+
+def load_kernels(backend='numpy'):
+    """
+    Kernels for ``backend`` ('numpy', 'numba' or 'pandas_ta'). Falls back to
+    the NumPy kernels when the requested library is not installed.
+    """
+    if backend == 'numba':
+        try:
+            from numba_kernels import NumbaKernels
+            return NumbaKernels()
+        except ImportError:
+            Logger().log_or_print(
+                "numba is not installed; using the NumPy indicator kernels.", level="WARNING")
+    elif backend == 'pandas_ta':
+        try:
+            return PandasTAKernels()
+        except ImportError:
+            Logger().log_or_print(
+                "pandas_ta is not installed; using the NumPy indicator kernels.", level="WARNING")
+    elif backend != 'numpy':
+        raise ValueError(f"Unknown indicator backend: {backend}")
+    return NumpyKernels()
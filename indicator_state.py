@@ -0,0 +1,254 @@
+# Running state for the DataCalculator indicators.
+#
+# Each state object is fed one bar at a time and keeps only what the indicator
+# needs to produce its next value (window sums, exponential averages, running
+# totals), so extending a calculated frame costs O(new bars) instead of a
+# recomputation over the whole history. The values follow the pandas_ta
+# definitions used by DataCalculator and are returned unrounded.
+#
+# The sums and averages are accumulated in the same order as the pandas
+# rolling/ewm kernels behind pandas_ta, so that values rounded to two decimals
+# land on the same side of a .xx5 boundary as the batch calculation.
+import math
+import sys
+from collections import deque
+
+import numpy as np
+
+
+class RollingWindow:
+    """
+    Compensated (Kahan) sum over the last ``size`` values, as kept by
+    ``Series.rolling(size).sum()`` and ``.mean()``.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.values = deque()
+        self.total = 0.0
+        self.add_compensation = 0.0
+        self.remove_compensation = 0.0
+        self.negative_count = 0
+        self.same_value_count = 0
+        self.previous_value = math.nan
+
+    def update(self, value):
+        if len(self.values) == self.size:
+            removed = self.values.popleft()
+            y = -removed - self.remove_compensation
+            t = self.total + y
+            self.remove_compensation = t - self.total - y
+            self.total = t
+            if math.copysign(1.0, removed) < 0:
+                self.negative_count -= 1
+
+        self.values.append(value)
+        y = value - self.add_compensation
+        t = self.total + y
+        self.add_compensation = t - self.total - y
+        self.total = t
+        if math.copysign(1.0, value) < 0:
+            self.negative_count += 1
+        if value == self.previous_value:
+            self.same_value_count += 1
+        else:
+            self.same_value_count = 1
+        self.previous_value = value
+
+    @property
+    def full(self):
+        return len(self.values) == self.size
+
+    def sum(self):
+        if not self.full:
+            return math.nan
+        if self.same_value_count >= self.size:
+            return self.previous_value * self.size
+        return self.total
+
+    def mean(self):
+        if not self.full:
+            return math.nan
+        if self.same_value_count >= self.size:
+            return self.previous_value
+        result = self.total / self.size
+        if self.negative_count == 0 and result < 0:
+            return 0.0
+        if self.negative_count == self.size and result > 0:
+            return 0.0
+        return result
+
+
+class SMAState:
+    def __init__(self, period):
+        self.window = RollingWindow(period)
+
+    def update(self, value):
+        self.window.update(value)
+        return self.window.mean()
+
+
+class RSIState:
+    # Wilder averages as computed by pandas_ta: ewm(alpha=1/period) over the
+    # gains and losses with adjust=True weights.
+    def __init__(self, period):
+        self.period = period
+        self.decay = 1.0 - 1.0 / period
+        self.previous_close = None
+        self.gains = None
+        self.losses = None
+        self.weight = 1.0
+        self.count = 0
+
+    def _average(self, average, value):
+        if average != value:
+            average = (self.weight * average + value) / (self.weight + 1.0)
+        return average
+
+    def update(self, close):
+        previous_close, self.previous_close = self.previous_close, close
+        if previous_close is None:
+            return math.nan
+        change = close - previous_close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if self.gains is None:
+            self.gains, self.losses = gain, loss
+        else:
+            self.weight *= self.decay
+            self.gains = self._average(self.gains, gain)
+            self.losses = self._average(self.losses, loss)
+            self.weight += 1.0
+        self.count += 1
+        if self.count < self.period:
+            return math.nan
+        return 100 * self.gains / (self.gains + self.losses) if self.gains + self.losses else math.nan
+
+
+class StochasticState:
+    def __init__(self, k_period=9, d_period=6, smooth_k=3):
+        self.highs = deque(maxlen=k_period)
+        self.lows = deque(maxlen=k_period)
+        self.k_sma = SMAState(smooth_k)
+        self.d_sma = SMAState(d_period)
+
+    def update(self, high, low, close):
+        self.highs.append(high)
+        self.lows.append(low)
+        if len(self.highs) < self.highs.maxlen:
+            return math.nan, math.nan
+        lowest_low = min(self.lows)
+        value_range = max(self.highs) - lowest_low
+        if value_range == 0:
+            value_range = sys.float_info.epsilon
+        stoch_k = self.k_sma.update(100 * (close - lowest_low) / value_range)
+        if math.isnan(stoch_k):
+            return math.nan, math.nan
+        return stoch_k, self.d_sma.update(stoch_k)
+
+
+class CMFState:
+    def __init__(self, window=20):
+        self.money_flow = RollingWindow(window)
+        self.volume = RollingWindow(window)
+
+    def update(self, high, low, close, volume):
+        delta = high - low
+        if delta == 0:
+            delta = 0.0001
+        multiplier = ((close - low) - (high - close)) / delta
+        self.money_flow.update(multiplier * volume)
+        self.volume.update(float(volume))
+        if not self.volume.full or self.volume.sum() == 0:
+            return math.nan
+        return self.money_flow.sum() / self.volume.sum()
+
+
+class EMAState:
+    # pandas_ta EMA: seeded with the mean of the first ``period`` values, then
+    # ewm(span=period, adjust=False).
+    def __init__(self, period):
+        self.period = period
+        self.seed = []
+        self.alpha = 2.0 / (period + 1)
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.seed.append(value)
+            if len(self.seed) < self.period:
+                return math.nan
+            self.value = np.array(self.seed).sum() / self.period
+            self.seed = None
+        elif self.value != value:
+            decay = 1.0 - self.alpha
+            self.value = (decay * self.value + self.alpha * value) / (decay + self.alpha)
+        return self.value
+
+
+class MACDState:
+    def __init__(self, short_period=12, long_period=26, signal_period=9):
+        self.short_ema = EMAState(short_period)
+        self.long_ema = EMAState(long_period)
+        self.signal_ema = EMAState(signal_period)
+
+    def update(self, close):
+        macd = self.short_ema.update(close) - self.long_ema.update(close)
+        if math.isnan(macd):
+            return math.nan, math.nan, math.nan
+        signal = self.signal_ema.update(macd)
+        return macd, signal, macd - signal
+
+
+class OBVState:
+    def __init__(self, sma_window=20):
+        self.previous_close = None
+        self.total = 0.0
+        self.sma = SMAState(sma_window)
+
+    def update(self, close, volume):
+        if self.previous_close is None or close > self.previous_close:
+            self.total += volume
+        elif close < self.previous_close:
+            self.total -= volume
+        self.previous_close = close
+        return self.total, self.sma.update(self.total)
+
+
+class IndicatorState:
+    """
+    Aggregate state for every indicator DataCalculator computes with its
+    default parameters. ``update`` takes one bar (a mapping with Close, High,
+    Low and T.Shares) and returns the indicator value columns for it.
+    """
+
+    def __init__(self, sma_period=10):
+        self.sma = {'SMA': SMAState(sma_period), 'SMA10': SMAState(10),
+                    'SMA50': SMAState(50), 'SMA200': SMAState(200)}
+        self.rsi = {f'RSI_{period}': RSIState(period) for period in [9, 14, 25]}
+        self.stochastic = StochasticState(9, 6, 3)
+        self.cmf = CMFState(20)
+        self.macd = MACDState(12, 26, 9)
+        self.obv = OBVState(20)
+
+    def update(self, bar):
+        close, high, low = bar['Close'], bar['High'], bar['Low']
+        volume = bar['T.Shares']
+
+        values = {column: state.update(close)
+                  for column, state in self.sma.items()}
+        values.update({column: state.update(close)
+                       for column, state in self.rsi.items()})
+        values['STOCHk_9_6_3'], values['STOCHd_9_6_3'] = self.stochastic.update(
+            high, low, close)
+        values['CMF_20'] = self.cmf.update(high, low, close, volume)
+        (values['MACD_12_26_9'], values['MACDs_12_26_9'],
+         values['MACDh_12_26_9']) = self.macd.update(close)
+        values['OBV'], values['OBV_SMA'] = self.obv.update(close, volume)
+        return values
+
+    @classmethod
+    def from_history(cls, df, sma_period=10):
+        state = cls(sma_period)
+        for bar in df[['Close', 'High', 'Low', 'T.Shares']].to_dict('records'):
+            state.update(bar)
+        return state
@@ -18,6 +18,8 @@ def main():
         main_gui = MainGUI()
         # Assuming MainLogic needs a reference to MainGUI
         main_logic = MainLogic(main_gui)
+        # Quit the pooled browser sessions on exit
+        app.aboutToQuit.connect(main_logic.data_fetcher.close)
 
         # It's assumed that MainLogic will handle connections between MainGUI's signals and its own slots
 
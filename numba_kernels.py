@@ -0,0 +1,245 @@
+# Numba-compiled indicator kernels.
+#
+# The recursive and windowed parts of the indicators (Wilder RSI, the MACD
+# EMAs, the OBV running total and the stochastic's rolling minimum, maximum
+# and means) run as compiled loops over every column at once. Each loop is a
+# line-for-line port of the pandas rolling/ewm routine the NumPy kernels call,
+# so the results are the same to the last bit. Compiled code is cached next to
+# this module (cache=True), so only the first launch pays for compilation.
+#
+# Importing this module raises ImportError when Numba is not installed;
+# indicator_kernels.load_kernels then falls back to the NumPy kernels.
+import sys
+
+import numba
+import numpy as np
+import pandas as pd
+
+from indicator_kernels import _first_valid
+
+EPSILON = sys.float_info.epsilon
+
+# error_model='numpy' makes 0/0 return NaN, as it does in pandas; nogil lets
+# IndicatorScheduler's threads run kernels side by side
+jit = numba.njit(cache=True, nogil=True, error_model='numpy')
+
+
+def _alpha(com):
+    # pandas turns every ewm parameter into a centre of mass first
+    return 1.0 / (1.0 + com)
+
+
+@jit
+def _rolling_mean(values, window, min_periods):
+    # pandas' roll_mean: a running sum of the non-NaN values, Kahan-compensated
+    # separately for the values added and the values dropped, which leave the
+    # window before the new value joins it
+    rows, columns = values.shape
+    out = np.empty((rows, columns))
+    for column in range(columns):
+        total = 0.0
+        compensation_add = 0.0
+        compensation_remove = 0.0
+        count = 0
+        negatives = 0
+        same_values = 0
+        previous = values[0, column] if rows else np.nan
+        for row in range(rows):
+            if row >= window:
+                value = values[row - window, column]
+                if value == value:
+                    count -= 1
+                    y = -value - compensation_remove
+                    t = total + y
+                    compensation_remove = t - total - y
+                    total = t
+                    if np.signbit(value):
+                        negatives -= 1
+            value = values[row, column]
+            if value == value:
+                count += 1
+                y = value - compensation_add
+                t = total + y
+                compensation_add = t - total - y
+                total = t
+                if np.signbit(value):
+                    negatives += 1
+                if value == previous:
+                    same_values += 1
+                else:
+                    same_values = 1
+                previous = value
+            if count >= min_periods and count > 0:
+                result = total / count
+                if same_values >= count:
+                    result = previous
+                elif negatives == 0 and result < 0:
+                    result = 0.0
+                elif negatives == count and result > 0:
+                    result = 0.0
+                out[row, column] = result
+            else:
+                out[row, column] = np.nan
+    return out
+
+
+@jit
+def _rolling_extreme(values, window, maximum):
+    # Rolling minimum (or maximum) over full windows of non-NaN values
+    rows, columns = values.shape
+    out = np.empty((rows, columns))
+    for column in range(columns):
+        for row in range(rows):
+            result = np.nan
+            count = 0
+            for position in range(max(0, row - window + 1), row + 1):
+                value = values[position, column]
+                if value == value:
+                    if count == 0 or (value > result if maximum else value < result):
+                        result = value
+                    count += 1
+            out[row, column] = result if count >= window else np.nan
+    return out
+
+
+@jit
+def _ewm_mean(values, alpha, adjust, min_periods):
+    # pandas' ewm(...).mean() with ignore_na=False
+    rows, columns = values.shape
+    out = np.empty((rows, columns))
+    new_weight = 1.0 if adjust else alpha
+    decay = 1.0 - alpha
+    for column in range(columns):
+        if rows == 0:
+            continue
+        average = values[0, column]
+        count = 1 if average == average else 0
+        out[0, column] = average if count >= min_periods else np.nan
+        old_weight = 1.0
+        for row in range(1, rows):
+            value = values[row, column]
+            observed = value == value
+            if observed:
+                count += 1
+            if average == average:
+                old_weight *= decay
+                if observed:
+                    if average != value:
+                        average = old_weight * average + new_weight * value
+                        average /= old_weight + new_weight
+                    if adjust:
+                        old_weight += new_weight
+                    else:
+                        old_weight = 1.0
+            elif observed:
+                average = value
+            out[row, column] = average if count >= min_periods else np.nan
+    return out
+
+
+@jit
+def _rsi(close, alpha, length):
+    rows, columns = close.shape
+    gains = np.empty((rows, columns))
+    losses = np.empty((rows, columns))
+    gains[:1] = np.nan
+    losses[:1] = np.nan
+    for column in range(columns):
+        for row in range(1, rows):
+            change = close[row, column] - close[row - 1, column]
+            gains[row, column] = change if change >= 0 or change != change else 0.0
+            losses[row, column] = change if change <= 0 or change != change else 0.0
+    average_gain = _ewm_mean(gains, alpha, True, length)
+    average_loss = np.abs(_ewm_mean(losses, alpha, True, length))
+    return 100 * average_gain / (average_gain + average_loss)
+
+
+@jit
+def _stoch(high, low, close, k, d, smooth_k):
+    lowest_low = _rolling_extreme(low, k, False)
+    value_range = _rolling_extreme(high, k, True) - lowest_low
+    for column in range(value_range.shape[1]):
+        if np.any(value_range[:, column] == 0):
+            value_range[:, column] += EPSILON
+    stoch_k = _rolling_mean(100 * (close - lowest_low) / value_range, smooth_k, smooth_k)
+    return stoch_k, _rolling_mean(stoch_k, d, d)
+
+
+@jit
+def _obv(close, volume, first):
+    rows, columns = close.shape
+    out = np.empty((rows, columns))
+    for column in range(columns):
+        total = 0.0
+        for row in range(rows):
+            if row == first[column]:
+                sign = 1.0
+            elif row == 0:
+                sign = np.nan
+            else:
+                sign = np.sign(close[row, column] - close[row - 1, column])
+            value = volume[row, column] * sign
+            if value == value:
+                total += value
+                out[row, column] = total
+            else:
+                out[row, column] = np.nan
+    return out
+
+
+def _values(data):
+    return np.ascontiguousarray(data.to_numpy(dtype=float).reshape(len(data), -1))
+
+
+def _like(values, data):
+    if isinstance(data, pd.Series):
+        return pd.Series(values[:, 0], index=data.index, name=data.name)
+    return pd.DataFrame(values, index=data.index, columns=data.columns)
+
+
+def _ema(values, length):
+    # Seeded with the NumPy sum of the first ``length`` values of every column
+    # (pairwise, unlike a sequential loop), then ewm(span=length, adjust=False)
+    values = values.copy()
+    first = _first_valid(pd.DataFrame(values))
+    columns = np.flatnonzero(first + length <= len(values))
+    rows = first[columns][:, None] + np.arange(length)
+    seed = values[rows, columns[:, None]].sum(axis=1) / length
+    values[np.arange(len(values))[:, None] < (first + length - 1)] = np.nan
+    values[first[columns] + length - 1, columns] = seed
+    return _ewm_mean(values, _alpha((length - 1) / 2), False, 1)
+
+
+class NumbaKernels:
+    """
+    indicator_kernels' functions on the compiled loops above, for a Series or
+    a wide DataFrame with one column per ticker.
+    """
+
+    @staticmethod
+    def sma(close, length):
+        return _like(_rolling_mean(_values(close), length, length), close)
+
+    @staticmethod
+    def ema(close, length):
+        return _like(_ema(_values(close), length), close)
+
+    @staticmethod
+    def rsi(close, length=14):
+        return _like(_rsi(_values(close), _alpha((1 - 1.0 / length) / (1.0 / length)), length), close)
+
+    @staticmethod
+    def stoch(high, low, close, k=14, d=3, smooth_k=3):
+        stoch_k, stoch_d = _stoch(_values(high), _values(low), _values(close), k, d, smooth_k)
+        return _like(stoch_k, close), _like(stoch_d, close)
+
+    @staticmethod
+    def macd(close, fast=12, slow=26, signal=9):
+        macd_line = _ema(_values(close), fast) - _ema(_values(close), slow)
+        signal_line = _ema(macd_line, signal)
+        return (_like(macd_line, close), _like(signal_line, close),
+                _like(macd_line - signal_line, close))
+
+    @staticmethod
+    def obv(close, volume):
+        return _like(_obv(_values(close), _values(volume), _first_valid(close)), volume)
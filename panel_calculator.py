@@ -0,0 +1,158 @@
+# Cross-sectional batch calculations for many tickers at once.
+#
+# A panel holds one wide frame per OHLCV field with a column per ticker. Rows
+# are each ticker's own trading sessions, right-aligned so that the last row
+# is every ticker's latest bar and shorter histories are padded with NaN at
+# the top. Indicators are computed column-wise on the wide frames, so the
+# whole universe costs one pass per indicator instead of one per ticker.
+import numpy as np
+import pandas as pd
+
+from app_config import COMPACT_FRAMES, INDICATOR_BACKEND
+from compact_frame import compact_frame
+from indicator_kernels import load_kernels
+from data_calculator import DataCalculator
+from LoggerFunction import Logger
+
+PANEL_FIELDS = ['Close', 'High', 'Low', 'T.Shares']
+
+# pandas_ta works on one Series at a time, so panels use the NumPy kernels
+# unless the compiled ones are configured
+kernels = load_kernels('numba' if INDICATOR_BACKEND == 'numba' else 'numpy')
+
+
+def make_panel(frames, fields=PANEL_FIELDS):
+    """
+    Build a panel from ``{ticker: DataFrame}``. Returns a dict of wide frames,
+    one per field, indexed by bar position with one column per ticker.
+    """
+    tickers = list(frames)
+    length = max((len(frames[ticker]) for ticker in tickers), default=0)
+    panel = {}
+    for field in fields:
+        values = np.full((length, len(tickers)), np.nan)
+        for i, ticker in enumerate(tickers):
+            column = frames[ticker][field].to_numpy(dtype=float)
+            values[length - len(column):, i] = column
+        panel[field] = pd.DataFrame(values, columns=tickers)
+    return panel
+
+
+def calculate_panel_values(panel, sma_period=10):
+    """
+    Compute the DataCalculator indicator value columns for every ticker of
+    ``panel``. Returns ``{column: wide frame}`` with the same rounding as the
+    batch calculate_* methods.
+    """
+    close, high, low = panel['Close'], panel['High'], panel['Low']
+    volume = panel['T.Shares']
+    values = {}
+
+    # SMA
+    values['SMA'] = kernels.sma(close, sma_period).round(2)
+    for length in [10, 50, 200]:
+        values[f'SMA{length}'] = kernels.sma(close, length).round(2)
+
+    # RSI
+    for period in [9, 14, 25]:
+        values[f'RSI_{period}'] = kernels.rsi(close, period).round(2)
+
+    # Stochastic (9, 6, 3)
+    stoch_k, stoch_d = kernels.stoch(high, low, close, k=9, d=6)
+    values['STOCHk_9_6_3'] = stoch_k.round(2)
+    values['STOCHd_9_6_3'] = stoch_d.round(2)
+
+    # CMF
+    delta = (high - low).replace({0: 0.0001})
+    money_flow = ((close - low) - (high - close)) / delta * volume
+    values['CMF_20'] = (money_flow.rolling(window=20).sum() /
+                        volume.rolling(window=20).sum()).round(2)
+
+    # MACD
+    macd, signal, histogram = kernels.macd(close, 12, 26, 9)
+    values['MACD_12_26_9'] = macd.round(2)
+    values['MACDs_12_26_9'] = signal.round(2)
+    values['MACDh_12_26_9'] = histogram.round(2)
+
+    # OBV, with the first bar of every ticker counted as a rise
+    values['OBV'] = kernels.obv(close, volume)
+    values['OBV_SMA'] = values['OBV'].rolling(window=20).mean()
+    return values
+
+
+class PanelCalculator:
+    """
+    Runs the DataCalculator pipeline over a whole universe of tickers. The
+    indicator values come from calculate_panel_values; the flags,
+    descriptions and signal counts are computed once over all tickers
+    stacked in one long frame, using the DataCalculator interpretation
+    methods.
+    """
+
+    def __init__(self, data_calculator=None):
+        self.logger = Logger()
+        self.data_calculator = data_calculator or DataCalculator()
+
+    def calculate(self, frames):
+        """
+        Calculate every indicator for ``{ticker: DataFrame}`` and return
+        ``{ticker: calculated DataFrame}``, matching what the calculate_*
+        methods produce for each frame on its own.
+        """
+        try:
+            frames = {ticker: df for ticker, df in frames.items()
+                      if df is not None and len(df) > 0}
+            if not frames:
+                return {}
+            panel = make_panel(frames)
+            values = calculate_panel_values(panel)
+
+            # Stack the tickers with one NaN row in front of each, so the
+            # shift/diff based flags never look back into another ticker
+            lengths = np.array([len(df) for df in frames.values()])
+            rows = np.arange(len(panel['Close']) + 1)[:, None] >= (
+                len(panel['Close']) - lengths)
+
+            def stack(wide):
+                data = wide.to_numpy(dtype=float)
+                data = np.vstack([np.full((1, data.shape[1]), np.nan), data])
+                return data.T[rows.T]
+
+            long_df = pd.DataFrame({field: stack(panel[field])
+                                    for field in ['Close', 'High', 'Low']})
+
+            calculator = self.data_calculator
+            for column in ['SMA', 'SMA10', 'SMA50', 'SMA200']:
+                long_df[column] = stack(values[column])
+            long_df = calculator.add_sma_interpretations(long_df)
+            for period in [9, 14, 25]:
+                long_df[f'RSI_{period}'] = stack(values[f'RSI_{period}'])
+                long_df = calculator.add_rsi_interpretations(long_df, period)
+            for column in ['STOCHk_9_6_3', 'STOCHd_9_6_3']:
+                long_df[column] = stack(values[column])
+            long_df = calculator.add_stochastic_interpretations(long_df)
+            long_df['CMF_20'] = stack(values['CMF_20'])
+            long_df = calculator.add_cmf_interpretations(long_df)
+            for column in ['MACD_12_26_9', 'MACDs_12_26_9', 'MACDh_12_26_9']:
+                long_df[column] = stack(values[column])
+            long_df = calculator.add_macd_interpretations(long_df)
+            for column in ['OBV', 'OBV_SMA']:
+                long_df[column] = stack(values[column])
+            long_df = calculator.add_obv_interpretations(long_df)
+            long_df = calculator.calculate_signal_totals(long_df)
+
+            # Split the stacked frame back into one frame per ticker
+            long_df = long_df.drop(columns=['Close', 'High', 'Low']).copy()
+            ends = np.cumsum(lengths + 1)
+            calculated = {}
+            for (ticker, df), end, length in zip(frames.items(), ends, lengths):
+                ticker_rows = long_df.iloc[end - length:end]
+                ticker_rows.index = df.index
+                calculated[ticker] = pd.concat([df, ticker_rows], axis=1)
+                if COMPACT_FRAMES:
+                    calculated[ticker] = compact_frame(calculated[ticker], keep=df.columns)
+            return calculated
+        except Exception as e:
+            self.logger.log_or_print(
+                f"An error occurred in PanelCalculator.calculate: {str(e)}", level="ERROR", exc_info=True)
+            return {}
@@ -0,0 +1,261 @@
+# Background fetch -> calculate -> plot pipeline for one ticker.
+#
+# The worker runs on a QThreadPool thread so the window stays responsive while
+# Selenium pages through the history. Each stage hands its result back once,
+# through a signal that Qt queues onto the GUI thread. BatchWorker does the
+# same for a list of tickers, calculating each one as soon as its fetch
+# finishes while BatchFetcher's threads fetch the others. ChartWorker adds
+# the indicators a chart needs to a frame already fetched.
+import threading
+
+import pandas as pd
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from app_config import FETCH_WORKERS
+from batch_fetcher import BatchFetcher
+from compact_frame import expand_frame
+from LoggerFunction import Logger
+
+PIPELINE_STAGES = ['Fetching', 'Calculating', 'Plotting']
+
+
+def calculate_frame(data_calculator, ticker, df, logger, remember=True):
+    # Returns the calculated frame and the column blocks added to ``df``.
+    # Only the new trading days need calculating when the fetched data
+    # continues the history calculated for this ticker last time. Without
+    # ``remember`` the frame is not kept in memory for that
+    extended_df = data_calculator.extend_calculations(ticker, df) if remember else None
+    if extended_df is not None:
+        logger.log_or_print(
+            f"PipelineWorker: Indicators for {ticker} extended with the new rows only.", level="INFO", module="PipelineWorker")
+        # Not stored on disk: the extended values carry the warm-up of the
+        # remembered history, so they can differ from a calculation of df
+        new_columns = extended_df.columns.difference(df.columns, sort=False)
+        return extended_df, {'Extended': extended_df[new_columns]}
+    # Unchanged data calculated in an earlier session is on disk
+    cached_df = data_calculator.load_cached_calculations(ticker, df)
+    if cached_df is not None:
+        logger.log_or_print(
+            f"PipelineWorker: Indicators for {ticker} loaded from the indicator cache.", level="INFO", module="PipelineWorker")
+        if remember:
+            data_calculator.remember_calculations(ticker, cached_df)
+        new_columns = cached_df.columns.difference(df.columns, sort=False)
+        return cached_df, {'Cached': cached_df[new_columns]}
+    blocks = data_calculator.calculate_blocks(df)
+    calculated_df = data_calculator.merge_blocks(df, blocks)
+    if remember:
+        data_calculator.remember_calculations(ticker, calculated_df)
+    data_calculator.store_calculations(ticker, df, calculated_df)
+    return calculated_df, blocks
+
+
+class PipelineSignals(QObject):
+    # QRunnable is not a QObject, so the worker's signals live here
+    progress = pyqtSignal(str, int)  # stage name, percent of the pipeline done
+    fetched = pyqtSignal(str, pd.DataFrame)  # ticker, raw frame
+    calculated = pyqtSignal(dict, dict)  # new column blocks, latest values
+    plotted = pyqtSignal(object)  # plotly figure
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+
+class PipelineWorker(QRunnable):
+    """
+    Fetch ``ticker``, calculate its indicators and plot the chart. ``cancel``
+    may be called from any thread; the worker stops before the next stage or
+    the next fetched page and emits ``cancelled`` instead of further results.
+    """
+
+    def __init__(self, ticker, desired_rows, data_fetcher, data_calculator, data_visualizer):
+        super().__init__()
+        self.ticker = ticker
+        self.desired_rows = desired_rows
+        self.data_fetcher = data_fetcher
+        self.data_calculator = data_calculator
+        self.data_visualizer = data_visualizer
+        self.signals = PipelineSignals()
+        self.logger = Logger()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def _start_stage(self, stage):
+        if self.is_cancelled():
+            return False
+        self.signals.progress.emit(
+            stage, int(100 * PIPELINE_STAGES.index(stage) / len(PIPELINE_STAGES)))
+        return True
+
+    def calculate(self, df):
+        return calculate_frame(self.data_calculator, self.ticker, df, self.logger)
+
+    def run(self):
+        try:
+            if not self._start_stage('Fetching'):
+                return
+            df = self.data_fetcher.fetch_data(
+                self.ticker, self.desired_rows, should_cancel=self.is_cancelled)
+            if self.is_cancelled():
+                return
+            if df is None:
+                self.signals.failed.emit(
+                    f"Fetching {self.ticker} returned no data.")
+                return
+            self.signals.fetched.emit(self.ticker, df)
+
+            if not self._start_stage('Calculating'):
+                return
+            # Only the new columns travel back; MainLogic merges them into
+            # the frame it received with the fetch stage
+            df, blocks = self.calculate(df)
+            latest_values = self.data_calculator.latest_values(df)
+            if self.is_cancelled():
+                return
+            self.signals.calculated.emit(blocks, latest_values)
+
+            if not self._start_stage('Plotting'):
+                return
+            # plot_candlestick_chart drops NaN rows in place; plot a copy so
+            # the frame remembered for the next extension is left alone
+            fig = self.data_visualizer.plot_candlestick_chart(df.copy())
+            if self.is_cancelled():
+                return
+            self.signals.plotted.emit(fig)
+            self.signals.progress.emit('Done', 100)
+        except Exception as e:
+            self.logger.log_or_print(
+                f"PipelineWorker: Error while processing {self.ticker}: {str(e)}", level="ERROR", module="PipelineWorker", exc_info=True)
+            self.signals.failed.emit(str(e))
+        finally:
+            if self.is_cancelled():
+                self.logger.log_or_print(
+                    f"PipelineWorker: Processing of {self.ticker} cancelled.", level="INFO", module="PipelineWorker")
+                self.signals.cancelled.emit()
+            self.signals.finished.emit()
+
+
+class ChartSignals(QObject):
+    plotted = pyqtSignal(object)  # plotly figure
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class ChartWorker(QRunnable):
+    """
+    Calculate the INDICATOR_GRAPH ``nodes`` of the fetched ``price_df`` that
+    the chart ``indicators`` still need, then plot ``df`` with them. The
+    calculation goes through ``data_calculator``, a QtDataCalculator, whose
+    calculations_complete_signal hands the blocks to MainLogic. Start it on
+    the pipeline's single-thread pool, so it never shares the calculator
+    with a running PipelineWorker; a worker cancelled before it starts does
+    nothing.
+    """
+
+    def __init__(self, df, price_df, nodes, indicators, data_calculator, data_visualizer):
+        super().__init__()
+        self.df = df
+        self.price_df = price_df
+        self.nodes = nodes
+        self.indicators = indicators
+        self.data_calculator = data_calculator
+        self.data_visualizer = data_visualizer
+        self.signals = ChartSignals()
+        self.logger = Logger()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            if self.is_cancelled():
+                return
+            df = expand_frame(self.df)
+            if self.nodes:
+                blocks = self.data_calculator.calculate_blocks(self.price_df, self.nodes)
+                df = self.data_calculator.merge_blocks(df, blocks)
+            else:
+                # plot_candlestick_chart drops NaN rows in place
+                df = df.copy()
+            self.signals.plotted.emit(
+                self.data_visualizer.plot_candlestick_chart(df, indicators=self.indicators))
+        except Exception as e:
+            self.logger.log_or_print(
+                f"ChartWorker: Error while updating the chart: {str(e)}", level="ERROR", module="ChartWorker", exc_info=True)
+            self.signals.failed.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+class BatchSignals(QObject):
+    progress = pyqtSignal(int, int)  # tickers done, tickers in the batch
+    calculated = pyqtSignal(str, dict)  # ticker, latest indicator values
+    failed = pyqtSignal(str, str)  # ticker, message
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+
+class BatchWorker(QRunnable):
+    """
+    Fetch ``tickers`` concurrently and calculate every fetched frame, in the
+    order the fetches finish. Only the latest values of each ticker are
+    emitted and no frame is kept, so a whole-universe run holds one frame
+    at a time. ``data_calculator`` should be the batch's own: the batch
+    runs alongside the single-ticker pipeline. Charts are left to that
+    pipeline.
+    """
+
+    def __init__(self, tickers, desired_rows, data_fetcher, data_calculator, workers=FETCH_WORKERS):
+        super().__init__()
+        self.tickers = list(tickers)
+        self.desired_rows = desired_rows
+        self.batch_fetcher = BatchFetcher(data_fetcher, workers)
+        self.data_calculator = data_calculator
+        self.signals = BatchSignals()
+        self.logger = Logger()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        done = 0
+        try:
+            for ticker, df in self.batch_fetcher.fetch(self.tickers, self.desired_rows,
+                                                       should_cancel=self.is_cancelled):
+                done += 1
+                try:
+                    if df is None:
+                        self.signals.failed.emit(ticker, f"Fetching {ticker} returned no data.")
+                    else:
+                        calculated_df, _ = calculate_frame(self.data_calculator, ticker, df, self.logger,
+                                                           remember=False)
+                        self.signals.calculated.emit(
+                            ticker, self.data_calculator.latest_values(calculated_df))
+                except Exception as e:
+                    self.logger.log_or_print(
+                        f"BatchWorker: Error while calculating {ticker}: {str(e)}", level="ERROR", module="BatchWorker", exc_info=True)
+                    self.signals.failed.emit(ticker, str(e))
+                self.signals.progress.emit(done, len(self.tickers))
+                if self.is_cancelled():
+                    break
+        except Exception as e:
+            self.logger.log_or_print(
+                f"BatchWorker: Error while fetching the batch: {str(e)}", level="ERROR", module="BatchWorker", exc_info=True)
+        finally:
+            if self.is_cancelled():
+                self.logger.log_or_print(
+                    f"BatchWorker: Batch cancelled after {done} of {len(self.tickers)} tickers.", level="INFO", module="BatchWorker")
+                self.signals.cancelled.emit()
+            self.signals.finished.emit()
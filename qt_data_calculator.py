@@ -0,0 +1,43 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from data_calculator import DataCalculator
+
+
+class QtDataCalculator(QObject):
+    """
+    Qt adapter around DataCalculator: runs the calculations and emits the
+    new column blocks once, on calculations_complete_signal, for MainLogic
+    to merge into its frame.
+    """
+    # {node: column block} of the calculated INDICATOR_GRAPH nodes
+    calculations_complete_signal = pyqtSignal(dict)
+
+    def __init__(self, calculator=None):
+        super().__init__()
+        self.calculator = calculator or DataCalculator()
+
+    def calculate_blocks(self, df, nodes=None):
+        blocks = self.calculator.calculate_blocks(df, nodes)
+        self.calculations_complete_signal.emit(blocks)
+        return blocks
+
+    # Calculations without a signal return their result directly
+    def merge_blocks(self, df, blocks):
+        return self.calculator.merge_blocks(df, blocks)
+
+    def calculate_signal_totals(self, df):
+        return self.calculator.calculate_signal_totals(df)
+
+    def latest_values(self, df):
+        return self.calculator.latest_values(df)
+
+    def load_cached_calculations(self, ticker, df):
+        return self.calculator.load_cached_calculations(ticker, df)
+
+    def store_calculations(self, ticker, df, calculated):
+        return self.calculator.store_calculations(ticker, df, calculated)
+
+    def remember_calculations(self, ticker, df):
+        return self.calculator.remember_calculations(ticker, df)
+
+    def extend_calculations(self, ticker, df):
+        return self.calculator.extend_calculations(ticker, df)
@@ -0,0 +1,102 @@
+# Market-wide screener over the cached raw_{ticker}.csv files.
+#
+# The tickers are split into chunks that are calculated in a process pool,
+# one PanelCalculator run per chunk, and the latest indicator values of every
+# ticker are collected into one ranked table.
+import glob
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from LoggerFunction import Logger
+
+RAW_FILE_PREFIX = "raw_"
+
+# Best first: most buy signals, then fewest sell signals
+DEFAULT_RANKING = [('Total_Buy_Count', False), ('Total_Sell_Count', True)]
+
+
+def cached_tickers(directory=None):
+    directory = directory or os.getcwd()
+    paths = glob.glob(os.path.join(directory, f"{RAW_FILE_PREFIX}*.csv"))
+    return sorted(os.path.basename(path)[len(RAW_FILE_PREFIX):-len(".csv")]
+                  for path in paths)
+
+
+def load_raw_frame(ticker, directory=None):
+    directory = directory or os.getcwd()
+    df = pd.read_csv(os.path.join(directory, f"{RAW_FILE_PREFIX}{ticker}.csv"))
+    df['Date'] = pd.to_datetime(df['Date'])
+    df = df.drop_duplicates(subset='Date', keep='first')
+    return df.sort_values(by='Date', ascending=True).reset_index(drop=True)
+
+
+def _screen_chunk(tickers, directory):
+    # Runs in a worker process; returns one row of latest values per ticker
+    from panel_calculator import PanelCalculator
+
+    logger = Logger()
+    frames = {}
+    for ticker in tickers:
+        try:
+            frames[ticker] = load_raw_frame(ticker, directory)
+        except Exception as e:
+            logger.log_or_print(
+                f"Screener: could not load {ticker}: {str(e)}", level="WARNING", module="Screener")
+
+    panel_calculator = PanelCalculator()
+    rows = []
+    for ticker, df in panel_calculator.calculate(frames).items():
+        row = {'Ticker': ticker, 'Date': df['Date'].iloc[-1]}
+        row.update(panel_calculator.data_calculator.latest_values(df))
+        rows.append(row)
+    return rows
+
+
+def screen_universe(tickers=None, directory=None, workers=None, ranking=DEFAULT_RANKING):
+    """
+    Calculate every cached ticker (or ``tickers``) across ``workers``
+    processes and return a table of their latest indicator values, ranked by
+    ``ranking`` (a list of ``(column, ascending)`` pairs).
+    """
+    logger = Logger()
+    directory = directory or os.getcwd()
+    tickers = list(tickers) if tickers is not None else cached_tickers(directory)
+    if not tickers:
+        logger.log_or_print(
+            f"Screener: no {RAW_FILE_PREFIX}*.csv files in {directory}.", level="WARNING", module="Screener")
+        return pd.DataFrame()
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        rows = _screen_chunk(tickers, directory)
+    else:
+        # A few chunks per worker keeps the pool busy while each chunk stays
+        # large enough for the panel calculations to pay off
+        chunk_size = max(1, math.ceil(len(tickers) / (workers * 4)))
+        chunks = [tickers[i:i + chunk_size]
+                  for i in range(0, len(tickers), chunk_size)]
+        rows = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_rows in executor.map(_screen_chunk, chunks, [directory] * len(chunks)):
+                rows.extend(chunk_rows)
+
+    table = pd.DataFrame(rows)
+    if table.empty:
+        return table
+    columns = [column for column, _ in ranking]
+    table = table.sort_values(by=columns, ascending=[ascending for _, ascending in ranking],
+                              na_position='last', kind='stable').reset_index(drop=True)
+    table.insert(0, 'Rank', range(1, len(table) + 1))
+    logger.log_or_print(
+        f"Screener: ranked {len(table)} of {len(tickers)} tickers.", level="INFO", module="Screener")
+    return table
+
+
+if __name__ == "__main__":
+    table = screen_universe(directory=sys.argv[1] if len(sys.argv) > 1 else None)
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(table.to_string(index=False))
@@ -0,0 +1,421 @@
+import numpy as np
+import pandas as pd
+
+# Shared text table for the *_Desc columns produced by DataCalculator.
+# Each rule lists its texts in the order its conditions are evaluated, with
+# the fallback text last. Description columns only store small category codes
+# into these tuples; the full text is resolved when a row is read.
+DESCRIPTION_TEXTS = {
+    'Golden_Death_Cross_Desc': (
+        "Buy, Golden Cross Detected: The shorter-term SMA50 has crossed above the longer-term SMA200, a bullish signal. "
+        "Historically, this pattern indicates the early stages of a prolonged bull market. Interpretation: The asset's price might rise, suggesting a favorable time to buy or add to your position.",
+        "Sell, Death Cross Detected: The shorter-term SMA50 has crossed below the longer-term SMA200, a bearish signal. "
+        "This pattern often precedes a forthcoming bear market or a prolonged period of selling. Interpretation: Exercise caution, consider reducing exposure, or hedge against losses.",
+        "Neutral, No Significant Cross Detected: The market shows no clear bullish or bearish signals at the moment. "
+        "This can indicate a period of consolidation or sideways movement. Interpretation: Monitor other indicators, stay updated with market news, and maintain a diversified strategy.",
+    ),
+    'Price_SMA10_Crossover_Desc': (
+        "Buy, Price Crossed Above SMA10: The asset's price has surged above its 10-period average. "
+        "This upward crossover is historically a sign of short-term bullish momentum. Interpretation: It might be an opportunity to capitalize on the momentum, but also consider other indicators for confirmation.",
+        "Sell, Price Crossed Below SMA10: The asset's price is dipping below its recent 10-period average. "
+        "This can hint at a short-term decline or a potential pullback. Interpretation: It might be wise to exercise caution, adjust strategies, or set stop losses.",
+        "Neutral, Price Oscillating Around SMA10: The asset's price is weaving around its 10-period average, indicating market indecision. "
+        "This pattern could be a sign of consolidation. Interpretation: Stay alert, monitor other indicators, and be ready for a potential breakout.",
+    ),
+    'Price_Crossover_Desc': (
+        "Buy, Price Crossed Above SMA50: The asset's price has risen above its 50-period average, indicating bullish momentum. "
+        "Historically, prices above the SMA50 suggest positive market sentiment. Interpretation: It might be a favorable time to enter or add to bullish positions.",
+        "Sell, Price Crossed Below SMA50: The asset's price has dropped below its 50-period average, signaling bearish momentum. "
+        "This could indicate a potential downtrend or weakening price strength. Interpretation: It's wise to exercise caution, possibly re-evaluate positions or set stop losses.",
+        "Neutral, Price Moving with SMA50: The asset's price is in line with its 50-period average, suggesting market equilibrium. "
+        "This pattern might point to consolidation, where neither buyers nor sellers dominate. Interpretation: Monitor other indicators, stay updated with news, and maintain a balanced strategy.",
+    ),
+    'Price_SMA200_Crossover_Desc': (
+        "Buy, Price Crossed Above SMA200, "
+        "The asset's price has surpassed its long-term 200-period average, signaling a notable bullish trend. Historically, an ascent above the SMA200 has been associated with bullish market sentiment, "
+        "This might be a robust indication of the asset's potential, suggesting consideration for long-term investment.",
+        "Sell, Price Crossed Below SMA200, "
+        "The asset's price has dropped below its long-term 200-period average, indicating a potential prolonged bearish phase. This descent is a cautionary signal of a possible extended bearish trend, "
+        "Investors should be cautious, think about diversifying, or explore hedging options.",
+        "Neutral, Price Oscillating Near SMA200, "
+        "The asset's price is closely aligned with its 200-period average, suggesting equilibrium between buying and selling forces. This balance might indicate a consolidation phase, "
+        "In such scenarios, a wait-and-observe approach could be beneficial, while awaiting stronger market cues.",
+    ),
+    'SMA10_SMA200_Crossover_Desc': (
+        "Buy, Golden Cross Detected Between SMA10 and SMA200, "
+        "The shorter-term SMA10 has surpassed the longer-term SMA200, often interpreted as a bullish signal hinting at a potential long-term upward trajectory. Historically, the 'Golden Cross' has signified the onset of extended bullish phases, "
+        "This event can be perceived as a positive sign for long-term investments, but it's recommended to cross-reference with other indicators.",
+        "Sell, Death Cross Detected Between SMA10 and SMA200, "
+        "The shorter-term SMA10 has descended below the longer-term SMA200, commonly viewed as a bearish sign suggesting a potential prolonged downtrend. Historically, the 'Death Cross' has been a harbinger of extended bear markets, "
+        "Investors should contemplate re-evaluating their positions, potentially adopting defensive strategies or considering hedging measures.",
+        "Neutral, SMA10 Oscillating Near SMA200, "
+        "Both the short-term and long-term moving averages are moving in tandem, indicating a period of balanced market momentum. This behavior suggests a possible phase of market consolidation or equilibrium, "
+        "Awaiting a breakout from this pattern might provide pivotal insights into the forthcoming market direction.",
+    ),
+    'SMA_Slopes_Desc': (
+        "Buy, SMA10 Trending Upwards, "
+        "The recent price movements of the asset are favorable, which may indicate short-term bullish momentum. "
+        "For traders focused on short-term movements, this could be a cue to monitor the asset more closely, anticipating potential opportunities.",
+        "Buy, SMA50 Trending Upwards, "
+        "The asset's price showcases strength in the medium term, possibly hinting at sustained bullish momentum. "
+        "A rising SMA50 often suggests the asset might be on an uptrend, which can be interpreted as a favorable sign for medium-term investment strategies.",
+        "Buy, SMA200 Trending Upwards, "
+        "The SMA200, representing long-term trends, is on the rise, often interpreted as a sign of a long-term bullish trend. "
+        "This trend can be a strong indication of the asset's overall health in the broader market, potentially signaling positive prospects for long-term investors.",
+        "Neutral, No Strong Upward Momentum in SMAs Detected, "
+        "The asset's short, medium, and long-term Simple Moving Averages (SMAs) aren't displaying significant upward trends. "
+        "This pattern could hint at a phase of market consolidation or a potential downturn, suggesting a cautious approach and monitoring of other market indicators.",
+    ),
+    'Price_Distance_SMA10_Desc': (
+        "Buy, Short-Term Bullish Momentum, "
+        "The asset's current price is above its short-term average, indicating bullish momentum. "
+        "If the price difference from the SMA10 is substantial, it might be nearing overbought conditions, suggesting the need to monitor for possible retracements.",
+        "Sell, Short-Term Bearish Momentum, "
+        "The asset's price is below its short-term average, signaling potential bearish momentum. "
+        "A significant negative difference from the SMA10 could hint at the asset being oversold, potentially offering a buying opportunity in the near future.",
+        "Neutral, Asset Price Near SMA10, "
+        "The asset's price is trading around its short-term average, indicating a balanced or consolidating market condition. "
+        "In such scenarios, it's often beneficial to monitor other indicators and market news for clearer direction.",
+    ),
+    'Price_Distance_SMA50_Desc': (
+        "Buy, Medium-Term Bullish Trend, "
+        "The asset's price is above its medium-term average, suggesting a bullish momentum. "
+        "While consistent trading above the SMA50 can denote strength, significant deviations might point towards overvaluation, warranting a more cautious approach.",
+        "Sell, Medium-Term Bearish Trend, "
+        "The asset's price is below its medium-term average, which can be an indication of bearish sentiment. "
+        "Trading considerably below the SMA50 might imply a sustained bearish phase or a potential undervalued state, which could be an opportunity for value investors.",
+        "Neutral, Near Medium-Term Average, "
+        "The asset's price is oscillating around its medium-term average, suggesting potential consolidation or a period of sideways trading. "
+        "In such phases, observing other technical indicators and market news can provide additional insights.",
+    ),
+    'Price_Distance_SMA200_Desc': (
+        "Buy, Long-Term Bullish Trend, "
+        "The asset's price is trading above its long-term average. "
+        "Being above the SMA200 generally signifies a strong market. However, significant deviations might suggest overextended rallies or bubbles, so it's advisable to tread cautiously.",
+        "Sell, Long-Term Bearish Trend, "
+        "The asset's price is trading below its long-term average. "
+        "Consistently trading below the SMA200 can be a cause for concern. On the flip side, extreme undervaluation might signal a buying opportunity.",
+        "Neutral, In Line With Long-Term Average, "
+        "The asset's price is hovering around its long-term average. "
+        "Such conditions denote stability and the lack of strong long-term biases, suggesting the need to monitor other market indicators for a clearer picture.",
+    ),
+    'SMA_Relationship_10_50_Desc': (
+        "Buy, Positive Short to Medium-Term Momentum, "
+        "The short-term average (SMA10) is currently above the medium-term average (SMA50), suggesting bullish momentum in the market. "
+        "While this might be seen as a favorable time to buy or hold positions, it's crucial to monitor other market indicators to ensure this isn't a fleeting upward spike.",
+        "Sell, Negative Short to Medium-Term Momentum, "
+        "The short-term average (SMA10) is trading below the medium-term average (SMA50), indicating potential bearish momentum. "
+        "Investors might want to exercise caution, possibly re-evaluating their positions or looking for a more opportune entry point. Adopting defensive strategies or considering hedging options might be wise.",
+    ),
+    'SMA_Relationship_50_200_Desc': (
+        "Buy, Strong Medium to Long-Term Bullish Trend, "
+        "The medium-term average (SMA50) is currently positioned above the long-term average (SMA200), signifying a dominant bullish trend in the market. "
+        "Historically, this pattern is seen as an indicator of a continuing upward market trajectory. However, it's essential to remain vigilant and monitor other market indicators to anticipate any sudden shifts or volatilities.",
+        "Sell, Potential Medium to Long-Term Downtrend, "
+        "The medium-term average (SMA50) is below the long-term average (SMA200), hinting at a potential bearish trend in the market. "
+        "This configuration might be a signal for investors to reassess their market stance, possibly considering defensive measures or reducing exposure. As always, integrating insights from other market indicators and the broader market context is advisable before finalizing decisions.",
+    ),
+    'RSI_Overbought_Oversold_Desc': (
+        "Sell, Overbought Territory, "
+        "The RSI value is currently above 70, indicating that the asset may be overbought. Historically, an RSI value remaining above this level might suggest an impending downward correction. "
+        "Although this can serve as a cautionary signal for investors, it's imperative to integrate insights from other technical indicators and market news before making investment decisions.",
+        "Buy, Oversold Territory, "
+        "The RSI value is below 30, which typically suggests that the asset may be undervalued or oversold. Assets with prolonged periods in this zone might be gearing up for a rebound. "
+        "While this can be seen as a potential buying opportunity, it's essential to be wary of false positives or 'bear traps'. Augmenting this analysis with other indicators and staying updated with market news is crucial.",
+        "Neutral, Neutral RSI Territory, "
+        "The RSI value lies between 30 and 70, indicating that the asset is neither overbought nor oversold. In such situations, it's beneficial for investors to monitor other market signals and trends. "
+        "Maintaining a diversified strategy and staying informed can provide a competitive edge.",
+    ),
+    'RSI_Divergence_Desc': (
+        "Buy, Bullish Divergence, "
+        "The current price trend is making a lower low, but the RSI is observing a higher low. This divergence often indicates a slowing selling momentum despite the dropping price. "
+        "Historically, such patterns have been associated with potential upward price reversals. As a possible turning point, investors might want to closely monitor for additional buy signals while also considering other technical indicators and market updates.",
+        "Sell, Bearish Divergence, "
+        "The price trend is achieving a higher high, whereas the RSI is only reaching a lower high. This divergence can indicate a weakening buying momentum even as the price continues to rise. "
+        "Historically, such scenarios may hint at upcoming price declines. Investors might interpret this as a sign to reassess their positions, look out for potential sell signals, and also factor in insights from other technical indicators and market news.",
+        "Neutral, No Divergence Detected, "
+        "Both the price and the RSI are synchronously moving, suggesting a consistent trend. Such a movement usually signifies that the prevailing trend, be it bullish or bearish, remains solid. "
+        "In such scenarios, it's beneficial to stay updated with other market indicators and relevant news.",
+    ),
+    'RSI_Swings_Desc': (
+        "Buy, Bullish Swing Potential, "
+        "The RSI has just surpassed the 30 mark, often viewed as a hint of a potential upward reversal from a prior downtrend. "
+        "Such movements suggest the ebbing of selling pressure, possibly paving the way for rising momentum. Investors might interpret this as an early buying cue but should seek corroborative evidence from other technical indicators and pertinent market news.",
+        "Sell, Bearish Swing Potential, "
+        "The RSI has recently descended below the 70 threshold, hinting at a possible wane in the asset's preceding uptrend and signaling a potential price retraction or flip. "
+        "This might be a juncture for investors to exercise prudence, re-evaluate their positions, and be on the lookout for potential exit points. As always, juxtaposing this with other technical signals and tracking overarching market trends is crucial.",
+        "Neutral, Stable RSI Trajectory, "
+        "At present, the RSI is not indicating any pronounced swings, showcasing neither a clear bullish nor bearish inclination. In such states, investors might benefit from a vigilant stance, tracking other technical patterns, and staying abreast of market dynamics.",
+    ),
+    'STOCH_Overbought/Oversold_Desc': (
+        "Sell, Overbought Condition, "
+        "The Stochastic Oscillator is signaling that the asset may be trading at a price significantly higher than its intrinsic value. "
+        "Historical data often indicates that such conditions can lead to potential price retractions or reversals. Action: Investors might consider taking profits, setting tighter stop-loss levels, or watching for signs of a trend reversal, ensuring to validate with other indicators and stay updated on market news.",
+        "Buy, Oversold Condition, "
+        "The Stochastic Oscillator suggests the asset could be trading at a price notably lower than its perceived value. "
+        "Such readings often imply a possible upward price correction or reversal in the near future. Action: Investors might view this as an opportunity to buy, especially if they have confidence in the asset's fundamentals. However, ensuring the oversold condition isn't due to intrinsic problems with the asset is crucial. It's always wise to cross-check with other indicators and monitor relevant news.",
+        "Neutral, Stable Stochastic Range, "
+        "The Stochastic Oscillator indicates that the asset's price movement is within its typical range, not showing clear overbought or oversold signs. "
+        "This suggests a phase of balance in the market. Action: Investors should keep a close eye on other technical patterns, be ready for emerging trends, and stay informed on market news.",
+    ),
+    'STOCH_Divergence_Desc': (
+        "Buy, Bullish Divergence Detected, "
+        "The Stochastic Oscillator is highlighting a bullish divergence where the asset's price is recording new lows but the momentum indicator isn't. "
+        "Historically, this indicates potential weakening of the bearish trend, possibly hinting at a future upside reversal. Action: Investors might consider this as an opportunity to buy or to hold off from selling. It's essential to validate this signal with other indicators and ensure the asset's fundamentals align with a bullish perspective.",
+        "Sell, Bearish Divergence Detected, "
+        "The Stochastic Oscillator is showcasing a bearish divergence; while the asset's price is achieving new highs, the momentum indicator isn't keeping up. "
+        "This often suggests a potential decline in bullish momentum and could foretell a bearish price reversal. Action: Investors might think about realizing profits, setting tighter stop-loss levels, or preparing for a potential short position. It's crucial to corroborate this signal with other technical patterns and to be aware of any asset-related news.",
+        "Neutral, No Divergence Observed, "
+        "The Stochastic Oscillator doesn't pinpoint any significant divergence between the asset's price and its momentum at the moment. "
+        "This typically means the ongoing trend, whether bullish or bearish, may continue. Action: Investors should stay vigilant, observe other market signals, and be ready for potential emerging divergences.",
+    ),
+    'STOCH_Swings_Desc': (
+        "Buy, Bullish Crossover Detected, "
+        "The Stochastic Oscillator has showcased a bullish crossover with the %K line moving above the %D line, indicating a potential upward shift in momentum. "
+        "Historically, this hints at a potential buying opportunity, especially if the crossover occurred in oversold conditions. Action: Investors might consider entering a long position, but it's essential to validate this signal with other indicators and market news.",
+        "Sell, Bearish Crossover Detected, "
+        "The Stochastic Oscillator points to a bearish crossover, with the %K line moving below the %D line, suggesting possible bearish momentum. "
+        "If this crossover took place in the overbought region, it could strengthen the case for a potential pullback. Action: Investors might think about realizing profits or preparing for a potential short entry. Always cross-reference this signal with other technical indicators and current market conditions.",
+        "Buy, Midpoint Bullish Momentum, "
+        "The Stochastic Oscillator has risen above the midpoint (50), implying a surge in bullish momentum. "
+        "Historically, this indicates the asset is gaining strength. Action: Investors might view this as a potential buying opportunity, especially if other technical patterns support this bullish view.",
+        "Sell, Midpoint Bearish Momentum, "
+        "The Stochastic Oscillator has dipped below the midpoint (50), indicating potential bearish momentum. "
+        "This could suggest the asset's strength is waning. Action: Investors should consider reviewing their positions, potentially looking for exit points or short-selling opportunities if other indicators support this bearish perspective.",
+        "Neutral, No Significant Swings Observed, "
+        "The Stochastic Oscillator hasn't pinpointed any notable swings or crossovers, suggesting the asset might be consolidating or the current trend could persist without robust momentum shifts. "
+        "Action: Investors should adopt a balanced approach, keep an eye on other technical signals, and stay updated with market news.",
+    ),
+    'CMF_Value_Range_Desc': (
+        "Buy, Bullish CMF Value Detected, "
+        "The Chaikin Money Flow (CMF) value is in the positive range, indicating that buying pressure has been dominant over the defined period. "
+        "Historically, a positive CMF suggests a bullish sentiment in the market. Action: Consider potential long positions or holding current longs. As always, corroborate with other technical indicators before making any decisions.",
+        "Sell, Bearish CMF Value Detected, "
+        "The CMF value is in the negative range, indicating that selling pressure has been more dominant over the defined period. "
+        "Historically, a negative CMF often suggests a bearish sentiment in the market. Action: Consider potential short positions, exiting current longs, or adopting defensive strategies. Monitoring resistance levels and other technical indicators can be beneficial.",
+        "Neutral, CMF Value Near Zero, "
+        "The CMF value is near zero, indicating a balance between buying and selling pressures, which can signify market indecision or equilibrium over the defined period. "
+        "Action: Adopt a wait-and-see approach, and monitor the asset for potential breakout or breakdown patterns. Corroborating with other technical indicators can provide a clearer market outlook.",
+    ),
+    'CMF_Zero_Crossover_Desc': (
+        "Buy, Bullish Zero-Line Crossover Detected, "
+        "The Chaikin Money Flow (CMF) has crossed above the zero line, typically suggesting increased buying pressure. "
+        "Historically, this crossover can be a bullish signal indicating potential upward momentum in the asset's price. Action: Consider buying, especially if supported by other bullish indicators and market news.",
+        "Sell, Bearish Zero-Line Crossover Detected, "
+        "The CMF has crossed below the zero line, often indicating increased selling pressure or potential bearish momentum in the market. "
+        "Historically, this crossover can be a bearish signal, suggesting a potential decline in the asset's price. Action: Consider selling, hedging, or reducing long positions, especially if the bearish view is confirmed by other technical indicators.",
+        "Neutral, CMF Near Zero Line, "
+        "The CMF is hovering around the zero line, suggesting equilibrium between buying and selling pressures. "
+        "Action: Monitor for potential shifts in momentum, and corroborate with other technical indicators for a clearer market perspective.",
+    ),
+    'CMF_SMA_Comparison_Desc': (
+        "Buy, Bullish Trend Relative to SMA50 Detected, "
+        "The Chaikin Money Flow (CMF) is above the SMA50, suggesting that the asset's short-term momentum is outpacing its medium-term trend. "
+        "Historically, this configuration can indicate bullish momentum. Action: Reinforce or enter long positions but set a stop-loss near key support levels.",
+        "Sell, Bearish Trend Relative to SMA50 Detected, "
+        "The CMF is below the SMA50, indicating that the asset's short-term momentum is weaker than its medium-term trend. "
+        "Historically, this can be a sign of bearish momentum. Action: Exercise caution with long positions. Consider hedging, shorting, or reducing exposure if other indicators align bearishly.",
+        "Neutral, CMF and SMA50 Alignment, "
+        "The CMF is aligning with the SMA50, suggesting a balance between short-term and medium-term momentum. "
+        "Action: Adopt a wait-and-see approach. Monitor for potential breakout or breakdown signals and corroborate with other technical indicators.",
+    ),
+    'CMF_Overbought_Oversold_Desc': (
+        "Sell, Overbought CMF Detected, "
+        "The CMF has reached overbought levels, indicating that the asset might be trading at a premium relative to its intrinsic value. "
+        "Historically, assets in this state might experience pullbacks. Action: Tighten stop-loss orders, consider taking profits, or reducing long positions. Always validate with other technical indicators.",
+        "Buy, Oversold CMF Detected, "
+        "The CMF has entered the oversold territory, suggesting the asset might be undervalued. "
+        "Historically, this can be a buying opportunity, especially if the fundamentals of the asset are strong. Action: Look for potential buying opportunities but ensure confirmation from other indicators and fundamental analysis.",
+        "Neutral, CMF in Normal Range, "
+        "The CMF is neither in an overbought nor oversold state, indicating balanced buying and selling pressures. "
+        "Action: Monitor for potential shifts in momentum, and corroborate with other technical indicators for a clearer market perspective.",
+    ),
+    'CMF_Divergence_Desc': (
+        "Buy, Bullish Divergence Detected, "
+        "The Chaikin Money Flow (CMF) shows a bullish divergence when compared to the asset's price. This suggests that while the price is making new lows, the CMF isn't, indicating potential weakening of the bearish momentum. "
+        "Historically, this can precede an upward price movement. Action: Consider potential long positions, but always ensure confirmation from other technical indicators and set a stop-loss.",
+        "Sell, Bearish Divergence Detected, "
+        "The CMF displays a bearish divergence relative to the asset's price. This implies that even though the price is achieving new highs, the CMF isn't, hinting at a possible decrease in bullish momentum. "
+        "Historically, this might foreshadow a downward price movement. Action: Exercise caution with long positions, consider taking profits, and set a tighter stop-loss. It's crucial to confirm this with other technical indicators.",
+        "Neutral, No Significant Divergence, "
+        "The CMF and the asset's price are moving without showing significant divergence, indicating a lack of clear bullish or bearish bias. "
+        "Action: Maintain vigilance, and monitor for future divergences as they can be potent signals.",
+    ),
+    'MACD_Crossover_Desc': (
+        "Buy, Bullish Crossover Detected, "
+        "The MACD line has crossed above the Signal line, indicating a potential change in momentum from bearish to bullish. "
+        "Historically, when this crossover occurs after an extended downtrend, it's often interpreted as the early stages of a bullish phase. Action: Consider this as a buying opportunity, but always confirm with other technical indicators and set a stop-loss to protect your position.",
+        "Sell, Bearish Crossover Detected, "
+        "The MACD line has crossed below the Signal line, suggesting the potential onset of bearish momentum. "
+        "Historically, such a crossover might foreshadow a decline in the asset's price. Action: Consider this as a warning to possibly reduce your holdings, or even open a short position, but always validate with other technical indicators and set a stop-loss.",
+        "Neutral, No Crossover Detected, "
+        "Currently, there's no significant crossover between the MACD line and the Signal line, suggesting that the asset is moving without a clear bullish or bearish bias. "
+        "Historically, this can be an indication of a period of consolidation or continuation of the current trend. Action: Monitor the asset and wait for clearer signals.",
+    ),
+    'MACD_Zero_Line_Desc': (
+        "Buy, MACD in Bullish Territory, "
+        "The MACD is currently positioned above the zero line. This usually indicates that the asset's short-term momentum is outpacing its long-term momentum. "
+        "Historically, when MACD remains above the zero line for extended periods, it can signal a sustained bullish phase. Action: Consider this as an opportunity to buy or maintain long positions, but always corroborate with other technical and fundamental indicators.",
+        "Sell, MACD in Bearish Territory, "
+        "The MACD is currently below the zero line, suggesting that the asset's short-term momentum is weaker than its long-term momentum. "
+        "Historically, a MACD position below the zero line can indicate bearish trends or potential downturns. Action: Consider this as a warning to possibly reduce holdings, or even open a short position, but always confirm with other technical indicators and market news.",
+        "Neutral, MACD Near Zero Line, "
+        "The MACD is oscillating around the zero line, indicating a balance between the asset's short-term and long-term momentum. "
+        "This can suggest a period of market consolidation or a lack of strong momentum in either direction. Action: Monitor the asset for potential breakout patterns or other technical signals.",
+    ),
+    'MACD_Divergence_Desc': (
+        "Buy, Bullish MACD Divergence Detected, "
+        "Currently, the asset's price is making new lows while the MACD is not showing the same decline. This discrepancy often suggests potential weakness in the prevailing bearish trend. "
+        "Historically, this kind of divergence has been associated with potential bullish reversals. Action: Consider this as a potential buying opportunity, especially if supported by other bullish indicators, but ensure to set a tight stop-loss.",
+        "Sell, Bearish MACD Divergence Detected, "
+        "The asset's price is reaching new highs, but the MACD isn't following suit, indicating a potential decline in bullish momentum. "
+        "Historically, this pattern has been a precursor to potential bearish reversals. Action: Exercise caution with current long positions, consider taking profits, and set a trailing stop. It's essential to confirm this divergence with other technical indicators before making decisions.",
+        "Neutral, No MACD Divergence, "
+        "The MACD and the asset's price are moving in tandem, indicating a consistent trend without any detected divergence. "
+        "This usually suggests that the current trend, whether bullish or bearish, might continue. Action: Monitor the asset for changes in momentum or other confirming technical signals.",
+    ),
+    'MACD_Histogram_Desc': (
+        "Buy, Bullish MACD Histogram Detected, "
+        "The MACD histogram is currently positive, indicating that the MACD line is above the Signal line. This is a sign of strong bullish momentum. "
+        "Historically, a positive MACD histogram has been associated with upward trends in the asset's price. Action: Consider holding or even increasing long positions, but remain vigilant for potential signs of a reversal.",
+        "Sell, Bearish MACD Histogram Detected, "
+        "The MACD histogram is currently negative, signaling that the MACD line is below the Signal line. This suggests dominant bearish momentum. "
+        "Historically, a negative MACD histogram has often been an indication of downward trends in the asset's price. Action: It might be a good time to reassess current positions, think about hedging, or even reducing exposure to the asset.",
+        "Neutral, Balanced MACD Histogram, "
+        "The MACD histogram is hovering near zero, which indicates a balance or equilibrium between bullish and bearish forces. "
+        "In such scenarios, the asset's price often moves in a sideways pattern without clear direction. Action: It's advisable to monitor the asset closely, looking for breakout signals or other technical patterns to gauge future movements.",
+    ),
+    'MACD_Histogram_Reversal_Desc': (
+        "Buy, Bullish MACD Histogram Reversal Detected, "
+        "The MACD histogram has recently shifted from negative to positive. This transition is typically viewed as an early sign of potential bullish momentum reversal. "
+        "Historically, such transitions in the MACD histogram have been precursors to upward trends in the asset's price. Action: Be prepared to capitalize on potential uptrends, but always corroborate with other technical indicators before committing to a buying decision.",
+        "Sell, Bearish MACD Histogram Reversal Detected, "
+        "The MACD histogram has transitioned from positive to negative. This shift is often seen as an early indication of a potential bearish momentum reversal. "
+        "Historically, a transition like this in the MACD histogram has signaled downward trends in the asset's price. Action: It might be prudent to consider taking protective measures, such as hedging or even selling the asset.",
+        "Neutral, No MACD Histogram Reversal Observed, "
+        "Currently, the MACD histogram hasn't shown any significant reversal from its previous trend. "
+        "Without a clear reversal signal, the asset might continue its current trend, whether it's bullish or bearish. Action: It's advisable to continue monitoring the asset and await clearer signals or patterns before making any trading decisions.",
+    ),
+    'MACD_Trend_Desc': (
+        "Buy, Bullish MACD Trend Detected, "
+        "The MACD line is currently trending upwards, which is often interpreted as increasing bullish momentum. "
+        "Historically, an upward-trending MACD line has been indicative of sustained price increases in the asset. Action: It's advisable to consider staying invested or looking for entry points, while also being vigilant for potential trend reversals.",
+        "Sell, Bearish MACD Trend Detected, "
+        "The MACD line is trending downwards, suggesting a dominant bearish momentum. "
+        "Historically, a downward-trending MACD line has been a sign of prolonged price declines. Action: Adopt a defensive stance, consider reducing exposure to the asset, or even contemplate shorting opportunities.",
+        "Neutral, No MACD Trend Observed, "
+        "The MACD line is currently moving sideways or is relatively flat, indicating a potential consolidation phase or a lack of strong momentum in either the bullish or bearish direction. "
+        "Action: It might be wise to adopt a wait-and-see approach, monitoring the asset for potential breakout patterns or signals.",
+    ),
+    'OBV_Value_Desc': (
+        "Buy, Bullish OBV Value Detected, "
+        "The OBV is currently increasing, suggesting that volume is favoring upward price movement. "
+        "Historically, an increasing OBV has been indicative of potential upward price momentum. Action: Consider potential long positions or holding onto current ones.",
+        "Sell, Bearish OBV Value Detected, "
+        "The OBV is currently decreasing, indicating that volume is favoring downward price movement. "
+        "Historically, a decreasing OBV often signals potential downward price momentum. Action: Consider potential short positions or taking profits.",
+        "Neutral, Stable OBV Value, "
+        "The OBV is relatively stable, suggesting a balance between buying and selling pressures. "
+        "Action: Maintain a balanced approach and monitor the asset for potential signals.",
+    ),
+    'OBV_Trend_Desc': (
+        "Buy, Bullish OBV Trend Detected, "
+        "OBV is above its SMA, suggesting positive volume momentum. "
+        "Historically, when OBV is above its SMA, it indicates a potential bullish sentiment. Action: Consider buying opportunities or holding current longs.",
+        "Sell, Bearish OBV Trend Detected, "
+        "OBV is below its SMA, indicating negative volume momentum. "
+        "Historically, when OBV is below its SMA, it suggests a potential bearish sentiment. Action: Consider selling opportunities or reducing exposure.",
+        "Neutral, OBV Trending Sideways, "
+        "OBV is around its SMA, indicating no clear trend. "
+        "Action: It might be wise to adopt a wait-and-see approach, monitoring the asset for potential breakout or breakdown patterns.",
+    ),
+    'OBV_RoC_Desc': (
+        "Buy, Significant OBV Surge Detected, "
+        "The rate of change in OBV indicates a strong surge in buying momentum. "
+        "Historically, such surges often correlate with bullish market movements. Action: Consider buying opportunities, but remain vigilant for potential overbought conditions.",
+        "Sell, Significant OBV Plunge Detected, "
+        "The rate of change in OBV indicates a strong plunge, suggesting dominant selling momentum. "
+        "Such plunges typically correlate with bearish market phases. Action: Consider selling or shorting opportunities, and be cautious of potential oversold conditions.",
+        "Neutral, Stable OBV Momentum, "
+        "The rate of change in OBV is moderate, indicating neither strong buying nor selling momentum. "
+        "Action: Maintain current positions and monitor for emerging trends.",
+    ),
+    'OBV_Divergence_Desc': (
+        "Buy, Bullish OBV Divergence Detected, "
+        "While the price is recording new lows, OBV isn't, suggesting potential bullish momentum. "
+        "Historically, bullish divergence is a potential sign of a market turnaround. Action: Consider buying opportunities but validate with other signals before making a decision.",
+        "Sell, Bearish OBV Divergence Detected, "
+        "While the price is achieving new highs, OBV isn't keeping pace, suggesting potential bearish momentum. "
+        "Historically, bearish divergence can be an early warning of a price drop. Action: Consider selling or taking profits.",
+        "Neutral, No OBV Divergence Observed, "
+        "There's no significant divergence between OBV and price, suggesting the current trend might persist. "
+        "Action: Monitor other indicators and the broader market conditions.",
+    ),
+    'OBV_RSI_14_Desc': (
+        "Buy, Bullish OBV and RSI Detected, "
+        "OBV is trending upward and RSI is in the oversold territory, suggesting potential bullish momentum. "
+        "Historically, this combination indicates a strong bullish sentiment. Action: Consider buying opportunities and monitor other indicators for confirmation.",
+        "Sell, Bearish OBV and RSI Detected, "
+        "OBV is trending downward and RSI is in the overbought zone, suggesting potential bearish momentum. "
+        "This combination typically hints at potential selling opportunities. Action: Consider taking profits or shorting opportunities.",
+        "Neutral, No Clear Signals from OBV and RSI, "
+        "Neither OBV nor RSI are providing strong buy or sell signals. "
+        "Action: Adopt a wait-and-see approach and monitor other technical signals.",
+    ),
+    'OBV_Stoch_Desc': (
+        "Buy, Bullish OBV and Stoch Detected, "
+        "OBV is trending upward and Stochastics indicate a potential upward momentum. "
+        "This combination suggests a bullish market outlook. Action: Consider potential long positions and always cross-check with other technical patterns.",
+        "Sell, Bearish OBV and Stoch Detected, "
+        "OBV is on a decline and Stochastics indicate potential downward momentum. "
+        "This combination suggests a bearish market phase. Action: Consider potential selling or shorting opportunities.",
+        "Neutral, No Clear Signals from OBV and Stoch, "
+        "OBV and Stochastics are not providing significant bullish or bearish indications. "
+        "Action: Maintain current positions and monitor the market for emerging trends.",
+    ),
+}
+
+# One categorical dtype per rule so every column built from the same rule
+# (e.g. RSI_9/14/25) shares a single copy of its texts.
+DESCRIPTION_DTYPES = {
+    rule: pd.CategoricalDtype(texts) for rule, texts in DESCRIPTION_TEXTS.items()
+}
+
+
+def _signal_of(text):
+    if text.startswith("Buy"):
+        return 1
+    if text.startswith("Sell"):
+        return -1
+    return 0
+
+
+# +1 (Buy), -1 (Sell) or 0 (Neutral) for every text of a rule, indexed by the
+# same category codes the description columns store.
+DESCRIPTION_SIGNALS = {
+    rule: np.array([_signal_of(text) for text in texts], dtype=np.int8)
+    for rule, texts in DESCRIPTION_TEXTS.items()
+}
+
+
+class DescriptionView:
+    """
+    Read-only view of the *_Desc columns of a calculated frame. The columns
+    hold category codes; text is looked up only for the rows read, so the
+    latest descriptions cost one lookup per column whatever the history
+    length. ``history`` gives the text of every row for the Excel export.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.columns = [column for column in df.columns if column.endswith('_Desc')]
+
+    def row(self, position=-1):
+        return {column: self.df[column].iloc[position] for column in self.columns}
+
+    def latest(self):
+        return self.row(-1)
+
+    def history(self):
+        return pd.DataFrame({column: self.df[column].astype(object) for column in self.columns},
+                            index=self.df.index)
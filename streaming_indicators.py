@@ -0,0 +1,324 @@
+# Streaming counterpart of DataCalculator.
+#
+# The indicators here take one bar at a time and return the value and flag
+# columns DataCalculator would produce for that bar, without building a
+# DataFrame per update. Values are rounded like the batch calculate_* methods
+# and the flags are evaluated on the rounded values, so replaying a history
+# reproduces the batch columns.
+import math
+from collections import deque
+
+from app_config import DIVERGENCE_LOOKBACK, SWING_WINDOW
+from indicator_state import (CMFState, MACDState, OBVState, RSIState,
+                             SMAState, StochasticState)
+
+
+def _round(value):
+    # Same steps as np.round(value, 2): scale, round half to even, unscale
+    if not math.isfinite(value):
+        return value
+    return round(value * 100) / 100
+
+
+def _crossed_above(value, level, previous_value, previous_level):
+    return value > level and previous_value <= previous_level
+
+
+def _crossed_below(value, level, previous_value, previous_level):
+    return value < level and previous_value >= previous_level
+
+
+def _pct_change(value, previous_value):
+    if previous_value == 0:
+        return math.nan if value == 0 else math.copysign(math.inf, value)
+    return value / previous_value - 1
+
+
+class StreamingDivergence:
+    """
+    Per-bar counterpart of divergence.divergence_flags: ``update`` takes a
+    bar's low and high price and oscillator value and returns the bullish and
+    bearish flags for that bar. A swing is confirmed ``window`` bars after it
+    happens, so only the last 2 * window + 1 bars and the previous swing low
+    and high are kept.
+    """
+
+    def __init__(self, window=SWING_WINDOW, lookback=DIVERGENCE_LOOKBACK):
+        self.window = window
+        self.lookback = lookback
+        self.position = -1
+        # Missing low and high prices seen so far; swings across one never pair
+        self.segments = [0, 0]
+        self.bars = deque(maxlen=2 * window + 1)
+        # (position, price, oscillator, segment) of the last swing low and high
+        self.swings = [None, None]
+
+    def _swing(self, side, low):
+        # Flag for the middle bar of the buffer being a swing on ``side``
+        prices = [bar[side] for bar in self.bars]
+        price = prices[self.window]
+        if any(math.isnan(value) for value in prices) or price != (min(prices) if low else max(prices)):
+            return False
+        oscillator, segment = self.bars[self.window][2], self.bars[self.window][3][side]
+        position = self.position - self.window
+        previous, self.swings[side] = self.swings[side], (position, price, oscillator, segment)
+        if previous is None or position - previous[0] > self.lookback or segment != previous[3]:
+            return False
+        if low:
+            return price < previous[1] and oscillator > previous[2]
+        return price > previous[1] and oscillator < previous[2]
+
+    def update(self, low, high, oscillator):
+        self.position += 1
+        for side, price in enumerate((low, high)):
+            self.segments[side] += math.isnan(price)
+        self.bars.append((low, high, oscillator, tuple(self.segments)))
+        if len(self.bars) < self.bars.maxlen:
+            return False, False
+        return self._swing(0, low=True), self._swing(1, low=False)
+
+
+class StreamingIndicator:
+    """
+    Base class: ``update(bar, values)`` takes one bar (a mapping with Close,
+    High, Low and T.Shares) and the columns already computed for that bar by
+    the indicators updated before this one, and returns this indicator's
+    columns. ``previous`` keeps the columns of the last bar for the flags.
+    """
+
+    def __init__(self):
+        self.previous = {}
+
+    def _previous(self, column):
+        return self.previous.get(column, math.nan)
+
+    def update(self, bar, values):
+        raise NotImplementedError
+
+
+class StreamingSMA(StreamingIndicator):
+    def __init__(self, sma_period=10):
+        super().__init__()
+        self.states = {'SMA': SMAState(sma_period), 'SMA10': SMAState(10),
+                       'SMA50': SMAState(50), 'SMA200': SMAState(200)}
+
+    def update(self, bar, values):
+        close = bar['Close']
+        row = {column: _round(state.update(close))
+               for column, state in self.states.items()}
+        sma10, sma50, sma200 = row['SMA10'], row['SMA50'], row['SMA200']
+        previous_close = self._previous('Close')
+        previous_sma10 = self._previous('SMA10')
+        previous_sma50 = self._previous('SMA50')
+        previous_sma200 = self._previous('SMA200')
+
+        row['Golden_Cross'] = _crossed_above(
+            sma50, sma200, previous_sma50, previous_sma200)
+        row['Death_Cross'] = _crossed_below(
+            sma50, sma200, previous_sma50, previous_sma200)
+        for column in ['SMA10', 'SMA50', 'SMA200']:
+            row[f'Price_Cross_{column}_Up'] = _crossed_above(
+                close, row[column], previous_close, self._previous(column))
+            row[f'Price_Cross_{column}_Down'] = _crossed_below(
+                close, row[column], previous_close, self._previous(column))
+        row['SMA10_Cross_SMA200_Up'] = _crossed_above(
+            sma10, sma200, previous_sma10, previous_sma200)
+        row['SMA10_Cross_SMA200_Down'] = _crossed_below(
+            sma10, sma200, previous_sma10, previous_sma200)
+        row['SMA10_Up'] = sma10 - previous_sma10 > 0
+        row['SMA50_Up'] = sma50 - previous_sma50 > 0
+        row['SMA200_Up'] = sma200 - previous_sma200 > 0
+        for column in ['SMA10', 'SMA50', 'SMA200']:
+            row[f'Price_Distance_{column}'] = _round(close - row[column])
+        row['SMA50_Above_SMA200'] = sma50 > sma200
+        row['SMA10_Above_SMA50'] = sma10 > sma50
+
+        self.previous = {'Close': close, 'SMA10': sma10,
+                         'SMA50': sma50, 'SMA200': sma200}
+        return row
+
+
+class StreamingRSI(StreamingIndicator):
+    def __init__(self, period=14):
+        super().__init__()
+        self.column = f'RSI_{period}'
+        self.state = RSIState(period)
+        self.divergence = StreamingDivergence()
+
+    def update(self, bar, values):
+        column, close = self.column, bar['Close']
+        rsi = _round(self.state.update(close))
+        previous_rsi = self._previous(column)
+        bullish, bearish = self.divergence.update(close, close, rsi)
+
+        row = {column: rsi,
+               f'{column}_Overbought_Flag': rsi > 70,
+               f'{column}_Oversold_Flag': rsi < 30,
+               f'{column}_Neutral_Flag': 30 <= rsi <= 70,
+               f'{column}_Bearish_Divergence_Flag': bearish,
+               f'{column}_Bullish_Divergence_Flag': bullish,
+               f'{column}_Swing_Failure_Buy_Flag': rsi > 30 and previous_rsi < 30,
+               f'{column}_Swing_Failure_Sell_Flag': rsi < 70 and previous_rsi > 70}
+
+        self.previous = {column: rsi}
+        return row
+
+
+class StreamingStochastic(StreamingIndicator):
+    def __init__(self, k_period=9, d_period=6):
+        super().__init__()
+        self.k_column = f'STOCHk_{k_period}_{d_period}_3'
+        self.d_column = f'STOCHd_{k_period}_{d_period}_3'
+        self.stoch_id = f'STOCH_{k_period}_{d_period}_3'
+        self.state = StochasticState(k_period, d_period, 3)
+        self.divergence = StreamingDivergence()
+
+    def update(self, bar, values):
+        high, low, close = bar['High'], bar['Low'], bar['Close']
+        stoch_k, stoch_d = (_round(value)
+                            for value in self.state.update(high, low, close))
+        previous_k = self._previous(self.k_column)
+        previous_d = self._previous(self.d_column)
+        bullish, bearish = self.divergence.update(low, high, stoch_k)
+        stoch_id = self.stoch_id
+
+        row = {self.k_column: stoch_k,
+               self.d_column: stoch_d,
+               f'{stoch_id}_Overbought_Flag': stoch_k > 80,
+               f'{stoch_id}_Oversold_Flag': stoch_k < 20,
+               f'{stoch_id}_Bullish_Crossover_Flag': _crossed_above(stoch_k, stoch_d, previous_k, previous_d),
+               f'{stoch_id}_Bearish_Crossover_Flag': _crossed_below(stoch_k, stoch_d, previous_k, previous_d),
+               f'{stoch_id}_Bullish_Divergence_Flag': bullish,
+               f'{stoch_id}_Bearish_Divergence_Flag': bearish,
+               f'{stoch_id}_Midpoint_Cross_Up_Flag': _crossed_above(stoch_k, 50, previous_k, 50),
+               f'{stoch_id}_Midpoint_Cross_Down_Flag': _crossed_below(stoch_k, 50, previous_k, 50)}
+
+        self.previous = {self.k_column: stoch_k, self.d_column: stoch_d}
+        return row
+
+
+class StreamingCMF(StreamingIndicator):
+    # Compares against SMA50, so it must be updated after StreamingSMA
+    def __init__(self, window=20):
+        super().__init__()
+        self.column = f'CMF_{window}'
+        self.state = CMFState(window)
+        self.divergence = StreamingDivergence()
+
+    def update(self, bar, values):
+        high, low, close = bar['High'], bar['Low'], bar['Close']
+        cmf = _round(self.state.update(high, low, close, bar['T.Shares']))
+        previous_cmf = self._previous(self.column)
+        bullish, bearish = self.divergence.update(low, high, cmf)
+        sma50 = values['SMA50']
+
+        row = {self.column: cmf,
+               'CMF_Positive_Flag': cmf > 0,
+               'CMF_Negative_Flag': cmf < 0,
+               'CMF_Neutral_Flag': cmf == 0,
+               'CMF_Zero_Crossover_Up_Flag': _crossed_above(cmf, 0, previous_cmf, 0),
+               'CMF_Zero_Crossover_Down_Flag': _crossed_below(cmf, 0, previous_cmf, 0),
+               'CMF_Above_SMA50_Flag': cmf > sma50,
+               'CMF_Below_SMA50_Flag': cmf < sma50,
+               'CMF_Overbought_Flag': cmf > 0.25,
+               'CMF_Oversold_Flag': cmf < -0.25,
+               'CMF_Bullish_Divergence_Flag': bullish,
+               'CMF_Bearish_Divergence_Flag': bearish}
+
+        self.previous = {self.column: cmf}
+        return row
+
+
+class StreamingMACD(StreamingIndicator):
+    def __init__(self, short_period=12, long_period=26, signal_period=9):
+        super().__init__()
+        self.state = MACDState(short_period, long_period, signal_period)
+        self.divergence = StreamingDivergence()
+
+    def update(self, bar, values):
+        close = bar['Close']
+        macd, signal, histogram = (_round(value)
+                                   for value in self.state.update(close))
+        previous_histogram = self._previous('MACDh_12_26_9')
+        bullish, bearish = self.divergence.update(close, close, macd)
+
+        row = {'MACD_12_26_9': macd,
+               'MACDs_12_26_9': signal,
+               'MACDh_12_26_9': histogram,
+               'MACD_Bullish_Crossover_Flag': macd > signal,
+               'MACD_Bearish_Crossover_Flag': macd < signal,
+               'MACD_Above_Zero_Flag': macd > 0,
+               'MACD_Below_Zero_Flag': macd < 0,
+               'MACD_Bullish_Divergence_Flag': bullish,
+               'MACD_Bearish_Divergence_Flag': bearish,
+               'MACD_Histogram_Positive_Flag': histogram > 0,
+               'MACD_Histogram_Negative_Flag': histogram < 0,
+               'MACD_Histogram_Reversal_Positive_Flag': histogram > 0 and previous_histogram < 0,
+               'MACD_Histogram_Reversal_Negative_Flag': histogram < 0 and previous_histogram > 0,
+               'MACD_Trending_Up_Flag': macd > self._previous('MACD_12_26_9'),
+               'MACD_Trending_Down_Flag': macd < self._previous('MACD_12_26_9')}
+
+        self.previous = {'MACD_12_26_9': macd, 'MACDh_12_26_9': histogram}
+        return row
+
+
+class StreamingOBV(StreamingIndicator):
+    # Reads RSI_14 and STOCHk_9_6_3, so it must be updated after those
+    def __init__(self, sma_window=20):
+        super().__init__()
+        self.state = OBVState(sma_window)
+        self.divergence = StreamingDivergence()
+
+    def update(self, bar, values):
+        close = bar['Close']
+        obv, obv_sma = self.state.update(close, bar['T.Shares'])
+        previous_obv = self._previous('OBV')
+        obv_change = obv - previous_obv
+        bullish, bearish = self.divergence.update(close, close, obv)
+        roc = _pct_change(obv, previous_obv)
+        rsi, stoch_k = values['RSI_14'], values['STOCHk_9_6_3']
+
+        row = {'OBV': obv,
+               'OBV_SMA': obv_sma,
+               'OBV_Increasing_Flag': obv_change > 0,
+               'OBV_Decreasing_Flag': obv_change < 0,
+               'OBV_above_SMA_Flag': obv > obv_sma,
+               'OBV_below_SMA_Flag': obv < obv_sma,
+               'OBV_RoC': roc,
+               'OBV_Surge_Flag': roc > 0.05,
+               'OBV_Plunge_Flag': roc < -0.05,
+               'OBV_Price_Bullish_Divergence_Flag': bullish,
+               'OBV_Price_Bearish_Divergence_Flag': bearish,
+               'OBV_RSI_Bullish_Flag': obv_change > 0 and rsi < 30,
+               'OBV_RSI_Bearish_Flag': obv_change < 0 and rsi > 70,
+               'OBV_Stoch_Bullish_Flag': obv_change > 0 and stoch_k < 20,
+               'OBV_Stoch_Bearish_Flag': obv_change < 0 and stoch_k > 80}
+
+        self.previous = {'OBV': obv}
+        return row
+
+
+class StreamingCalculator:
+    """
+    Every DataCalculator indicator with its default parameters, updated in
+    dependency order. ``update`` returns the value and flag columns for one
+    bar; ``replay`` does the same for each bar of an iterable.
+    """
+
+    def __init__(self, sma_period=10):
+        self.indicators = [StreamingSMA(sma_period),
+                           StreamingRSI(9), StreamingRSI(14), StreamingRSI(25),
+                           StreamingStochastic(9, 6),
+                           StreamingCMF(20),
+                           StreamingMACD(12, 26, 9),
+                           StreamingOBV(20)]
+
+    def update(self, bar):
+        values = {}
+        for indicator in self.indicators:
+            values.update(indicator.update(bar, values))
+        return values
+
+    def replay(self, bars):
+        for bar in bars:
+            yield self.update(bar)
@@ -0,0 +1,268 @@
+# Parameter sweeps over the indicator settings DataCalculator accepts.
+#
+# For every ticker, each indicator family is evaluated over a grid of
+# parameter combinations. The values of all combinations are computed side by
+# side in wide frames with one column per combination, sharing what the
+# combinations have in common:
+# - the rolling lows and highs of every stochastic length come from one
+#   running minimum and maximum;
+# - every EMA span is computed once for all MACD combinations;
+# - each smoothing step is one kernel call over all columns.
+# The flags and signal counts are then computed once over all combinations
+# stacked in one long frame, as PanelCalculator does for tickers. Each
+# combination's net signal (its buy minus sell count) is scored with the
+# backtester and with forward-return statistics. Tickers fan out over a
+# process pool.
+#
+# Window sums stay on the kernels rather than shared cumulative sums, which
+# round differently (see indicator_kernels), so every combination's signals
+# are exactly what DataCalculator gives for the same parameters.
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from app_config import SWEEP_ENTRY_THRESHOLD, SWEEP_EXIT_THRESHOLD, SWEEP_FORWARD_HORIZON
+from backtester import simulate
+from data_calculator import DataCalculator
+from LoggerFunction import Logger
+from panel_calculator import kernels
+from screener import RAW_FILE_PREFIX, cached_tickers, load_raw_frame
+
+# family: {parameter: values}, the parameters being the keyword arguments of
+# the family's calculate_* method. sma_period only sets the SMA column, which
+# no flag reads, so it is not swept.
+DEFAULT_GRID = {
+    'RSI': {'period': list(range(5, 31))},
+    'Stochastic': {'k_period': list(range(5, 22)), 'd_period': list(range(2, 10))},
+    'CMF': {'window': list(range(5, 41))},
+    'MACD': {'short_period': [6, 8, 10, 12, 14, 16],
+             'long_period': [20, 23, 26, 29, 32, 35, 38],
+             'signal_period': [5, 7, 9, 11, 13]},
+}
+
+
+def combinations(parameters):
+    """
+    Every combination of ``{parameter: values}`` as a list of dicts.
+    """
+    names = list(parameters)
+    return [dict(zip(names, values)) for values in itertools.product(*parameters.values())]
+
+
+def rolling_extremes(values, lengths, maximum=False):
+    """
+    ``{length: rolling minimum (or maximum)}`` of ``values`` for every length,
+    all from one running extreme: the window of a length is the window one
+    bar shorter plus one older bar. Equal to ``rolling(length).min()``.
+    """
+    values = np.asarray(values, dtype=float)
+    combine = np.maximum if maximum else np.minimum
+    extreme = values.copy()
+    extremes = {}
+    for length in range(1, max(lengths) + 1):
+        if length > 1:
+            older = np.full(len(values), np.nan)
+            older[length - 1:] = values[:len(values) - length + 1]
+            extreme = combine(extreme, older)
+        if length in lengths:
+            extremes[length] = extreme
+    return extremes
+
+
+def _rsi_values(df, parameters):
+    close = df['Close']
+    return {'RSI_14': pd.DataFrame({i: kernels.rsi(close, combination['period']).to_numpy()
+                                    for i, combination in enumerate(parameters)}).round(2)}
+
+
+def _stochastic_values(df, parameters):
+    high, low, close = (df[column].to_numpy(dtype=float) for column in ['High', 'Low', 'Close'])
+    k_periods = sorted({combination['k_period'] for combination in parameters})
+    lowest = rolling_extremes(low, k_periods)
+    highest = rolling_extremes(high, k_periods, maximum=True)
+    # Same steps as the stoch kernel, for all k periods at once
+    raw = {}
+    for k in k_periods:
+        value_range = highest[k] - lowest[k]
+        value_range = value_range + sys.float_info.epsilon * (value_range == 0).any()
+        raw[k] = 100 * (close - lowest[k]) / value_range
+    stoch_k = kernels.sma(pd.DataFrame(raw), 3)
+    stoch_d = {d: kernels.sma(stoch_k, d)
+               for d in sorted({combination['d_period'] for combination in parameters})}
+    return {'STOCHk_9_6_3': pd.DataFrame({i: stoch_k[combination['k_period']].to_numpy()
+                                          for i, combination in enumerate(parameters)}).round(2),
+            'STOCHd_9_6_3': pd.DataFrame({i: stoch_d[combination['d_period']][combination['k_period']].to_numpy()
+                                          for i, combination in enumerate(parameters)}).round(2)}
+
+
+def _cmf_values(df, parameters):
+    # Same steps as DataCalculator.add_cmf_values; only the window sums differ
+    # between combinations
+    delta = (df['High'] - df['Low']).replace({0: 0.0001})
+    money_flow = ((df['Close'] - df['Low']) - (df['High'] - df['Close'])) / delta * df['T.Shares']
+    cmf = pd.DataFrame({i: (money_flow.rolling(window=combination['window']).sum() /
+                            df['T.Shares'].rolling(window=combination['window']).sum()).to_numpy()
+                        for i, combination in enumerate(parameters)}).round(2)
+    return {'CMF_20': cmf, 'SMA50': kernels.sma(df['Close'], 50).round(2)}
+
+
+def _macd_values(df, parameters):
+    close = df['Close']
+    spans = sorted({combination['short_period'] for combination in parameters} | {combination['long_period'] for combination in parameters})
+    emas = {span: kernels.ema(close, span).to_numpy() for span in spans}
+    pairs = sorted({(combination['short_period'], combination['long_period']) for combination in parameters})
+    macd = pd.DataFrame({pair: emas[pair[0]] - emas[pair[1]] for pair in pairs})
+    # One signal line call per signal period covers every fast/slow pair
+    signal = {period: kernels.ema(macd, period)
+              for period in sorted({combination['signal_period'] for combination in parameters})}
+    values = {'MACD_12_26_9': {}, 'MACDs_12_26_9': {}, 'MACDh_12_26_9': {}}
+    for i, combination in enumerate(parameters):
+        pair = (combination['short_period'], combination['long_period'])
+        macd_line = macd[pair].to_numpy()
+        signal_line = signal[combination['signal_period']][pair].to_numpy()
+        values['MACD_12_26_9'][i] = macd_line
+        values['MACDs_12_26_9'][i] = signal_line
+        values['MACDh_12_26_9'][i] = macd_line - signal_line
+    return {column: pd.DataFrame(columns).round(2) for column, columns in values.items()}
+
+
+# family: (values function, DataCalculator interpretation method, the prefix
+# of its signal counts). The values use the column names of the default
+# parameters, which the interpretation methods read.
+SWEEP_FAMILIES = {
+    'RSI': (_rsi_values, lambda calculator, df: calculator.add_rsi_interpretations(df, 14), 'RSI_14'),
+    'Stochastic': (_stochastic_values, lambda calculator, df: calculator.add_stochastic_interpretations(df),
+                   'STOCH_9_6_3'),
+    'CMF': (_cmf_values, lambda calculator, df: calculator.add_cmf_interpretations(df), 'CMF'),
+    'MACD': (_macd_values, lambda calculator, df: calculator.add_macd_interpretations(df), 'MACD'),
+}
+
+
+def net_signals(df, family, parameters, data_calculator=None):
+    """
+    Wide frame (bars x combinations) of the net signal, buy minus sell count,
+    of ``family`` for each of ``parameters`` (a list of keyword argument
+    dicts of the family's calculate_* method).
+    """
+    values_function, interpret, prefix = SWEEP_FAMILIES[family]
+    calculator = data_calculator or DataCalculator()
+    values = values_function(df, parameters)
+
+    # Stack the combinations with one NaN row in front of each, so the
+    # shift/diff based flags never look back into another combination
+    count, length = len(parameters), len(df)
+
+    def stack(data):
+        data = np.asarray(data, dtype=float).reshape(length, -1)
+        data = np.vstack([np.full((1, data.shape[1]), np.nan), data])
+        if data.shape[1] == 1:
+            data = np.tile(data, (1, count))
+        return data.ravel(order='F')
+
+    long_df = pd.DataFrame({column: stack(df[column]) for column in ['Close', 'High', 'Low']})
+    for column, wide in values.items():
+        long_df[column] = stack(wide)
+    long_df = interpret(calculator, long_df)
+    net = (long_df[f'{prefix}_Buy_Count'] - long_df[f'{prefix}_Sell_Count']).to_numpy()
+    return pd.DataFrame(net.reshape(count, length + 1).T[1:], index=df.index)
+
+
+def forward_returns(close, score, horizon=SWEEP_FORWARD_HORIZON, entry_threshold=SWEEP_ENTRY_THRESHOLD):
+    """
+    Per column of the wide ``close`` and ``score`` frames: the number of
+    bars whose score reaches ``entry_threshold``, and the mean and hit rate
+    of the return over the ``horizon`` bars after them.
+    """
+    prices = close.to_numpy(dtype=float)
+    forward = np.full(prices.shape, np.nan)
+    forward[:len(prices) - horizon] = prices[horizon:] / prices[:len(prices) - horizon] - 1
+    signals = (np.asarray(score, dtype=float) >= entry_threshold) & ~np.isnan(forward)
+    counts = signals.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return pd.DataFrame({'Signals': counts,
+                             'Forward_Return': np.where(signals, forward, 0).sum(axis=0) / counts,
+                             'Forward_Hit_Rate': (signals & (forward > 0)).sum(axis=0) / counts})
+
+
+def sweep_ticker(df, grid=DEFAULT_GRID, data_calculator=None, horizon=SWEEP_FORWARD_HORIZON,
+                 entry_threshold=SWEEP_ENTRY_THRESHOLD, exit_threshold=SWEEP_EXIT_THRESHOLD, **rules):
+    """
+    Score every combination of ``grid`` on the price frame ``df``. ``rules``
+    are further keyword arguments of backtester.simulate. Returns one row
+    per family and combination with its parameters, backtest summary and
+    forward-return statistics.
+    """
+    calculator = data_calculator or DataCalculator()
+    df = df.reset_index(drop=True)
+    results = []
+    for family, family_grid in grid.items():
+        parameters = combinations(family_grid)
+        if family == 'MACD':
+            parameters = [combination for combination in parameters if combination['short_period'] < combination['long_period']]
+        if not parameters:
+            continue
+        score = net_signals(df, family, parameters, calculator)
+        close = pd.DataFrame(np.tile(df['Close'].to_numpy(dtype=float)[:, None], (1, len(parameters))))
+        summary, _ = simulate(close, score, entry_threshold=entry_threshold,
+                              exit_threshold=exit_threshold, **rules)
+        result = pd.concat([pd.DataFrame(parameters),
+                            summary.drop(columns=['Ticker', 'Bars', 'Buy_Hold_Return']),
+                            forward_returns(close, score, horizon, entry_threshold)], axis=1)
+        result.insert(0, 'Indicator', family)
+        results.append(result)
+    return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
+
+def _sweep_file(ticker, directory, grid, settings):
+    # Runs in a worker process; sweeps one cached ticker
+    try:
+        result = sweep_ticker(load_raw_frame(ticker, directory), grid, **settings)
+    except Exception as e:
+        Logger().log_or_print(
+            f"Sweep: could not sweep {ticker}: {str(e)}", level="WARNING", module="Sweep")
+        return pd.DataFrame()
+    result.insert(0, 'Ticker', ticker)
+    return result
+
+
+def sweep_universe(tickers=None, directory=None, workers=None, grid=DEFAULT_GRID, **settings):
+    """
+    Sweep every cached ticker (or ``tickers``) across ``workers`` processes.
+    ``settings`` are the keyword arguments of sweep_ticker. Returns the rows
+    of all tickers, best total return first within each ticker and family.
+    """
+    logger = Logger()
+    directory = directory or os.getcwd()
+    tickers = list(tickers) if tickers is not None else cached_tickers(directory)
+    if not tickers:
+        logger.log_or_print(
+            f"Sweep: no {RAW_FILE_PREFIX}*.csv files in {directory}.", level="WARNING", module="Sweep")
+        return pd.DataFrame()
+
+    workers = workers or os.cpu_count() or 1
+    arguments = (tickers, [directory] * len(tickers), [grid] * len(tickers), [settings] * len(tickers))
+    if workers == 1:
+        results = list(map(_sweep_file, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_sweep_file, *arguments))
+
+    table = pd.concat(results, ignore_index=True)
+    if table.empty:
+        return table
+    table = table.sort_values(by=['Ticker', 'Indicator', 'Total_Return'], ascending=[True, True, False],
+                              kind='stable').reset_index(drop=True)
+    logger.log_or_print(
+        f"Sweep: scored {len(table)} combinations over {table['Ticker'].nunique()} tickers.",
+        level="INFO", module="Sweep")
+    return table
+
+
+if __name__ == "__main__":
+    table = sweep_universe(directory=sys.argv[1] if len(sys.argv) > 1 else None)
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(table.groupby(['Ticker', 'Indicator']).head(1).to_string(index=False))
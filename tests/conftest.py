@@ -0,0 +1,18 @@
+# The modules live at the top level of the repository, the test helpers here
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from portal_server import start_portal_server  # noqa: E402
+
+
+@pytest.fixture
+def portal():
+    server, base_url = start_portal_server()
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
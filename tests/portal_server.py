@@ -0,0 +1,75 @@
+# Stand-in for the ISX portal serving the recorded pages in portal_pages.
+#
+# The company profile page holds the filter form; submitting it, or following
+# a page link of the trading history table, returns history_<page>.html for
+# the page number in the d-16544-p parameter.
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'portal_pages')
+PROFILE_PATH = '/isxportal/portal/companyprofilecontainer.html'
+PAGE_PARAMETER = 'd-16544-p'
+
+
+class PortalHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.started.append(time.monotonic())
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            self.send_page()
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def send_page(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path.endswith('companyprofilecontainer.html'):
+            name = 'profile.html'
+        elif url.path.endswith('companytradinghistory.html'):
+            name = f"history_{query.get(PAGE_PARAMETER, ['1'])[0]}.html"
+        else:
+            name = None
+        path = os.path.join(PAGES_DIR, name) if name else None
+        if path is None or not os.path.exists(path):
+            self.send_error(404)
+            return
+        with open(path, 'rb') as page:
+            data = page.read()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_portal_server():
+    """
+    A running stand-in server and the profile page address to use as
+    BASE_URL. ``server.requests`` lists the paths requested and
+    ``server.started`` the times they arrived; ``server.max_in_flight`` is
+    the most requests served at once. Every response waits ``server.delay``
+    seconds.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PortalHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.started = []
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.delay = 0.0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}{PROFILE_PATH}'
@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+from app_config import EDGE_DRIVER_PATH
+from async_fetcher import AsyncFetcher, AsyncHostLimiter, AsyncPortalClient
+from data_fetcher import DataFetcher
+
+
+def test_client_keeps_to_the_host_limits(portal):
+    server, base_url = portal
+    server.delay = 0.1
+
+    async def fetch_all():
+        async with AsyncPortalClient(host_concurrency=2, min_interval=0.05) as client:
+            return await asyncio.gather(*(client.request(base_url) for _ in range(8)))
+
+    pages = asyncio.run(fetch_all())
+    assert len(pages) == 8
+    assert server.max_in_flight == 2
+
+
+def test_host_limiter_spaces_and_bounds_the_requests():
+    # Timed on the loop itself: the server sees the requests after their
+    # connections are set up, which varies
+    limiter = AsyncHostLimiter(max_concurrent=2, min_interval=0.05)
+    started = []
+    in_flight = [0, 0]
+
+    async def request(url):
+        async with limiter.request(url):
+            started.append((url, time.monotonic()))
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.1)
+            in_flight[0] -= 1
+
+    async def fetch_all():
+        # Two hosts, limited apart from each other
+        await asyncio.gather(*(request(f'http://host{i % 2}/page') for i in range(8)))
+
+    asyncio.run(fetch_all())
+    assert in_flight[1] == 4
+    for host in ['http://host0/page', 'http://host1/page']:
+        times = [moment for url, moment in started if url == host]
+        assert len(times) == 4
+        # Less a little for the loop's timer resolution
+        assert min(later - earlier for earlier, later in zip(times, times[1:])) >= 0.045
+
+
+def test_async_fetch_matches_the_http_fetch(portal, tmp_path, monkeypatch):
+    server, base_url = portal
+    monkeypatch.chdir(tmp_path)
+    fetcher = DataFetcher(EDGE_DRIVER_PATH, backend='http', base_url=base_url)
+    expected = fetcher.fetch_data('TEST', 100)
+    (tmp_path / 'raw_TEST.csv').unlink()
+
+    results = dict(AsyncFetcher(fetcher).fetch(['TEST'], 100))
+    assert list(results) == ['TEST']
+    assert results['TEST'].reset_index(drop=True).equals(expected.reset_index(drop=True))
+
+
+def test_async_refresh_of_a_short_history_reads_one_page(portal, tmp_path, monkeypatch):
+    server, base_url = portal
+    monkeypatch.chdir(tmp_path)
+    fetcher = DataFetcher(EDGE_DRIVER_PATH, backend='http', base_url=base_url)
+    first = dict(AsyncFetcher(fetcher).fetch(['TEST'], 100))['TEST']
+    assert (tmp_path / 'raw_TEST.start').exists()
+    requests = len(server.requests)
+
+    refreshed = dict(AsyncFetcher(fetcher).fetch(['TEST'], 100))['TEST']
+    # The profile page, and the filter form returning the first table page
+    assert len(server.requests) - requests == 2
+    assert refreshed.reset_index(drop=True).equals(first.reset_index(drop=True))
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app_config import BACKTEST_COST
+from backtester import holding_mask, simulate
+
+CLOSE = [10.0, 10.0, 11.0, 12.0, 12.0, 13.0, 13.0]
+
+
+def frame(values):
+    return pd.DataFrame({'TEST': values})
+
+
+def test_one_trade_pays_the_cost_on_each_side():
+    # Entry signal at bar 1 and exit signal at bar 4; with a lag of one bar
+    # they execute at the closes of bars 2 and 5
+    score = [0, 3, 3, 0, -3, 0, 0]
+    dates = frame(pd.bdate_range('2024-01-01', periods=len(CLOSE)))
+    summary, trades = simulate(frame(CLOSE), frame(score), dates, entry_threshold=2, exit_threshold=-2,
+                               holding_period=None, execution_lag=1)
+
+    assert len(trades) == 1
+    trade = trades.iloc[0]
+    # Held over the returns of bars 3 to 5: 11 -> 12 -> 12 -> 13
+    assert trade['Bars'] == 3
+    assert trade['Entry_Date'] == dates['TEST'][3]
+    assert trade['Exit_Date'] == dates['TEST'][5]
+    assert trade['Closed']
+    assert trade['Return'] == pytest.approx((12 / 11 - BACKTEST_COST) * (13 / 12 - BACKTEST_COST) - 1)
+    assert summary['Trades'].tolist() == [1]
+    assert summary['Exposure'].iloc[0] == pytest.approx(3 / 7)
+    assert summary['Total_Return'].iloc[0] == pytest.approx(trade['Return'])
+    assert summary['Buy_Hold_Return'].iloc[0] == pytest.approx(0.3)
+
+
+def test_execution_lag_delays_the_position():
+    score = [0, 3, 3, 0, -3, 0, 0]
+    _, trades = simulate(frame(CLOSE), frame(score), entry_threshold=2, exit_threshold=-2,
+                         holding_period=None, execution_lag=0, cost=0.0)
+    # Executed at the signal bars' closes: held over bars 2 to 4
+    assert trades['Bars'].tolist() == [3]
+    assert trades['Return'].iloc[0] == pytest.approx(12 / 10 - 1)
+
+
+def test_holding_period_cuts_the_position_off():
+    held = holding_mask(np.array([[3], [0], [0], [0], [0], [3], [0], [0]]), entry_threshold=2,
+                        exit_threshold=-2, holding_period=3)
+    assert held[:, 0].tolist() == [True, True, True, False, False, True, True, True]
+    # Without a holding period the position waits for the exit threshold
+    held = holding_mask(np.array([[3], [0], [0], [0], [-3]]), entry_threshold=2,
+                        exit_threshold=-2, holding_period=None)
+    assert held[:, 0].tolist() == [True, True, True, True, False]
+
+
+def test_no_entries_make_no_trades():
+    summary, trades = simulate(frame(CLOSE), frame([0] * len(CLOSE)), entry_threshold=2, exit_threshold=-2)
+    assert trades.empty
+    assert summary['Trades'].tolist() == [0]
+    assert summary['Total_Return'].tolist() == [0.0]
+    assert summary['Exposure'].tolist() == [0.0]
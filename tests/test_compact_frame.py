@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from compact_frame import PACKED_FLAGS_PREFIX, compact_frame, expand_frame, is_compact
+from data_calculator import DataCalculator
+from test_data_calculator import price_frame
+
+
+def test_compact_frame_expands_to_the_original():
+    df = price_frame(260)
+    calculated = DataCalculator().calculate_all(df.copy())
+    compact = compact_frame(calculated, keep=df.columns)
+
+    assert is_compact(compact)
+    flags = [column for column in calculated.columns if calculated[column].dtype == bool]
+    packed = [column for column in compact.columns if column.startswith(PACKED_FLAGS_PREFIX)]
+    # Eight flags to a byte
+    assert len(packed) == -(-len(flags) // 8)
+    assert all(compact[column].dtype == np.uint8 for column in packed)
+    assert compact.memory_usage(deep=True).sum() < calculated.memory_usage(deep=True).sum()
+
+    pd.testing.assert_frame_equal(expand_frame(compact), calculated)
+    # Row slices expand too
+    pd.testing.assert_frame_equal(expand_frame(compact.iloc[-20:]), calculated.iloc[-20:])
+
+
+def test_columns_that_cannot_be_compacted_are_kept():
+    df = pd.DataFrame({'Precise': [0.123456, 1.5], 'Large': [1000, 2], 'Flag': [True, False]})
+    compact = compact_frame(df)
+    assert compact['Precise'].dtype == np.float64
+    assert compact['Large'].dtype == np.int64
+    pd.testing.assert_frame_equal(expand_frame(compact), df)
@@ -0,0 +1,52 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from data_calculator import DataCalculator
+
+
+def price_frame(rows=120, seed=0):
+    rng = np.random.default_rng(seed)
+    close = np.round(5 + np.cumsum(rng.normal(0, 0.05, rows)), 2)
+    return pd.DataFrame({
+        'Date': pd.bdate_range('2024-01-01', periods=rows),
+        'Close': close,
+        'Open': np.round(close + rng.normal(0, 0.02, rows), 2),
+        'High': np.round(close + 0.05, 2),
+        'Low': np.round(close - 0.05, 2),
+        'T.Shares': rng.integers(1000, 100000, rows),
+    })
+
+
+def test_data_calculator_pickles():
+    calculator = DataCalculator()
+    calculator.calculate_blocks(price_frame())
+    # The scheduler made by calculate_blocks stays out of the pickle
+    copy = pickle.loads(pickle.dumps(calculator))
+    assert pickle.dumps(DataCalculator())
+    blocks = copy.calculate_blocks(price_frame())
+    expected = calculator.calculate_blocks(price_frame())
+    assert blocks.keys() == expected.keys()
+    for node in blocks:
+        pd.testing.assert_frame_equal(blocks[node], expected[node])
+
+
+def test_extended_calculations_match_a_full_recompute():
+    df = price_frame(242)
+    calculator = DataCalculator()
+    calculator.remember_calculations('TEST', calculator.calculate_all(df.iloc[:230].copy()))
+    # One new trading day per fetch, as a daily refresh brings them
+    for rows in range(231, len(df) + 1):
+        extended = calculator.extend_calculations('TEST', df.iloc[:rows])
+        expected = DataCalculator().calculate_all(df.iloc[:rows].copy())
+        pd.testing.assert_frame_equal(extended, expected)
+
+
+def test_changed_history_is_not_extended():
+    df = price_frame(240)
+    calculator = DataCalculator()
+    calculator.remember_calculations('TEST', calculator.calculate_all(df.iloc[:230].copy()))
+    changed = df.copy()
+    changed.loc[100, 'Close'] += 0.01
+    assert calculator.extend_calculations('TEST', changed) is None
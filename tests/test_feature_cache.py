@@ -0,0 +1,67 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from feature_cache import FeatureCache
+
+
+def frame():
+    return pd.DataFrame({'Close': np.arange(10, dtype=float), 'Low': np.arange(10, dtype=float) - 1})
+
+
+def test_features_are_computed_once_per_column_array():
+    cache = FeatureCache()
+    df = frame()
+    shifted = cache.shift(df, 'Close')
+    pd.testing.assert_series_equal(shifted, df['Close'].shift(1))
+    assert cache.shift(df, 'Close') is shifted
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Other periods, operations and columns are separate entries
+    pd.testing.assert_series_equal(cache.diff(df, 'Close'), df['Close'].diff())
+    pd.testing.assert_series_equal(cache.shift(df, 'Close', 2), df['Close'].shift(2))
+    pd.testing.assert_series_equal(cache.shift(df, 'Low'), df['Low'].shift(1))
+    assert (cache.hits, cache.misses) == (1, 4)
+    # And so are other frames with the same values
+    assert cache.shift(frame(), 'Close') is not shifted
+
+
+def test_assigning_a_column_invalidates_its_features():
+    cache = FeatureCache()
+    df = frame()
+    diff = cache.diff(df, 'Close')
+    low_diff = cache.diff(df, 'Low')
+    df['Close'] = df['Close'] * 2
+    pd.testing.assert_series_equal(cache.diff(df, 'Close'), df['Close'].diff())
+    assert cache.diff(df, 'Close') is not diff
+    assert cache.diff(df, 'Low') is low_diff
+
+
+def test_clear_drops_features_after_an_in_place_write():
+    cache = FeatureCache()
+    df = frame()
+    cache.diff(df, 'Close')
+    df['Close'].values[:] = 1.0
+    cache.clear()
+    assert cache.diff(df, 'Close').fillna(0).eq(0).all()
+
+
+def test_threads_share_the_cache():
+    cache = FeatureCache()
+    frames = [frame() for _ in range(4)]
+    barrier = threading.Barrier(8)
+
+    def work():
+        barrier.wait()
+        for _ in range(200):
+            for df in frames:
+                cache.shift(df, 'Close')
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.hits + cache.misses == 8 * 200 * len(frames)
+    assert cache.misses >= len(frames)
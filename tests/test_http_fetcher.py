@@ -0,0 +1,109 @@
+import glob
+import os
+import threading
+
+import pandas as pd
+
+from app_config import EDGE_DRIVER_PATH
+from data_fetcher import DataFetcher, parse_history_table
+from http_fetcher import HttpTableSource
+from portal_server import PAGES_DIR
+
+
+def recorded_rows():
+    # The rows of every recorded table page, in page order
+    rows = []
+    for page in range(1, len(glob.glob(os.path.join(PAGES_DIR, 'history_*.html'))) + 1):
+        with open(os.path.join(PAGES_DIR, f'history_{page}.html')) as html:
+            rows += parse_history_table(html.read())
+    return rows
+
+
+def test_pages_until_the_end_of_the_history(portal):
+    server, base_url = portal
+    source = HttpTableSource(base_url=base_url)
+    source.open('TEST')
+    tables = [source.table_html()]
+    while source.next_page():
+        tables.append(source.table_html())
+    # The last page has no next link
+    assert len(tables) == 3
+    assert source.next_page() is False
+    assert [row for table in tables for row in parse_history_table(table)] == recorded_rows()
+    # The filter form was submitted with the history's from date
+    assert 'fromDate=1%2F1%2F2010' in server.requests[1]
+
+
+def test_fetch_data_matches_the_recorded_table(portal, tmp_path, monkeypatch):
+    server, base_url = portal
+    monkeypatch.chdir(tmp_path)
+    fetcher = DataFetcher(EDGE_DRIVER_PATH, backend='http', base_url=base_url)
+    df = fetcher.fetch_data('TEST', 15)
+
+    columns = list(fetcher.initialize_dataframe().columns)
+    expected = pd.DataFrame(recorded_rows(), columns=columns)
+    expected['Date'] = pd.to_datetime(expected['Date'])
+    expected = expected.sort_values('Date').tail(15).reset_index(drop=True)
+    assert list(df.columns) == columns
+    pd.testing.assert_frame_equal(df[['Date', 'Close', 'Open', 'High', 'Low', 'T.Shares', 'Volume', 'No. Trades']]
+                                  .reset_index(drop=True),
+                                  expected[['Date', 'Close', 'Open', 'High', 'Low', 'T.Shares', 'Volume', 'No. Trades']],
+                                  check_dtype=False)
+    # Two table pages hold the 15 latest sessions
+    assert sum('companytradinghistory' in path for path in server.requests) == 2
+
+    # Asking for more than the portal has reads to the last page
+    df = fetcher.fetch_data('TEST', 100)
+    assert len(df) == len(recorded_rows())
+    assert os.path.exists(tmp_path / 'raw_TEST.csv')
+
+
+def table_requests(server):
+    return sum('companytradinghistory' in path for path in server.requests)
+
+
+def test_refresh_of_a_short_history_reads_one_page(portal, tmp_path, monkeypatch):
+    server, base_url = portal
+    monkeypatch.chdir(tmp_path)
+    fetcher = DataFetcher(EDGE_DRIVER_PATH, backend='http', base_url=base_url)
+    # The portal has fewer sessions than asked for, so the first fetch reads
+    # to the last page and records where the table starts
+    first = fetcher.fetch_data('TEST', 100)
+    assert table_requests(server) == 3
+    assert (tmp_path / 'raw_TEST.start').read_text() == first['Date'].min().strftime('%Y-%m-%d')
+
+    # A refresh stops on the first page, which reaches the saved history
+    refreshed = fetcher.fetch_data('TEST', 100)
+    assert table_requests(server) == 4
+    pd.testing.assert_frame_equal(refreshed, first)
+
+    # Without the record the history is read to the end again
+    (tmp_path / 'raw_TEST.start').unlink()
+    fetcher.fetch_data('TEST', 100)
+    assert table_requests(server) == 7
+
+
+def test_concurrent_fetches_of_a_ticker_save_one_history(portal, tmp_path, monkeypatch):
+    server, base_url = portal
+    monkeypatch.chdir(tmp_path)
+    fetcher = DataFetcher(EDGE_DRIVER_PATH, backend='http', base_url=base_url)
+    history = fetcher.fetch_data('TEST', 100)
+    errors = []
+
+    def save():
+        # A pipeline fetch and a batch fetch of the same ticker finishing
+        # at the same time
+        for _ in range(20):
+            try:
+                fetcher.finish_frame('TEST', history, 100, history['Date'].min())
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['raw_TEST.csv', 'raw_TEST.start']
+    assert len(pd.read_csv(tmp_path / 'raw_TEST.csv')) == len(history)
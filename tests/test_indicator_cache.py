@@ -0,0 +1,65 @@
+import os
+import time
+
+import pytest
+
+from indicator_cache import IndicatorCache
+from test_data_calculator import price_frame
+
+pytest.importorskip('pyarrow')
+
+PARAMETERS = {'SMA': {'sma_period': 10}}
+
+
+def cache_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith('.parquet'))
+
+
+def test_key_changes_with_the_data_and_the_parameters(tmp_path):
+    cache = IndicatorCache(str(tmp_path))
+    df = price_frame(30)
+    key = cache.key(df, PARAMETERS)
+    assert cache.key(df.copy(), dict(PARAMETERS)) == key
+
+    changed = df.copy()
+    changed.loc[29, 'Close'] += 0.01
+    assert cache.key(changed, PARAMETERS) != key
+    assert cache.key(df, {'SMA': {'sma_period': 20}}) != key
+    assert cache.key(df.iloc[:29], PARAMETERS) != key
+
+
+def test_a_new_key_replaces_the_tickers_stale_file(tmp_path):
+    cache = IndicatorCache(str(tmp_path))
+    df = price_frame(30)
+    cache.store('TEST', 'old', df)
+    cache.store('TEST', 'new', df)
+    assert cache_files(tmp_path) == ['TEST_new.parquet']
+    assert cache.load('TEST', 'old') is None
+    assert cache.load('TEST', 'new').equals(df)
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    df = price_frame(30)
+    cache = IndicatorCache(str(tmp_path))
+    cache.store('A', 'key', df)
+    size = os.path.getsize(tmp_path / 'A_key.parquet')
+    cache.store('B', 'key', df)
+    now = time.time()
+    os.utime(tmp_path / 'A_key.parquet', (now - 200, now - 200))
+    os.utime(tmp_path / 'B_key.parquet', (now - 100, now - 100))
+    # Loading A makes B the least recently used file
+    assert cache.load('A', 'key') is not None
+
+    cache.max_bytes = 2 * size + size // 2
+    cache.store('C', 'key', df)
+    assert cache_files(tmp_path) == ['A_key.parquet', 'C_key.parquet']
+
+
+def test_files_past_the_maximum_age_are_evicted(tmp_path):
+    df = price_frame(30)
+    cache = IndicatorCache(str(tmp_path), max_age_days=1)
+    cache.store('A', 'key', df)
+    old = time.time() - 2 * 24 * 60 * 60
+    os.utime(tmp_path / 'A_key.parquet', (old, old))
+    cache.store('B', 'key', df)
+    assert cache_files(tmp_path) == ['B_key.parquet']
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from data_calculator import DataCalculator
+from panel_calculator import PanelCalculator
+from test_data_calculator import price_frame
+
+
+def test_panel_matches_each_ticker_on_its_own():
+    # Unequal lengths, so the stacked frame pads the shorter histories and
+    # separates every ticker with a NaN row
+    frames = {'LONG': price_frame(260, seed=1), 'MID': price_frame(120, seed=2),
+              'SHORT': price_frame(15, seed=3), 'ONE': price_frame(1, seed=4)}
+    calculated = PanelCalculator().calculate(frames)
+    assert list(calculated) == list(frames)
+    for ticker, df in frames.items():
+        expected = DataCalculator().calculate_all(df.copy())
+        pd.testing.assert_frame_equal(calculated[ticker], expected, obj=ticker)
@@ -0,0 +1,32 @@
+from data_visualizer import DataVisualizer
+from pipeline_worker import ChartWorker
+from qt_data_calculator import QtDataCalculator
+from test_data_calculator import price_frame
+
+
+def test_chart_worker_hands_its_blocks_to_the_calculator_signal():
+    df = price_frame(260)
+    calculator = QtDataCalculator()
+    blocks, figures = [], []
+    calculator.calculations_complete_signal.connect(blocks.append)
+    worker = ChartWorker(df, df, ['RSI_14', 'MACD'], ['RSI_14', 'MACD_12_26_9'], calculator, DataVisualizer())
+    worker.signals.plotted.connect(figures.append)
+    worker.run()
+
+    assert len(blocks) == 1 and list(blocks[0]) == ['RSI_14', 'MACD']
+    assert 'RSI_14' in blocks[0]['RSI_14'].columns
+    assert len(figures) == 1
+    # The fetched frame is left as it was
+    assert list(df.columns) == list(price_frame(1).columns)
+
+
+def test_cancelled_chart_worker_does_nothing():
+    df = price_frame(30)
+    calculator = QtDataCalculator()
+    blocks, finished = [], []
+    calculator.calculations_complete_signal.connect(blocks.append)
+    worker = ChartWorker(df, df, ['RSI_14'], ['RSI_14'], calculator, DataVisualizer())
+    worker.signals.finished.connect(lambda: finished.append(True))
+    worker.cancel()
+    worker.run()
+    assert blocks == [] and finished == [True]
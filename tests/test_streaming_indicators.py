@@ -0,0 +1,20 @@
+import pandas as pd
+
+from data_calculator import DataCalculator
+from streaming_indicators import StreamingCalculator
+from test_data_calculator import price_frame
+
+
+def test_replay_matches_the_batch_columns():
+    df = price_frame(260)
+    expected = DataCalculator().calculate_all(df.copy())
+    replayed = pd.DataFrame(list(StreamingCalculator().replay(
+        df[['Close', 'High', 'Low', 'T.Shares']].to_dict('records'))), index=df.index)
+
+    # Every streamed value and flag column, with the batch frame's values
+    assert set(replayed.columns) <= set(expected.columns)
+    assert any(column.endswith('_Flag') for column in replayed.columns)
+    pd.testing.assert_frame_equal(replayed, expected[replayed.columns], check_dtype=False)
+    for column in replayed.columns:
+        if expected[column].dtype == bool:
+            assert replayed[column].dtype == bool, column
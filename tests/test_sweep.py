@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from data_calculator import DataCalculator
+from sweep import net_signals, rolling_extremes
+from test_data_calculator import price_frame
+
+
+def test_rolling_extremes_match_pandas():
+    values = pd.Series(np.random.default_rng(0).normal(size=60))
+    values[10] = np.nan
+    lengths = [1, 3, 9, 14]
+    for maximum in (False, True):
+        extremes = rolling_extremes(values, lengths, maximum=maximum)
+        assert sorted(extremes) == lengths
+        for length in lengths:
+            window = values.rolling(length)
+            np.testing.assert_array_equal(extremes[length], window.max() if maximum else window.min())
+
+
+def test_stacked_combinations_match_the_calculator():
+    df = price_frame(150)
+    parameters = [{'k_period': 5, 'd_period': 3}, {'k_period': 9, 'd_period': 6}, {'k_period': 14, 'd_period': 3}]
+    net = net_signals(df, 'Stochastic', parameters)
+    assert net.shape == (len(df), len(parameters))
+    for i, combination in enumerate(parameters):
+        calculated = DataCalculator().calculate_stochastic_oscillator(df.copy(), **combination)
+        prefix = f"STOCH_{combination['k_period']}_{combination['d_period']}_3"
+        expected = calculated[f'{prefix}_Buy_Count'] - calculated[f'{prefix}_Sell_Count']
+        np.testing.assert_array_equal(net[i].to_numpy(), expected.to_numpy())
+
+    net = net_signals(df, 'RSI', [{'period': 9}, {'period': 25}])
+    for i, period in enumerate([9, 25]):
+        calculated = DataCalculator().calculate_rsi(df.copy(), periods=[period])
+        expected = calculated[f'RSI_{period}_Buy_Count'] - calculated[f'RSI_{period}_Sell_Count']
+        np.testing.assert_array_equal(net[i].to_numpy(), expected.to_numpy())
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from webdriver_pool import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self, check_delay=0.0):
+        self.check_delay = check_delay
+        self.dead = False
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        time.sleep(self.check_delay)
+        if self.dead:
+            raise WebDriverException("crashed")
+        return 'about:blank'
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_dead_driver_is_replaced():
+    pool = WebDriverPool(max_size=1, factory=FakeDriver)
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.dead = True
+    replacement = pool.acquire()
+    assert replacement is not driver
+    assert driver.quit_called
+    assert pool.size == 1
+    pool.release(replacement)
+    pool.close()
+
+
+def test_slow_health_check_does_not_block_the_pool():
+    drivers = iter([FakeDriver(check_delay=1.0), FakeDriver()])
+    pool = WebDriverPool(max_size=2, factory=lambda: next(drivers))
+    slow, fast = pool.acquire(), pool.acquire()
+    pool.release(slow)
+    # One thread checks the slow driver while the other returns the fast one
+    checking = threading.Thread(target=pool.acquire)
+    checking.start()
+    time.sleep(0.1)
+    started = time.perf_counter()
+    pool.release(fast)
+    assert time.perf_counter() - started < 0.5
+    checking.join()
+    pool.close()
+
+
+def test_timeout_covers_the_whole_wait():
+    pool = WebDriverPool(max_size=1, factory=FakeDriver)
+    held = pool.acquire()
+    stop = threading.Event()
+
+    def wake_waiters():
+        # Wake-ups that find no free driver must not restart the timeout
+        while not stop.is_set():
+            with pool.condition:
+                pool.condition.notify_all()
+            time.sleep(0.02)
+
+    waking = threading.Thread(target=wake_waiters)
+    waking.start()
+    started = time.perf_counter()
+    try:
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.3)
+    finally:
+        stop.set()
+        waking.join()
+    assert time.perf_counter() - started < 1.0
+    pool.release(held)
+    pool.close()
@@ -0,0 +1,41 @@
+from data_fetcher import WebDriverTableSource
+
+
+class FakeButton:
+    def __init__(self):
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class FakeDriver:
+    current_url = 'about:blank'
+
+    def __init__(self, buttons):
+        self.buttons = buttons
+
+    def find_elements(self, by, selector):
+        return self.buttons
+
+    def find_element(self, by, selector):
+        # The table, waited for after every page load
+        return object()
+
+
+def test_next_page_clicks_the_next_button():
+    button = FakeButton()
+    source = WebDriverTableSource()
+    source.driver = FakeDriver([button])
+    assert source.next_page() is True
+    assert button.clicks == 1
+
+
+def test_last_page_has_no_next_page(monkeypatch):
+    source = WebDriverTableSource()
+    source.driver = FakeDriver([])
+    levels = []
+    monkeypatch.setattr(source.logger, 'log_or_print', lambda msg, level="INFO", **kwargs: levels.append(level))
+    assert source.next_page() is False
+    # The end of the table is not an error
+    assert not set(levels) & {'WARNING', 'ERROR'}
@@ -0,0 +1,136 @@
+# Bounded pool of long-lived Edge WebDriver sessions.
+#
+# Starting Edge costs seconds, more than loading a ticker's pages, so the
+# WebDriver backend borrows a running driver from this pool for each fetch
+# and returns it afterwards. Drivers are started lazily up to the pool size,
+# checked on every borrow and replaced when they no longer respond, when a
+# fetch with them failed, or once they have served the maximum number of
+# fetches. Borrowers wait while every driver is in use.
+import atexit
+import threading
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.edge.service import Service
+from selenium.webdriver.edge.webdriver import WebDriver as EdgeDriver
+
+from app_config import EDGE_DRIVER_PATH, WEBDRIVER_MAX_USES, WEBDRIVER_POOL_SIZE
+from LoggerFunction import Logger
+
+
+class WebDriverPool:
+    """
+    Up to ``max_size`` drivers made by ``factory`` (Edge at ``driver_path``
+    by default), each used for at most ``max_uses`` fetches.
+    """
+
+    def __init__(self, driver_path=EDGE_DRIVER_PATH, max_size=WEBDRIVER_POOL_SIZE,
+                 max_uses=WEBDRIVER_MAX_USES, factory=None):
+        self.logger = Logger()
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.factory = factory or (lambda: EdgeDriver(service=Service(driver_path)))
+        self.condition = threading.Condition()
+        # Idle drivers, and how many fetches every live driver has served
+        self.idle = deque()
+        self.uses = {}
+        self.size = 0
+        self.closed = False
+        atexit.register(self.close)
+
+    def _alive(self, driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.log_or_print(
+                f"WebDriverPool: could not quit a driver: {str(e)}", level="WARNING", module="WebDriverPool")
+
+    def _discard(self, driver):
+        # Caller holds the condition; frees the driver's slot
+        self.uses.pop(id(driver), None)
+        self.size -= 1
+        self.condition.notify()
+
+    def acquire(self, timeout=None):
+        """
+        A healthy driver, waiting up to ``timeout`` seconds (forever by
+        default) while all of them are in use. The timeout covers the whole
+        call, however often the wait is woken or a driver fails its check.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self.condition:
+                while True:
+                    if self.closed:
+                        raise RuntimeError("WebDriverPool is closed")
+                    if self.idle:
+                        driver = self.idle.popleft()
+                        break
+                    if self.size < self.max_size:
+                        # Reserve the slot, then start the driver outside the lock
+                        self.size += 1
+                        driver = None
+                        break
+                    if deadline is None:
+                        self.condition.wait()
+                    elif not self.condition.wait(max(0.0, deadline - time.monotonic())):
+                        raise TimeoutError("No WebDriver became free in time")
+            if driver is None:
+                break
+            # The health check is a round trip to the browser, so it runs
+            # without the lock; the driver is out of the idle queue meanwhile
+            if self._alive(driver):
+                return driver
+            self.logger.log_or_print(
+                "WebDriverPool: replacing a driver that stopped responding.", level="WARNING",
+                module="WebDriverPool")
+            self._quit(driver)
+            with self.condition:
+                self._discard(driver)
+        try:
+            driver = self.factory()
+        except Exception:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver, discard=False):
+        """
+        Return a driver from acquire. ``discard`` quits it instead, for a
+        driver whose fetch failed; it is also quit after ``max_uses`` fetches.
+        """
+        with self.condition:
+            self.uses[id(driver)] = self.uses.get(id(driver), 0) + 1
+            if discard or self.closed or self.uses[id(driver)] >= self.max_uses:
+                self._discard(driver)
+            else:
+                self.idle.append(driver)
+                self.condition.notify()
+                return
+        self._quit(driver)
+
+    def close(self):
+        """
+        Quit the idle drivers; drivers in use are quit when released.
+        """
+        with self.condition:
+            self.closed = True
+            drivers = list(self.idle)
+            self.idle.clear()
+            for driver in drivers:
+                self._discard(driver)
+            self.condition.notify_all()
+        for driver in drivers:
+            self._quit(driver)